@@ -0,0 +1,139 @@
+import asyncio
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Awaitable, Callable, Optional, Union
+
+__all__ = ["benchmark", "run_benchmarks", "BenchmarkResult", "_environment"]
+
+_Timed = Union[Callable[[], Any], Callable[[], Awaitable[Any]]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Times in seconds of a single execution of the benchmarked callable."""
+
+    name: str
+    group: str
+    best: float
+    mean: float
+    stdev: float
+    number: int
+    repeat: int
+
+
+@dataclass
+class _Benchmark:
+    name: str
+    group: str
+    factory: Callable[[], _Timed]
+    is_async: bool
+
+
+_registry: list[_Benchmark] = []
+
+
+def benchmark(group: str, name: str, is_async: bool = False):
+    """
+    Register a benchmark. The decorated function builds the fixtures, which are not
+    measured, and returns the callable to be timed. When :code:`is_async` is true, the
+    callable returns an awaitable, which is awaited inside a running event loop.
+    """
+
+    def register(factory: Callable[[], _Timed]) -> Callable[[], _Timed]:
+        _registry.append(_Benchmark(name, group, factory, is_async))
+        return factory
+
+    return register
+
+
+def _timer(func: _Timed, is_async: bool) -> Callable[[int], float]:
+    if not is_async:
+
+        def time_sync(number: int) -> float:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            return time.perf_counter() - start
+
+        return time_sync
+
+    loop = asyncio.new_event_loop()
+
+    async def run_async(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()  # type: ignore[misc]
+        return time.perf_counter() - start
+
+    def time_async(number: int) -> float:
+        return loop.run_until_complete(run_async(number))
+
+    return time_async
+
+
+def _measure(bench: _Benchmark, repeat: int, min_time: float) -> BenchmarkResult:
+    timer = _timer(bench.factory(), bench.is_async)
+
+    # the number of executions of each repetition grows until it lasts min_time
+    number = 1
+    while True:
+        elapsed = timer(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed * 1.2))
+
+    times = [timer(number) / number for _ in range(repeat)]
+    return BenchmarkResult(
+        name=bench.name,
+        group=bench.group,
+        best=min(times),
+        mean=statistics.fmean(times),
+        stdev=statistics.stdev(times) if repeat > 1 else 0.0,
+        number=number,
+        repeat=repeat,
+    )
+
+
+def _gloe_version() -> str:
+    try:
+        return version("gloe")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "gloe": _gloe_version(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_benchmarks(
+    selection: Optional[str] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    report: Callable[[BenchmarkResult], Any] = lambda result: None,
+) -> dict[str, Any]:
+    """
+    Run the registered benchmarks whose group or name contains the selection.
+
+    Returns:
+        A JSON-serializable document with the environment and the results.
+    """
+    results = []
+    for bench in _registry:
+        full_name = f"{bench.group}/{bench.name}"
+        if selection is not None and selection not in full_name:
+            continue
+        result = _measure(bench, repeat, min_time)
+        report(result)
+        results.append(asdict(result))
+
+    return {"environment": _environment(), "results": results}
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from gloe import async_transformer, condition, ensure, transformer
+
+__all__ = [
+    "increment",
+    "to_items",
+    "async_increment",
+    "async_sleep",
+    "sleep",
+    "ensured_increment",
+    "plain_increment",
+    "is_even",
+    "fail",
+]
+
+
+def plain_increment(num: int) -> int:
+    return num + 1
+
+
+@transformer
+def increment(num: int) -> int:
+    return num + 1
+
+
+@transformer
+def to_items(num: int) -> list[int]:
+    return [num] * 10
+
+
+@async_transformer
+async def async_increment(num: int) -> int:
+    return num + 1
+
+
+@transformer
+def sleep(num: int) -> int:
+    # simulates a short blocking I/O call
+    time.sleep(0.001)
+    return num
+
+
+@async_transformer
+async def async_sleep(num: int) -> int:
+    await asyncio.sleep(0.001)
+    return num
+
+
+@condition
+def is_even(num: int) -> bool:
+    return num % 2 == 0
+
+
+@transformer
+def fail(num: int) -> int:
+    raise ValueError(num)
+
+
+def _is_int(num: int):
+    if not isinstance(num, int):
+        raise TypeError(num)
+
+
+def _has_increased(incoming: int, outcome: int):
+    if outcome <= incoming:
+        raise ValueError(outcome)
+
+
+@ensure(incoming=[_is_int], changes=[_has_increased])
+@transformer
+def ensured_increment(num: int) -> int:
+    return num + 1
@@ -0,0 +1,42 @@
+from gloe.collection import Map, MapAsync
+
+from benchmarks._harness import benchmark
+from benchmarks._workload import async_increment, async_sleep, increment
+
+ITEMS = 1000
+IO_ITEMS = 100
+
+
+@benchmark("collections", f"map[{ITEMS}]")
+def map_items():
+    mapping = Map(increment >> increment)
+    items = list(range(ITEMS))
+    return lambda: mapping(items)
+
+
+@benchmark("collections", f"map_batch[{ITEMS}]")
+def map_batch():
+    pipeline = increment >> increment
+    items = list(range(ITEMS))
+    return lambda: pipeline.map_batch(items)
+
+
+@benchmark("collections", f"map_async[{ITEMS}]", is_async=True)
+def map_async_items():
+    mapping = MapAsync(async_increment >> increment)
+    items = list(range(ITEMS))
+    return lambda: mapping(items)
+
+
+@benchmark("collections", f"map_async_io[{IO_ITEMS}]", is_async=True)
+def map_async_io():
+    mapping = MapAsync(async_sleep)
+    items = list(range(IO_ITEMS))
+    return lambda: mapping(items)
+
+
+@benchmark("collections", f"map_async_io_concurrent[{IO_ITEMS}]", is_async=True)
+def map_async_io_concurrent():
+    mapping = MapAsync(async_sleep, concurrency=IO_ITEMS)
+    items = list(range(IO_ITEMS))
+    return lambda: mapping(items)
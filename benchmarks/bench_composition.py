@@ -0,0 +1,44 @@
+from gloe import BaseTransformer
+from gloe.collection import Map
+
+from benchmarks._harness import benchmark
+from benchmarks._workload import increment, is_even, to_items
+
+CHAIN_SIZES = [10, 100, 1000]
+
+
+def _chain(size: int):
+    pipeline = increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> increment
+    return pipeline
+
+
+def _register_composition(size: int):
+    @benchmark("composition", f"compose_chain[{size}]")
+    def compose_chain():
+        return lambda: _chain(size)
+
+
+for _size in CHAIN_SIZES:
+    _register_composition(_size)
+
+
+def _build_graph(pipeline: BaseTransformer):
+    # the graphs are cached by the transformers, so the cache is bypassed
+    return pipeline._build_graph("")
+
+
+@benchmark("graph", "graph[chain-100]")
+def graph_chain():
+    pipeline = _chain(100)
+    return lambda: _build_graph(pipeline)
+
+
+@benchmark("graph", "graph[nested]")
+def graph_nested():
+    branch = to_items >> Map(
+        increment >> is_even.Then(increment).Else(increment >> increment)
+    )
+    pipeline = increment >> (branch, branch >> Map(increment))
+    return lambda: _build_graph(pipeline)
@@ -0,0 +1,32 @@
+from gloe import If
+
+from benchmarks._harness import benchmark
+from benchmarks._workload import increment
+
+BRANCHES = 10
+
+
+def _equals(value: int):
+    def condition(num: int) -> bool:
+        return num == value
+
+    return condition
+
+
+def _conditioner(branches: int):
+    conditioner = If(_equals(0)).Then(increment)
+    for value in range(1, branches):
+        conditioner = conditioner.ElseIf(_equals(value)).Then(increment)
+    return conditioner.Else(increment)
+
+
+@benchmark("conditional", f"first_branch[{BRANCHES}]")
+def first_branch():
+    conditioner = _conditioner(BRANCHES)
+    return lambda: conditioner(0)
+
+
+@benchmark("conditional", f"else_branch[{BRANCHES}]")
+def else_branch():
+    conditioner = _conditioner(BRANCHES)
+    return lambda: conditioner(BRANCHES)
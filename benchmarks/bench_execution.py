@@ -0,0 +1,116 @@
+from functools import reduce
+
+from gloe import production
+from gloe.utils import debug, forward
+
+from benchmarks._harness import benchmark
+from benchmarks._workload import (
+    ensured_increment,
+    fail,
+    increment,
+    plain_increment,
+)
+
+FLOW_SIZE = 10
+
+
+def _chain(size: int):
+    pipeline = increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> increment
+    return pipeline
+
+
+@benchmark("execution", f"plain_functions[{FLOW_SIZE}]")
+def plain_functions():
+    functions = [plain_increment] * FLOW_SIZE
+    return lambda: reduce(lambda data, function: function(data), functions, 0)
+
+
+@benchmark("execution", f"flow[{FLOW_SIZE}]")
+def flow():
+    pipeline = _chain(FLOW_SIZE)
+    return lambda: pipeline(0)
+
+
+@benchmark("execution", f"compiled_flow[{FLOW_SIZE}]")
+def compiled_flow():
+    pipeline = _chain(FLOW_SIZE).compile()
+    return lambda: pipeline(0)
+
+
+def _development_chain(size: int):
+    pipeline = increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> forward[int]() >> debug[int]() >> increment
+    return pipeline
+
+
+def _ensured_chain(size: int):
+    pipeline = ensured_increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> ensured_increment
+    return pipeline
+
+
+@benchmark("production", f"development_flow[{FLOW_SIZE}]")
+def development_flow():
+    pipeline = _development_chain(FLOW_SIZE).compile(production=False)
+    return lambda: pipeline(0)
+
+
+@benchmark("production", f"production_flow[{FLOW_SIZE}]")
+def production_flow():
+    pipeline = _development_chain(FLOW_SIZE).compile(production=True)
+    return lambda: pipeline(0)
+
+
+@benchmark("production", f"ensured_flow[{FLOW_SIZE}]")
+def ensured_flow():
+    pipeline = _ensured_chain(FLOW_SIZE).compile(production=True)
+    return lambda: pipeline(0)
+
+
+@benchmark("production", f"skipped_ensurers_flow[{FLOW_SIZE}]")
+def skipped_ensurers_flow():
+    with production(skip_ensurers=True):
+        pipeline = _ensured_chain(FLOW_SIZE).compile()
+    return lambda: pipeline(0)
+
+
+@benchmark("production", "exception")
+def production_exception():
+    pipeline = (increment >> increment >> fail).compile(production=True)
+    return lambda: _raise_and_catch(pipeline, 0)
+
+
+@benchmark("ensurer", "plain")
+def not_ensured():
+    return lambda: increment(0)
+
+
+@benchmark("ensurer", "incoming_and_changes")
+def ensured():
+    return lambda: ensured_increment(0)
+
+
+def _raise_and_catch(function, data):
+    try:
+        function(data)
+    except ValueError:
+        pass
+
+
+def _plain_fail(num: int) -> int:
+    raise ValueError(num)
+
+
+@benchmark("exceptions", "plain_function")
+def plain_exception():
+    return lambda: _raise_and_catch(_plain_fail, 0)
+
+
+@benchmark("exceptions", "flow")
+def flow_exception():
+    pipeline = increment >> increment >> fail
+    return lambda: _raise_and_catch(pipeline, 0)
@@ -0,0 +1,36 @@
+from gloe.gateways import parallel
+
+from benchmarks._harness import benchmark
+from benchmarks._workload import async_increment, async_sleep, increment, sleep
+
+BRANCHES = 4
+
+
+@benchmark("gateways", f"parallel_overhead[{BRANCHES}]")
+def parallel_overhead():
+    pipeline = increment >> parallel(*[increment] * BRANCHES)
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways", f"parallel_async_overhead[{BRANCHES}]", is_async=True)
+def parallel_async_overhead():
+    pipeline = async_increment >> parallel(*[async_increment] * BRANCHES)
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways", f"parallel_io[{BRANCHES}]")
+def parallel_io():
+    pipeline = increment >> parallel(*[sleep] * BRANCHES)
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways", f"parallel_threads_io[{BRANCHES}]")
+def parallel_threads_io():
+    pipeline = increment >> parallel(*[sleep] * BRANCHES, executor="threads")
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways", f"parallel_async_io[{BRANCHES}]", is_async=True)
+def parallel_async_io():
+    pipeline = async_increment >> parallel(*[async_sleep] * BRANCHES)
+    return lambda: pipeline(0)
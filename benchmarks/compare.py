@@ -0,0 +1,82 @@
+"""
+Compare two runs of the benchmarks, failing if some of them regressed.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict[str, dict]:
+    with open(path) as file:
+        document = json.load(file)
+    return {
+        f"{result['group']}/{result['name']}": result for result in document["results"]
+    }
+
+
+def _metric(result: dict) -> float:
+    # the memory benchmarks measure bytes instead of seconds
+    return result["bytes"] if "bytes" in result else result["best"]
+
+
+def _format(result: dict) -> str:
+    if "bytes" in result:
+        return f"{result['bytes'] / 1024:>9.1f} KiB"
+    return f"{result['best'] * 1e6:>9.2f} us"
+
+
+def compare(
+    baseline: dict[str, dict], current: dict[str, dict], threshold: float
+) -> list[str]:
+    """
+    Print the relative change of the best time, or of the memory, of each benchmark.
+
+    Returns:
+        The names of the benchmarks slower than the baseline by more than the
+        threshold.
+    """
+    regressions = []
+    print(f"{'benchmark':<50} {'baseline':>13} {'current':>13} {'change':>9}")
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<50} {'-':>12} {_format(result)} {'new':>9}")
+            continue
+
+        change = _metric(result) / _metric(base) - 1 if _metric(base) else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  << slower"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  >> faster"
+        print(f"{name:<50} {_format(base)} {_format(result)} {change:>+9.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", help="JSON file of the reference run")
+    parser.add_argument("current", help="JSON file of the run to be checked")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown considered a regression",
+    )
+    args = parser.parse_args(argv)
+
+    regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Measure the memory retained by the pipelines and write the results as JSON.
+
+Usage::
+
+    python -m benchmarks.memory --output memory.json
+    python -m benchmarks.compare baseline-memory.json memory.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from gloe.collection import Map
+from gloe.profiling import footprint
+
+from benchmarks._harness import _environment
+from benchmarks._workload import increment, is_even, to_items
+
+CHAIN_SIZE = 10
+
+
+def _chain(size: int):
+    pipeline = increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> increment
+    return pipeline
+
+
+def _nested():
+    branch = to_items >> Map(
+        increment >> is_even.Then(increment).Else(increment >> increment)
+    )
+    return increment >> (branch, branch >> Map(increment))
+
+
+def _retained(build: Callable[[], Any]) -> tuple[int, int, Any]:
+    """
+    Returns:
+        The memory in bytes retained by the built objects, the peak of memory during
+        the building and the built objects, which must be kept alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        built = build()
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, peak - before, built
+
+
+def _result(group: str, name: str, bytes_: int, **extra: Any) -> dict[str, Any]:
+    return {"group": group, "name": name, "bytes": bytes_, **extra}
+
+
+def run_memory_benchmarks(pipelines: int) -> dict[str, Any]:
+    results = []
+
+    retained, peak, library = _retained(
+        lambda: [_chain(CHAIN_SIZE) for _ in range(pipelines)]
+    )
+    results.append(
+        _result(
+            "composition",
+            f"chain[{CHAIN_SIZE}]",
+            retained // pipelines,
+            peak=peak // pipelines,
+            pipelines=pipelines,
+        )
+    )
+
+    retained, peak, nested_library = _retained(
+        lambda: [_nested() for _ in range(pipelines)]
+    )
+    results.append(
+        _result(
+            "composition",
+            "nested",
+            retained // pipelines,
+            peak=peak // pipelines,
+            pipelines=pipelines,
+        )
+    )
+
+    retained, peak, _ = _retained(lambda: [pipeline.graph() for pipeline in library])
+    results.append(
+        _result(
+            "graph",
+            f"graph_cache[chain-{CHAIN_SIZE}]",
+            retained // pipelines,
+            peak=peak // pipelines,
+        )
+    )
+
+    for name, pipeline in [
+        (f"chain[{CHAIN_SIZE}]", library[0]),
+        ("nested", nested_library[0]),
+    ]:
+        measured = footprint(pipeline)
+        results.append(
+            _result(
+                "footprint",
+                name,
+                measured.size,
+                nodes=measured.nodes,
+                classes=measured.classes,
+                graphs=measured.graphs,
+            )
+        )
+
+    return {"environment": _environment(), "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="JSON file of the results")
+    parser.add_argument(
+        "-n",
+        "--pipelines",
+        type=int,
+        default=1000,
+        help="number of pipelines built by each benchmark",
+    )
+    args = parser.parse_args(argv)
+
+    document = run_memory_benchmarks(args.pipelines)
+    for result in document["results"]:
+        print(
+            f"{result['group'] + '/' + result['name']:<50} "
+            f"{result['bytes'] / 1024:>10.1f} KiB",
+            file=sys.stderr,
+        )
+
+    content = json.dumps(document, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, "w") as file:
+            file.write(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Run the benchmarks and write their results as JSON.
+
+Usage::
+
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --select gateways --repeat 10
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import (  # noqa: F401
+    bench_collections,
+    bench_composition,
+    bench_conditional,
+    bench_execution,
+    bench_gateways,
+)
+from benchmarks._harness import BenchmarkResult, run_benchmarks
+
+
+def _print_result(result: BenchmarkResult):
+    print(
+        f"{result.group + '/' + result.name:<50} "
+        f"{result.best * 1e6:>12.2f} us "
+        f"(mean {result.mean * 1e6:.2f} us ± {result.stdev * 1e6:.2f})",
+        file=sys.stderr,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="JSON file of the results")
+    parser.add_argument("-s", "--select", help="only run the matching benchmarks")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum duration in seconds of each repetition",
+    )
+    args = parser.parse_args(argv)
+
+    document = run_benchmarks(args.select, args.repeat, args.min_time, _print_result)
+    content = json.dumps(document, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, "w") as file:
+            file.write(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from gloe.functional import (
     partial_transformer,
     partial_async_transformer,
     async_transformer,
+    stream_transformer,
 )
 from gloe.conditional import If, condition
 from gloe.ensurer import ensure
@@ -12,6 +13,7 @@ from gloe.transformers import Transformer, MultiArgsTransformer
 from gloe.base_transformer import BaseTransformer, PreviousTransformer
 from gloe.base_transformer import TransformerException
 from gloe.async_transformer import AsyncTransformer, MultiArgsAsyncTransformer
+from gloe._production import production, is_production
 
 __version__ = "0.7.0"
 
@@ -20,6 +22,7 @@ __all__ = [
     "partial_transformer",
     "partial_async_transformer",
     "async_transformer",
+    "stream_transformer",
     "If",
     "condition",
     "ensure",
@@ -29,6 +32,8 @@ __all__ = [
     "Transformer",
     "TransformerException",
     "AsyncTransformer",
+    "production",
+    "is_production",
 ]
 
 setattr(Transformer, "__rshift__", _compose_nodes)
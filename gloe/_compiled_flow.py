@@ -0,0 +1,79 @@
+from typing import Any, Callable, Optional, Sequence
+
+from gloe._transformer_utils import catch_transformer_exception
+from gloe.base_transformer import BaseTransformer
+from gloe.interceptors import _interceptor
+
+__all__ = ["_CompiledFlow", "_AsyncCompiledFlow"]
+
+
+class _CompiledFlow:
+    """
+    Prebuilt execution plan of a sync flow.
+
+    The bound :code:`transform` methods of the nodes are resolved once, so running the
+    plan is a plain loop over callables. The failing node is only looked up when an
+    exception is raised.
+    """
+
+    __slots__ = ("nodes", "steps")
+
+    def __init__(self, nodes: Sequence[BaseTransformer]):
+        self.nodes = tuple(nodes)
+        self.steps: tuple[Callable[[Any], Any], ...] = tuple(
+            getattr(node, "transform") for node in self.nodes
+        )
+
+    def __call__(self, data: Any) -> Any:
+        result = data
+        index = 0
+        chain = _interceptor._chain
+        try:
+            if chain is None:
+                for index, step in enumerate(self.steps):
+                    result = step(result)
+            else:
+                for index, step in enumerate(self.steps):
+                    result = chain(self.nodes[index], step, result)
+        except Exception as exception:
+            transform_exception = catch_transformer_exception(
+                exception, self.nodes[index]
+            )
+            raise transform_exception.internal_exception
+        return result
+
+
+_AsyncStep = tuple[Optional[BaseTransformer], Callable[[Any], Any]]
+
+
+class _AsyncCompiledFlow:
+    """
+    Prebuilt execution plan of an async flow.
+
+    Each step is a pair with the async node and its bound :code:`transform_async`
+    method. Consecutive sync nodes are collapsed into a single :code:`_CompiledFlow`
+    step, whose node is :code:`None` because it handles its own exceptions.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self, steps: Sequence[_AsyncStep]):
+        self.steps = tuple(steps)
+
+    async def __call__(self, data: Any) -> Any:
+        result = data
+        chain = _interceptor._async_chain
+        for node, step in self.steps:
+            if node is None:
+                result = step(result)
+                continue
+
+            try:
+                if chain is None:
+                    result = await step(result)
+                else:
+                    result = await chain(node, step, result)
+            except Exception as exception:
+                transform_exception = catch_transformer_exception(exception, node)
+                raise transform_exception.internal_exception
+        return result
@@ -1,9 +1,11 @@
 import types
 from inspect import Signature
-from typing import TypeVar, Any, Optional, Union
+from typing import TypeVar, Any, Optional, Union, cast
+
+from typing_extensions import Self
 
 from gloe.async_transformer import AsyncTransformer, MultiArgsAsyncTransformer
-from gloe.base_transformer import BaseTransformer
+from gloe.base_transformer import BaseTransformer, Flow
 from gloe.gateways._parallel import _Parallel, _ParallelAsync
 from gloe.transformers import Transformer, MultiArgsTransformer
 from gloe._typing_utils import _match_types, _specify_types
@@ -13,6 +15,9 @@ _In = TypeVar("_In")
 _Out = TypeVar("_Out")
 _NextOut = TypeVar("_NextOut")
 
+# a part of an unbuilt flow: a built flow or a pair of parts
+_FlowPart = Union[Flow, tuple[Any, Any]]
+
 
 def is_transformer(node):
     if isinstance(node, list) or isinstance(node, tuple):
@@ -35,102 +40,182 @@ def _resolve_serial_connection_signatures(
     return new_signature
 
 
-def _compose_serial(transformer1, _transformer2):
-    if len(transformer1) == 1:
-        transformer1 = transformer1.copy(regenerate_instance_id=True)
+class _Composition(BaseTransformer):
+    """
+    Common behavior of the transformers created by the composition operators.
 
-    transformer2 = _transformer2.copy(regenerate_instance_id=True)
+    The composite classes are defined once, so composing transformers does not create
+    new classes. The flow of a composite is only concatenated when it is first
+    accessed: until then, the composite keeps its two operands and the flows are
+    shared with them. Building a pipeline node by node is then linear on the number of
+    nodes, instead of quadratic.
 
-    signature1: Signature = transformer1.signature()
+    The operands are snapshotted at the composition: the composite keeps their flows,
+    or the parts of their unbuilt flows, so replacing the flow of an operand later
+    (like :code:`ensure` does) doesn't change the composite.
+    """
 
-    input_generic_vars = _match_types(transformer2.input_type, transformer1.output_type)
-    output_generic_vars = _match_types(
-        transformer1.output_type, transformer2.input_type
-    )
-    generic_vars = {**input_generic_vars, **output_generic_vars}
+    _length: int
+    _flow_parts: Optional[tuple["_FlowPart", "_FlowPart"]]
 
-    def transformer1_signature(_) -> Signature:
-        return signature1.replace(
-            return_annotation=_specify_types(signature1.return_annotation, generic_vars)
-        )
+    def __len__(self):
+        return self._length
 
-    setattr(
-        transformer1,
-        "signature",
-        types.MethodType(transformer1_signature, transformer1),
-    )
+    def _materialize(self, name: str) -> Any:
+        if name == "_flow" and self.__dict__.get("_flow_parts") is not None:
+            return self._build_flow()
+        return super()._materialize(name)
 
-    new_len = len(transformer1) + len(transformer2)
+    def _build_flow(self) -> Flow:
+        flow: Flow = []
+        stack: list[_FlowPart] = list(reversed(cast(tuple, self._flow_parts)))
+        while len(stack) > 0:
+            part = stack.pop()
+            if isinstance(part, tuple):
+                stack.extend(reversed(part))
+            else:
+                flow.extend(part)
 
-    class BaseNewTransformer:
-        def signature(self) -> Signature:
-            return _resolve_serial_connection_signatures(
-                transformer1,
-                transformer2,
-                generic_vars,
-            )
+        self._flow = flow
+        self._flow_parts = None
+        return flow
 
-        def __len__(self):
-            return new_len
+    def __copy__(self) -> Self:
+        _ = self._flow
+        return super().__copy__()
 
-    new_transformer: Optional[BaseTransformer] = None
-    if is_transformer(transformer1) and is_transformer(transformer2):
+    def __getstate__(self) -> dict[str, Any]:
+        _ = self._flow
+        return super().__getstate__()
 
-        if isinstance(transformer1, MultiArgsTransformer):
 
-            class NewMultiArgsTransformer(BaseNewTransformer, MultiArgsTransformer):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = transformer1._flow + transformer2._flow
+class _SerialComposition(_Composition):
+    _composed_signature: Signature
 
-                def transform(self, data):
-                    return None
+    def signature(self) -> Signature:
+        return self._composed_signature
 
-            new_transformer = NewMultiArgsTransformer()
 
-        else:
+class _SerialTransformer(_SerialComposition, Transformer[_In, _NextOut]):
+    def transform(self, data):
+        return None
 
-            class NewTransformer1(BaseNewTransformer, Transformer[_In, _NextOut]):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = transformer1._flow + transformer2._flow
 
-                def transform(self, data):
-                    return None
+class _SerialMultiArgsTransformer(_SerialComposition, MultiArgsTransformer):
+    def transform(self, data):
+        return None
 
-            new_transformer = NewTransformer1()
-    else:
 
-        if isinstance(transformer1, MultiArgsAsyncTransformer):
+class _SerialAsyncTransformer(_SerialComposition, AsyncTransformer[_In, _NextOut]):
+    async def transform_async(self, data):
+        return None
 
-            class NewMultiArgsAsyncTransformer(
-                BaseNewTransformer, MultiArgsAsyncTransformer
-            ):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = transformer1._flow + transformer2._flow
 
-                async def transform_async(self, data):
-                    return None
+class _SerialMultiArgsAsyncTransformer(_SerialComposition, MultiArgsAsyncTransformer):
+    async def transform_async(self, data):
+        return None
 
-            new_transformer = NewMultiArgsAsyncTransformer()
-        else:
 
-            class NewTransformer2(BaseNewTransformer, AsyncTransformer[_In, _NextOut]):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = transformer1._flow + transformer2._flow
+class _DivergingTransformer(_Composition, Transformer[_In, tuple[Any, ...]]):
+    def transform(self, data):
+        return None
+
+
+class _DivergingMultiArgsTransformer(_Composition, MultiArgsTransformer):
+    def transform(self, data):
+        return None
+
+
+class _DivergingAsyncTransformer(_Composition, AsyncTransformer[_In, tuple[Any, ...]]):
+    async def transform_async(self, data):
+        return None
+
+
+class _DivergingMultiArgsAsyncTransformer(_Composition, MultiArgsAsyncTransformer):
+    async def transform_async(self, data):
+        return None
+
+
+def _flow_snapshot(transformer: BaseTransformer) -> _FlowPart:
+    # the flow lists are never changed in place, only replaced, so keeping them is
+    # enough to isolate the composite from later changes on its operands
+    parts = transformer.__dict__.get("_flow_parts")
+    if parts is not None and "_flow" not in transformer.__dict__:
+        return parts
+    return transformer._flow
+
+
+def _new_composition(
+    composition_class: type[_Composition],
+    first: BaseTransformer,
+    last: BaseTransformer,
+    length: int,
+) -> _Composition:
+    new_transformer = composition_class()
+    del new_transformer._flow
+    new_transformer._flow_parts = (_flow_snapshot(first), _flow_snapshot(last))
+    new_transformer._length = length
+    return new_transformer
+
+
+def _compose_serial(transformer1, _transformer2):
+    if len(transformer1) == 1:
+        transformer1 = transformer1.copy(regenerate_instance_id=True)
+
+    transformer2 = _transformer2.copy(regenerate_instance_id=True)
+
+    signature1: Signature = transformer1.signature()
+
+    input_generic_vars = _match_types(transformer2.input_type, transformer1.output_type)
+    output_generic_vars = _match_types(
+        transformer1.output_type, transformer2.input_type
+    )
+    generic_vars = {**input_generic_vars, **output_generic_vars}
+
+    specialized_signature1 = signature1.replace(
+        return_annotation=_specify_types(signature1.return_annotation, generic_vars)
+    )
+
+    def transformer1_signature(_) -> Signature:
+        return specialized_signature1
 
-                async def transform_async(self, data):
-                    return None
+    # a single node is specialized on its own copy, but a composite operand is
+    # shared with the caller, so it is left unchanged
+    if len(transformer1) == 1:
+        setattr(
+            transformer1,
+            "signature",
+            types.MethodType(transformer1_signature, transformer1),
+        )
 
-            new_transformer = NewTransformer2()
+    composition_class: type[_SerialComposition]
+    if is_transformer(transformer1) and is_transformer(transformer2):
+        if isinstance(transformer1, MultiArgsTransformer):
+            composition_class = _SerialMultiArgsTransformer
+        else:
+            composition_class = _SerialTransformer
+    else:
+        if isinstance(transformer1, MultiArgsAsyncTransformer):
+            composition_class = _SerialMultiArgsAsyncTransformer
+        else:
+            composition_class = _SerialAsyncTransformer
+
+    new_transformer = cast(
+        _SerialComposition,
+        _new_composition(
+            composition_class,
+            transformer1,
+            transformer2,
+            len(transformer1) + len(transformer2),
+        ),
+    )
+    new_transformer._composed_signature = _resolve_serial_connection_signatures(
+        transformer1, transformer2, generic_vars
+    )
 
-    new_transformer.__class__.__name__ = transformer2.__class__.__name__
     new_transformer._label = transformer2.label
     new_transformer._children = transformer2.children
     new_transformer._plotting_settings = transformer2._plotting_settings
-    # new_transformer._set_previous(transformer2.previous)
     return new_transformer
 
 
@@ -147,80 +232,26 @@ def _compose_diverging(
             for receiving_transformer in receiving_transformers
         ]
     )
+    length = len(incident_transformer) + sum(len(t) for t in receiving_transformers)
 
-    class BaseNewTransformer:
-        def __len__(self):
-            lengths = [len(t) for t in receiving_transformers]
-            return sum(lengths) + len(incident_transformer)
-
-    new_transformer: Optional[BaseTransformer] = None
-
+    composition_class: type[_Composition]
+    parallel: BaseTransformer
     if is_transformer(incident_transformer) and is_transformer(receiving_transformers):
-
+        parallel = _Parallel(*receiving_transformers)
         if isinstance(incident_transformer, MultiArgsTransformer):
-
-            class NewMultiArgsTransformer(BaseNewTransformer, MultiArgsTransformer):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = incident_transformer._flow + [
-                        _Parallel(*receiving_transformers)
-                    ]
-
-                def transform(self, data):
-                    return None
-
-            new_transformer = NewMultiArgsTransformer()
+            composition_class = _DivergingMultiArgsTransformer
         else:
-
-            class NewTransformer1(
-                BaseNewTransformer, Transformer[_In, tuple[Any, ...]]
-            ):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = incident_transformer._flow + [
-                        _Parallel(*receiving_transformers)
-                    ]
-
-                def transform(self, data):
-                    return None
-
-            new_transformer = NewTransformer1()
-
+            composition_class = _DivergingTransformer
     else:
-
+        parallel = _ParallelAsync(*receiving_transformers)
         if isinstance(incident_transformer, MultiArgsAsyncTransformer):
-
-            class NewMultiArgsAsyncTransformer(
-                BaseNewTransformer, MultiArgsAsyncTransformer
-            ):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = incident_transformer._flow + [
-                        _ParallelAsync(*receiving_transformers)
-                    ]
-
-                async def transform_async(self, data):
-                    return None
-
-            new_transformer = NewMultiArgsAsyncTransformer()
+            composition_class = _DivergingMultiArgsAsyncTransformer
         else:
+            composition_class = _DivergingAsyncTransformer
 
-            class NewTransformer2(
-                BaseNewTransformer, AsyncTransformer[_In, tuple[Any, ...]]
-            ):
-                def __init__(self):
-                    super().__init__()
-                    self._flow = incident_transformer._flow + [
-                        _ParallelAsync(*receiving_transformers)
-                    ]
-
-                async def transform_async(self, data):
-                    return None
-
-            new_transformer = NewTransformer2()
-
-    # new_transformer._previous = cast(Transformer, receiving_transformers)
-    new_transformer.__class__.__name__ = "Converge"
+    new_transformer = _new_composition(
+        composition_class, incident_transformer, parallel, length
+    )
     new_transformer._label = ""
 
     return new_transformer
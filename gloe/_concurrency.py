@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Literal, Optional, Sequence, TypeVar
+
+from typing_extensions import TypeAlias
+
+__all__ = [
+    "OnError",
+    "_check_concurrency",
+    "_run_concurrently",
+    "_successful_results",
+]
+
+_T = TypeVar("_T")
+
+OnError: TypeAlias = Literal["raise", "collect"]
+
+
+def _check_concurrency(concurrency: Optional[int], on_error: OnError):
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("The concurrency must be greater than zero")
+    if on_error not in ["raise", "collect"]:
+        raise ValueError(f"Unsupported on_error value: {on_error}")
+
+
+async def _run_concurrently(
+    func: Callable[[_T], Awaitable[Any]],
+    items: Sequence[_T],
+    concurrency: Optional[int],
+    on_error: OnError,
+) -> tuple[list[Any], dict[int, Exception]]:
+    """
+    Await :code:`func` for each item with at most :code:`concurrency` items in flight.
+    When :code:`concurrency` is :code:`None`, all the items are awaited at once.
+
+    Returns the results in the order of the items and the errors of the failed items,
+    indexed by their position. The errors are only collected if :code:`on_error` is
+    :code:`"collect"`, otherwise the first one is raised and the pending items are
+    cancelled.
+    """
+    results: list[Any] = [None] * len(items)
+    errors: dict[int, Exception] = {}
+    pending = iter(enumerate(items))
+
+    async def worker():
+        for index, item in pending:
+            try:
+                results[index] = await func(item)
+            except Exception as exception:
+                if on_error == "raise":
+                    raise
+                errors[index] = exception
+
+    workers_count = len(items) if concurrency is None else min(concurrency, len(items))
+    if workers_count <= 1:
+        await worker()
+        return results, errors
+
+    # every worker pulls the next item from the same iterator, so the number of
+    # in-flight items is bounded without creating a task for each one
+    workers = [asyncio.ensure_future(worker()) for _ in range(workers_count)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    return results, errors
+
+
+def _successful_results(results: list[Any], errors: dict[int, Exception]) -> list[Any]:
+    return [result for index, result in enumerate(results) if index not in errors]
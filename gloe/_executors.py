@@ -0,0 +1,236 @@
+import asyncio
+import pickle
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextvars import copy_context
+from typing import Any, Literal, Optional, Union
+
+from typing_extensions import TypeAlias
+
+from gloe.base_transformer import Flow
+from gloe.exceptions import UnsupportedExecutorArgException
+from gloe.transformers import _execute_flow, _execute_flow_batch
+
+__all__ = [
+    "ExecutorArg",
+    "_FlowExecutor",
+    "set_default_executor",
+    "shutdown_executors",
+]
+
+ExecutorArg: TypeAlias = Union[Executor, Literal["threads", "processes"]]
+
+# maximum number of flows kept unpickled by each worker process, and kept pickled by
+# each flow executor
+_SHIPPED_FLOWS_SIZE = 32
+
+_shipped_flows: "OrderedDict[str, Flow]" = OrderedDict()
+
+
+def _load_shipped_flow(key: str, payload: bytes) -> Flow:
+    flow = _shipped_flows.get(key)
+    if flow is None:
+        flow = _shipped_flows[key] = pickle.loads(payload)
+        if len(_shipped_flows) > _SHIPPED_FLOWS_SIZE:
+            _shipped_flows.popitem(last=False)
+    else:
+        _shipped_flows.move_to_end(key)
+    return flow
+
+
+def _run_shipped_flow(key: str, payload: bytes, data: Any) -> Any:
+    return _execute_flow(_load_shipped_flow(key, payload), data)
+
+
+def _run_flow_chunk(flow: Flow, chunk: list[Any], batch: bool) -> list[Any]:
+    if batch:
+        return _execute_flow_batch(flow, chunk)
+    return [_execute_flow(flow, item) for item in chunk]
+
+
+def _run_shipped_flow_chunk(
+    key: str, payload: bytes, chunk: list[Any], batch: bool
+) -> list[Any]:
+    return _run_flow_chunk(_load_shipped_flow(key, payload), chunk, batch)
+
+
+class _FlowExecutor:
+    """
+    Submits sync flows to an executor.
+
+    When the executor is requested by its name, it is only created on the first
+    submission and it is owned by this object, until it is shut down by
+    :code:`shutdown_executors()`. Otherwise, the given executor is used as is.
+
+    Flows submitted to a process pool are pickled once and identified by a key. The
+    worker processes keep the unpickled flows, so the next submissions of the same flow
+    skip its deserialization. Both sides only keep the most recently used flows.
+    """
+
+    def __init__(self, executor: ExecutorArg, max_workers: Optional[int] = None):
+        if not isinstance(executor, Executor) and executor not in [
+            "threads",
+            "processes",
+        ]:
+            raise UnsupportedExecutorArgException(executor)
+
+        self._executor_arg = executor
+        self._max_workers = max_workers
+        self._executor: Optional[Executor] = (
+            executor if isinstance(executor, Executor) else None
+        )
+        self._lock = threading.Lock()
+        # keyed by the id of the flows, which are kept by the entries so their ids are
+        # not reused
+        self._shipped: "OrderedDict[int, tuple[Flow, str, bytes]]" = OrderedDict()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+                    _owned_executors.add(self)
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        if self._executor_arg == "processes":
+            return ProcessPoolExecutor(max_workers=self._max_workers)
+        return ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="gloe"
+        )
+
+    @property
+    def uses_processes(self) -> bool:
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+    def _ship(self, flow: Flow) -> tuple[str, bytes]:
+        with self._lock:
+            shipped = self._shipped.get(id(flow))
+            if shipped is None:
+                shipped = (flow, uuid.uuid4().hex, pickle.dumps(flow))
+                self._shipped[id(flow)] = shipped
+                if len(self._shipped) > _SHIPPED_FLOWS_SIZE:
+                    self._shipped.popitem(last=False)
+            else:
+                self._shipped.move_to_end(id(flow))
+        _, key, payload = shipped
+        return key, payload
+
+    def submit_flow(self, flow: Flow, data: Any) -> "Future[Any]":
+        if self.uses_processes:
+            key, payload = self._ship(flow)
+            return self.executor.submit(_run_shipped_flow, key, payload, data)
+
+        # the context is copied, so context variables (used by bridges, for example)
+        # are visible inside the threads
+        context = copy_context()
+        return self.executor.submit(context.run, _execute_flow, flow, data)
+
+    def submit_flow_chunk(
+        self, flow: Flow, chunk: list[Any], batch: bool = False
+    ) -> "Future[list[Any]]":
+        """
+        Submit a chunk of items, which are transformed at once when :code:`batch` is
+        :code:`True`, because some node of the flow supports batches.
+        """
+        if self.uses_processes:
+            key, payload = self._ship(flow)
+            return self.executor.submit(
+                _run_shipped_flow_chunk, key, payload, chunk, batch
+            )
+
+        context = copy_context()
+        return self.executor.submit(context.run, _run_flow_chunk, flow, chunk, batch)
+
+    async def run_flow_async(self, flow: Flow, data: Any) -> Any:
+        return await asyncio.wrap_future(self.submit_flow(flow, data))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shutdown the executor only if it was created by this object. It is created
+        again on the next submission.
+        """
+        if isinstance(self._executor_arg, Executor):
+            return
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        if not isinstance(self._executor_arg, Executor):
+            state["_executor"] = None
+        state["_shipped"] = OrderedDict()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+# the flow executors whose pools are alive, so they can be shut down together
+_owned_executors: "weakref.WeakSet[_FlowExecutor]" = weakref.WeakSet()
+
+_default_executor: Optional[_FlowExecutor] = None
+
+
+def set_default_executor(
+    executor: Optional[ExecutorArg], max_workers: Optional[int] = None
+):
+    """
+    Define where the sync branches of async parallel gateways are executed when the
+    gateway itself does not receive an :code:`executor`.
+
+    By default, these branches are executed on the event loop thread, one after the
+    other. Setting a default executor makes them run concurrently with the async
+    branches, without blocking the event loop.
+
+    Args:
+        executor (Executor | Literal["threads", "processes"] | None): the default
+            executor. If it is given by its name, a single pool is created on the first
+            execution and shared by all the async parallel gateways. Passing
+            :code:`None` restores the default behavior.
+        max_workers (int | None): maximum number of workers of the pool created when
+            the :code:`executor` is given by its name.
+    """
+    global _default_executor
+
+    previous = _default_executor
+    _default_executor = None
+    if executor is not None:
+        _default_executor = _FlowExecutor(executor, max_workers=max_workers)
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def _get_default_executor() -> Optional[_FlowExecutor]:
+    return _default_executor
+
+
+def shutdown_executors(wait: bool = True):
+    """
+    Shutdown the pools of threads and processes created by the gateways, the
+    collections and the default executor that received the executor by its name.
+
+    Each of them owns its pool, which is kept alive while the transformer exists, so
+    this function releases the workers of the transformers that will not be executed
+    for a while, like at the end of a program. The pools are created again if the
+    transformers are executed later. The executors given as objects are not affected.
+
+    Args:
+        wait (bool): if the function waits for the pending tasks to finish.
+    """
+    for flow_executor in list(_owned_executors):
+        flow_executor.shutdown(wait=wait)
@@ -0,0 +1,227 @@
+import dataclasses
+import hashlib
+import pickle
+from inspect import Signature
+from types import CodeType, FunctionType, MethodType
+from typing import Any, Optional
+
+from gloe.base_transformer import BaseTransformer
+
+__all__ = ["_fingerprint", "_transformer_fingerprint"]
+
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _update(digest: "hashlib._Hash", data: Any):
+    data_type = type(data)
+    digest.update(f"{data_type.__module__}.{data_type.__qualname__}:".encode())
+
+    if data is None or isinstance(data, (bool, int, float, complex, str)):
+        digest.update(repr(data).encode())
+    elif isinstance(data, (bytes, bytearray)):
+        digest.update(f"{len(data)}:".encode())
+        digest.update(data)
+    elif isinstance(data, (list, tuple)):
+        digest.update(f"{len(data)}:".encode())
+        for item in data:
+            _update(digest, item)
+    elif isinstance(data, (set, frozenset)):
+        # the iteration order of sets depends on the hash seed of the process
+        items = sorted(_fingerprint(item) for item in data)
+        digest.update(f"{len(items)}:{','.join(items)}".encode())
+    elif isinstance(data, dict):
+        pairs = sorted(
+            (_fingerprint(key), _fingerprint(value)) for key, value in data.items()
+        )
+        digest.update(f"{len(pairs)}:".encode())
+        for key, value in pairs:
+            digest.update(f"{key}={value},".encode())
+    elif dataclasses.is_dataclass(data) and not isinstance(data, type):
+        for field in dataclasses.fields(data):
+            digest.update(f"{field.name}=".encode())
+            _update(digest, getattr(data, field.name))
+    else:
+        digest.update(pickle.dumps(data, protocol=4))
+    digest.update(b";")
+
+
+def _fingerprint(data: Any) -> str:
+    """
+    Hash of a value that is stable across processes and restarts, unlike the builtin
+    :code:`hash()` of strings. Containers are hashed by their items, and the other
+    objects by their pickled representation.
+    """
+    digest = hashlib.sha256()
+    _update(digest, data)
+    return digest.hexdigest()
+
+
+class _UnfingerprintableState(Exception):
+    pass
+
+
+# attributes managed by gloe, which don't change what a node does
+_FRAMEWORK_ATTRIBUTES = frozenset(
+    [
+        "id",
+        "instance_id",
+        "is_atomic",
+        "_label",
+        "_already_copied",
+        "_plotting_settings",
+        "_flow",
+        "_flow_parts",
+        "_length",
+        "_children",
+        "_pending_copy",
+        "_plan",
+        "_compile_on_call",
+        "_production",
+        "_graphs",
+        "_signatures",
+        "_composed_signature",
+        "signature",
+        "transform",
+        "transform_async",
+        "_unensured",
+        "_executor",
+        "_batch_flow",
+        "_store",
+        "_in_flight",
+    ]
+)
+
+
+def _code_state(code: CodeType) -> tuple:
+    consts = tuple(
+        _code_state(const) if isinstance(const, CodeType) else const
+        for const in code.co_consts
+    )
+    return code.co_code, consts, code.co_names
+
+
+def _functions(roots: list[Any]) -> tuple[list[FunctionType], list[Any]]:
+    """
+    The functions reachable from the given ones through their closures, like the
+    function decorated by :code:`@transformer` from the method :code:`transform`, and
+    the other values of the closures, like the arguments of partial transformers.
+    """
+    functions: list[FunctionType] = []
+    values: list[Any] = []
+    pending = [getattr(root, "__func__", root) for root in roots]
+    while len(pending) > 0:
+        func = pending.pop(0)
+        if not isinstance(func, FunctionType) or func in functions:
+            continue
+        functions.append(func)
+        for cell in func.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:  # pragma: no cover
+                continue
+            contents = getattr(contents, "__func__", contents)
+            if isinstance(contents, FunctionType):
+                pending.append(contents)
+            else:
+                values.append(contents)
+    return functions, values
+
+
+def _functions_state(roots: list[Any], code: bool) -> tuple:
+    functions, values = _functions(roots)
+    names = [f"{func.__module__}.{func.__qualname__}" for func in functions]
+    codes = [_code_state(func.__code__) for func in functions] if code else []
+    return names, codes, _state(values, code)
+
+
+def _state(value: Any, code: bool) -> Any:
+    """
+    Convert a value held by a node to a value that is fingerprinted the same way in
+    every process. The transformers are replaced by their fingerprints, since their
+    ids change on every process, and the functions and classes by their names.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    if isinstance(value, BaseTransformer):
+        return "transformer", _transformer_state(value, code)
+    if isinstance(value, (FunctionType, MethodType)):
+        return "function", _functions_state([value], code)
+    if isinstance(value, type):
+        return "type", f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, Signature):
+        # it is derived from a function, which is already part of the state
+        return "signature", str(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_state(item, code) for item in value)
+    if isinstance(value, dict):
+        return {key: _state(item, code) for key, item in value.items()}
+    if dataclasses.is_dataclass(value):
+        value_type = type(value)
+        fields = {
+            field.name: _state(getattr(value, field.name), code)
+            for field in dataclasses.fields(value)
+        }
+        return f"{value_type.__module__}.{value_type.__qualname__}", fields
+
+    try:
+        return "value", _fingerprint(value)
+    except Exception as exception:
+        if not hasattr(value, "__dict__"):
+            raise _UnfingerprintableState() from exception
+
+    # objects of local classes, like the ensurers created from functions, can't be
+    # pickled, so they are identified by their class, its methods and their attributes
+    value_type = type(value)
+    methods = [
+        method
+        for method in vars(value_type).values()
+        if isinstance(method, FunctionType)
+    ]
+    return (
+        f"{value_type.__module__}.{value_type.__qualname__}",
+        _functions_state(methods, code),
+        _state(vars(value), code),
+    )
+
+
+def _node_state(node: BaseTransformer, code: bool) -> tuple:
+    node_type = type(node)
+    methods = [
+        getattr(node, name, None)
+        for name in ["transform", "transform_async", "transform_batch"]
+    ]
+    attributes = {
+        name: value
+        for name, value in node.__dict__.items()
+        if name not in _FRAMEWORK_ATTRIBUTES and not name.startswith("__")
+    }
+    return (
+        f"{node_type.__module__}.{node_type.__qualname__}",
+        _functions_state(methods, code),
+        _state(attributes, code),
+        [_transformer_state(child, code) for child in node.children],
+    )
+
+
+def _transformer_state(transformer: BaseTransformer, code: bool) -> list:
+    return [_node_state(node, code) for node in transformer._flow]
+
+
+def _transformer_fingerprint(
+    transformer: BaseTransformer, code: bool = False
+) -> Optional[str]:
+    """
+    Hash of the configuration of a transformer that is stable across processes: the
+    qualified names of the classes and functions of its nodes and children, the values
+    held by their closures, like the arguments of partial transformers, and the
+    attributes of the nodes, like the parameters of class-based transformers. If
+    :code:`code` is :code:`True`, the bytecode of the functions is also hashed, so
+    editing them changes the fingerprint.
+
+    Returns:
+        The fingerprint, or :code:`None` if some value can't be fingerprinted.
+    """
+    try:
+        return _fingerprint(_transformer_state(transformer, code))
+    except (_UnfingerprintableState, RecursionError):
+        return None
@@ -0,0 +1,103 @@
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from gloe.base_transformer import BaseTransformer, Flow
+
+__all__ = ["production", "is_production"]
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True)
+class _Mode:
+    enabled: bool
+    skip_ensurers: bool
+
+
+def _mode_from_environment() -> _Mode:
+    return _Mode(
+        enabled=_env_flag("GLOE_PRODUCTION"),
+        skip_ensurers=_env_flag("GLOE_SKIP_ENSURERS"),
+    )
+
+
+_mode = _mode_from_environment()
+
+
+@contextmanager
+def production(
+    enabled: bool = True, skip_ensurers: Optional[bool] = None
+) -> Iterator[None]:
+    """
+    Enable the production mode inside a :code:`with` block. It can also be enabled for
+    the whole program by setting the :code:`GLOE_PRODUCTION` environment variable to
+    :code:`1`.
+
+    The pipelines compiled in production mode don't execute the :code:`debug` and
+    :code:`forward` nodes. The mode is read when the plan of the pipeline is built, so
+    the pipelines compiled before the block are not affected.
+
+    The mode is global, so it must not be changed while other threads are compiling
+    pipelines.
+
+    Example:
+        Typical usage example::
+
+            with production():
+                pipeline = (parse >> debug() >> enrich >> serialize).compile()
+
+    Args:
+        enabled: if the production mode is enabled inside the block. It can be used to
+            disable it when it was enabled by the environment variable.
+        skip_ensurers: if the validations added by :code:`ensure` to the nodes are also
+            skipped. If it is :code:`None`, it is taken from the
+            :code:`GLOE_SKIP_ENSURERS` environment variable, which also skips them
+            outside the production mode.
+    """
+    global _mode
+    previous = _mode
+    if skip_ensurers is None:
+        skip_ensurers = _env_flag("GLOE_SKIP_ENSURERS")
+    _mode = _Mode(enabled=enabled, skip_ensurers=skip_ensurers)
+    try:
+        yield
+    finally:
+        _mode = previous
+
+
+def is_production() -> bool:
+    """Check if the production mode is enabled."""
+    return _mode.enabled
+
+
+def _resolve_mode(production: Optional[bool]) -> _Mode:
+    if production is None or production == _mode.enabled:
+        return _mode
+    return _Mode(enabled=production, skip_ensurers=_mode.skip_ensurers)
+
+
+def _unensured(node: BaseTransformer) -> BaseTransformer:
+    while "_unensured" in node.__dict__:
+        node = node._unensured
+    return node
+
+
+def _production_flow(flow: Flow, mode: _Mode) -> Flow:
+    if not mode.enabled and not mode.skip_ensurers:
+        return flow
+
+    nodes: Flow = []
+    for node in flow:
+        if mode.skip_ensurers:
+            node = _unensured(node)
+        # the nodes whose transform method was replaced, like by an ensurer, are kept
+        if mode.enabled and node._passthrough and "transform" not in node.__dict__:
+            continue
+        nodes.append(node)
+    return nodes
@@ -0,0 +1,232 @@
+import json
+import os
+import pickle
+from typing import Any, Collection, Optional, Protocol
+
+from gloe._fingerprint import _fingerprint, _transformer_fingerprint
+from gloe.base_transformer import BaseTransformer, Flow
+
+__all__ = [
+    "_Serializer",
+    "_RunStore",
+    "_IncrementalRun",
+    "_CheckpointRun",
+    "_check_run_options",
+]
+
+
+class _Serializer(Protocol):
+    """Anything with the :code:`dumps` and :code:`loads` functions, like pickle."""
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+def _stage_id(index: int, node: BaseTransformer) -> Optional[str]:
+    # the ids of the nodes change on every process, so the stages are identified by
+    # their position, kind, configuration and code, so the outputs recorded before
+    # changing a node are not reused. The nodes whose configuration can't be
+    # fingerprinted have no id, and they are always executed
+    node_type = type(node)
+    code_version = _transformer_fingerprint(node, code=True)
+    if code_version is None:
+        return None
+    return (
+        f"{index}:{node_type.__module__}.{node_type.__qualname__}:{node.label}:"
+        f"{code_version}"
+    )
+
+
+def _check_run_options(incremental_dir: Optional[str], checkpoint_dir: Optional[str]):
+    if incremental_dir is not None and checkpoint_dir is not None:
+        raise ValueError(
+            "The incremental_dir and checkpoint_dir options can not be used together"
+        )
+
+
+class _RunStore:
+    """
+    Directory with the record of the last execution of each stage of a flow: the
+    fingerprints of its input and output, in a small JSON file, and the serialized
+    output, in a separate file. So, the outputs are only loaded when they are needed.
+    """
+
+    def __init__(self, directory: str, serializer: _Serializer = pickle):
+        self.directory = directory
+        self.serializer = serializer
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, index: int, extension: str) -> str:
+        return os.path.join(self.directory, f"stage-{index:04d}.{extension}")
+
+    def _read_json(self, path: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def load_record(self, index: int) -> Optional[dict[str, Any]]:
+        return self._read_json(self._path(index, "json"))
+
+    def load_output(self, index: int) -> Any:
+        with open(self._path(index, "pkl"), "rb") as file:
+            return self.serializer.loads(file.read())
+
+    def _write(self, path: str, content: bytes):
+        # the file is replaced atomically, so an interrupted run never leaves a
+        # partially written record
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(content)
+        os.replace(temporary_path, path)
+
+    def save(self, index: int, record: dict[str, Any], output: Any):
+        self._write(self._path(index, "pkl"), self.serializer.dumps(output))
+        self._write(self._path(index, "json"), json.dumps(record).encode())
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, "checkpoint.json")
+
+    def load_manifest(self) -> Optional[dict[str, Any]]:
+        return self._read_json(self._manifest_path)
+
+    def save_manifest(self, manifest: dict[str, Any]):
+        self._write(self._manifest_path, json.dumps(manifest).encode())
+
+    def remove(self, index: int):
+        for extension in ["pkl", "json"]:
+            path = self._path(index, extension)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def clear(self):
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith("stage-") or file_name == "checkpoint.json":
+                os.remove(os.path.join(self.directory, file_name))
+
+
+class _IncrementalRun:
+    """
+    Make-like execution of a flow: a stage is skipped when it was already executed
+    with the same input, and its previous output is reused.
+
+    The outputs of the skipped stages are only loaded when the next stage must be
+    executed, or when it is the last one.
+    """
+
+    def __init__(self, store: _RunStore, volatile: Collection[BaseTransformer]):
+        self.store = store
+        self.volatile = volatile
+        self.value: Any = None
+        self.fingerprint = ""
+        self.stored_index: Optional[int] = None
+
+    def start(self, data: Any):
+        self.value = data
+        self.fingerprint = _fingerprint(data)
+
+    def try_skip(self, index: int, node: BaseTransformer) -> bool:
+        if node in self.volatile:
+            return False
+
+        stage = _stage_id(index, node)
+        record = self.store.load_record(index)
+        if (
+            stage is None
+            or record is None
+            or record.get("stage") != stage
+            or record.get("input") != self.fingerprint
+        ):
+            return False
+
+        self.fingerprint = record["output"]
+        self.stored_index = index
+        return True
+
+    def current_value(self) -> Any:
+        if self.stored_index is not None:
+            self.value = self.store.load_output(self.stored_index)
+            self.stored_index = None
+        return self.value
+
+    def record(self, index: int, node: BaseTransformer, output: Any):
+        output_fingerprint = _fingerprint(output)
+        record = {
+            "stage": _stage_id(index, node),
+            "input": self.fingerprint,
+            "output": output_fingerprint,
+        }
+        self.store.save(index, record, output)
+        self.value = output
+        self.fingerprint = output_fingerprint
+
+
+class _CheckpointRun:
+    """
+    Execution of a flow that saves the output of its top-level nodes, so a failed run
+    can be resumed from the last saved node. Only the last checkpoint is kept, and all
+    of them are removed when the run succeeds.
+    """
+
+    def __init__(self, flow: Flow, store: _RunStore, every: int):
+        if every < 1:
+            raise ValueError("The checkpoint_every must be greater than zero")
+
+        self.store = store
+        self.every = every
+        self.last_index = len(flow) - 1
+        self.stages = [_stage_id(index, node) for index, node in enumerate(flow)]
+        self.input = ""
+        self.checkpoint: Optional[int] = None
+
+    def start(self, data: Any, resume: bool) -> tuple[int, Any]:
+        """
+        Returns:
+            The index of the first node to be executed and its input.
+        """
+        self.input = _fingerprint(data)
+        if resume:
+            manifest = self.store.load_manifest()
+            if (
+                manifest is not None
+                and manifest.get("input") == self.input
+                and manifest.get("stages") == self.stages
+                and None not in self.stages
+                and manifest.get("checkpoint") is not None
+            ):
+                checkpoint: int = manifest["checkpoint"]
+                self.checkpoint = checkpoint
+                return checkpoint + 1, self.store.load_output(checkpoint)
+
+        self.store.clear()
+        return 0, data
+
+    def _save_manifest(self, checkpoint: Optional[int], **extra: Any):
+        self.store.save_manifest(
+            {
+                "input": self.input,
+                "stages": self.stages,
+                "checkpoint": checkpoint,
+                **extra,
+            }
+        )
+
+    def completed(self, index: int, output: Any):
+        if index == self.last_index or (index + 1) % self.every != 0:
+            return
+
+        self.store.save(index, {"stage": self.stages[index]}, output)
+        self._save_manifest(index)
+        # only the last checkpoint is needed to resume the run
+        if self.checkpoint is not None:
+            self.store.remove(self.checkpoint)
+        self.checkpoint = index
+
+    def failed(self, index: int):
+        self._save_manifest(self.checkpoint, failed_stage=self.stages[index])
+
+    def finish(self):
+        self.store.clear()
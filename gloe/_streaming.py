@@ -0,0 +1,46 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Optional, TypeVar
+
+__all__ = ["_buffered"]
+
+_T = TypeVar("_T")
+
+_END = object()
+
+
+def _buffered(
+    source: AsyncIterable[_T], buffer_size: Optional[int]
+) -> AsyncIterator[_T]:
+    """
+    Iterate over :code:`source`. If :code:`buffer_size` is given, a background task
+    pulls up to :code:`buffer_size` items ahead of the consumer. When the buffer is
+    full, the task waits for the consumer, so a slow consumer throttles the source.
+    """
+    if buffer_size is None:
+        return source.__aiter__()
+    return _prefetch(source, buffer_size)
+
+
+async def _prefetch(source: AsyncIterable[_T], buffer_size: int) -> AsyncIterator[_T]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+    async def produce():
+        try:
+            async for produced in source:
+                await queue.put((produced, None))
+        except Exception as exception:
+            await queue.put((_END, exception))
+        else:
+            await queue.put((_END, None))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item, exception = await queue.get()
+            if exception is not None:
+                raise exception
+            if item is _END:
+                break
+            yield item
+    finally:
+        producer.cancel()
@@ -1,4 +1,3 @@
-import traceback
 from inspect import Signature
 
 from gloe._typing_utils import _match_types, _specify_types
@@ -8,36 +7,10 @@ from gloe.base_transformer import BaseTransformer, TransformerException
 def catch_transformer_exception(
     exception: Exception, raiser_transformer: BaseTransformer
 ) -> TransformerException:
-    transformer_name = raiser_transformer.__class__.__name__
-    tb = traceback.extract_tb(exception.__traceback__)
-
-    # TODO: Make this filter condition stronger
-    transformer_frames = [
-        frame
-        for frame in tb
-        if frame.name == transformer_name
-        or frame.name in ["transform", "transform_async"]
-    ]
-
-    if len(transformer_frames) >= 1:
-        transformer_frame = transformer_frames[-1]
-        exception_message = (
-            f"\n  "
-            f'File "{transformer_frame.filename}", line {transformer_frame.lineno},'
-            f' in transformer "{transformer_name}"\n  '
-            f"  >> {transformer_frame.line}"
-        )
-
-        transform_exception = TransformerException(
-            internal_exception=exception,
-            raiser_transformer=raiser_transformer,
-            message=exception_message,
-        )
-        return transform_exception
-
-    raise NotImplementedError(
-        "This exception was not raised by a transformer"
-    )  # pragma: no cover
+    # the traceback is only searched for the transformer when the message is accessed
+    return TransformerException(
+        internal_exception=exception, raiser_transformer=raiser_transformer
+    )
 
 
 def _diverging_signatures(
@@ -1,5 +1,15 @@
 from types import GenericAlias
-from typing import TypeVar, get_origin, _GenericAlias, Union  # type: ignore
+from typing import Any, TypeVar, get_origin, _GenericAlias, Union  # type: ignore
+
+_TYPES_CACHE_SIZE = 4096
+
+# The caches are keyed by the identity of the types, which are usually the same
+# annotation objects for all the copies of a transformer. The entries keep references
+# to their types, so the identities can't be reused while they are cached. Types are
+# not always hashable, and equal types are not always interchangeable, like unions
+# with the same members in different orders.
+_matches_cache: dict[tuple[int, ...], tuple[Any, ...]] = {}
+_specifications_cache: dict[tuple[int, ...], tuple[Any, ...]] = {}
 
 
 def _format_tuple(tuple_annotation: tuple, input_annotation) -> str:
@@ -49,7 +59,21 @@ def _format_return_annotation(return_annotation, input_annotation=None) -> str:
     return str(return_name)
 
 
-def _match_types(generic, specific):
+def _match_types(generic, specific) -> dict:
+    key = (id(generic), id(specific))
+    cached = _matches_cache.get(key)
+    if cached is None:
+        if len(_matches_cache) >= _TYPES_CACHE_SIZE:
+            _matches_cache.clear()
+        cached = _matches_cache[key] = (
+            generic,
+            specific,
+            _resolve_matches(generic, specific),
+        )
+    return dict(cached[-1])
+
+
+def _resolve_matches(generic, specific) -> dict:
     if type(generic) is TypeVar:
         return {generic: specific}
 
@@ -85,6 +109,21 @@ def _match_types(generic, specific):
 
 
 def _specify_types(generic, spec):
+    items = tuple(spec.items())
+    key = (id(generic), *[id(item) for pair in items for item in pair])
+    cached = _specifications_cache.get(key)
+    if cached is None:
+        if len(_specifications_cache) >= _TYPES_CACHE_SIZE:
+            _specifications_cache.clear()
+        cached = _specifications_cache[key] = (
+            generic,
+            items,
+            _resolve_specification(generic, spec),
+        )
+    return cached[-1]
+
+
+def _resolve_specification(generic, spec):
     if type(generic) is TypeVar:
         tp = spec.get(generic)
         if tp is None:
@@ -1,11 +1,34 @@
+import pickle
 from abc import abstractmethod
+from functools import partial
 from inspect import Signature
-from typing import TypeVar, overload, cast, Callable, Optional, Any
+from typing import (
+    TypeVar,
+    overload,
+    cast,
+    Callable,
+    Optional,
+    Any,
+    Awaitable,
+    Iterable,
+    Collection,
+)
 
 from typing_extensions import Self, Unpack, Generic, TypeVarTuple, override
 
+from gloe._concurrency import _check_concurrency, _run_concurrently
+from gloe._compiled_flow import _AsyncCompiledFlow, _CompiledFlow, _AsyncStep
 from gloe._plotting_utils import PlottingSettings, NodeType
+from gloe._run import (
+    _CheckpointRun,
+    _IncrementalRun,
+    _RunStore,
+    _Serializer,
+    _check_run_options,
+)
+from gloe._production import _production_flow, _resolve_mode
 from gloe._transformer_utils import catch_transformer_exception
+from gloe.interceptors import _interceptor
 from gloe.base_transformer import BaseTransformer, Flow
 
 __all__ = ["AsyncTransformer"]
@@ -40,6 +63,81 @@ async def _execute_async_flow(flow: Flow, arg: Any) -> Any:
     return result
 
 
+async def _execute_async_flow_batch(
+    flow: Flow, batch: list[Any], concurrency: Optional[int]
+) -> list[Any]:
+    for op in flow:
+        if isinstance(op, AsyncTransformer):
+            batch = await op._safe_transform_batch(batch, concurrency)
+        elif isinstance(op, BaseTransformer) and hasattr(op, "_safe_transform_batch"):
+            batch = op._safe_transform_batch(batch)
+        else:
+            raise NotImplementedError()
+    return batch
+
+
+async def _run_async_flow(
+    flow: Flow, data: Any, store: _RunStore, volatile: Collection[BaseTransformer]
+) -> Any:
+    run = _IncrementalRun(store, volatile)
+    run.start(data)
+    for index, op in enumerate(flow):
+        if run.try_skip(index, op):
+            continue
+        if isinstance(op, AsyncTransformer):
+            output = await op._safe_transform(run.current_value())
+        elif isinstance(op, BaseTransformer) and hasattr(op, "_safe_transform"):
+            output = op._safe_transform(run.current_value())
+        else:
+            raise NotImplementedError()
+        run.record(index, op, output)
+    return run.current_value()
+
+
+async def _run_async_flow_with_checkpoints(
+    flow: Flow, data: Any, run: _CheckpointRun, resume: bool
+) -> Any:
+    start, result = run.start(data, resume)
+    for index in range(start, len(flow)):
+        op = flow[index]
+        try:
+            if isinstance(op, AsyncTransformer):
+                result = await op._safe_transform(result)
+            elif isinstance(op, BaseTransformer) and hasattr(op, "_safe_transform"):
+                result = op._safe_transform(result)
+            else:
+                raise NotImplementedError()
+        except Exception:
+            run.failed(index)
+            raise
+        run.completed(index, result)
+    run.finish()
+    return result
+
+
+def _compile_async_flow(
+    flow: Flow, production: Optional[bool] = None
+) -> _AsyncCompiledFlow:
+    flow = _production_flow(flow, _resolve_mode(production))
+
+    steps: list[_AsyncStep] = []
+    sync_run: list[BaseTransformer] = []
+    for op in flow:
+        if isinstance(op, AsyncTransformer):
+            if len(sync_run) > 0:
+                steps.append((None, _CompiledFlow(sync_run)))
+                sync_run = []
+            steps.append((op, op.transform_async))
+        elif isinstance(op, BaseTransformer) and hasattr(op, "_safe_transform"):
+            sync_run.append(op)
+        else:
+            raise NotImplementedError()
+
+    if len(sync_run) > 0:
+        steps.append((None, _CompiledFlow(sync_run)))
+    return _AsyncCompiledFlow(steps)
+
+
 class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
     def __init__(self):
         super().__init__()
@@ -84,7 +182,11 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
 
         transformed: Optional[_Out] = None
         try:
-            transformed = await self.transform_async(data)
+            chain = _interceptor._async_chain
+            if chain is None:
+                transformed = await self.transform_async(data)
+            else:
+                transformed = await chain(self, self.transform_async, data)
         except Exception as exception:
             transform_exception = catch_transformer_exception(exception, self)
 
@@ -96,6 +198,137 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
 
         raise NotImplementedError  # pragma: no cover
 
+    async def transform_batch_async(
+        self, data: list[_In], concurrency: Optional[int] = 1
+    ) -> list[_Out]:
+        """
+        Transform a batch of incoming data at once. It is used by :code:`map_batch()`.
+
+        By default, it awaits the :code:`transform_async` method for each item, with at
+        most :code:`concurrency` items at the same time. Transformers that can process
+        many items at once more efficiently, like bulk requests, can override it.
+
+        Args:
+            data: the items of the batch.
+            concurrency: maximum number of items transformed at the same time. If it is
+                :code:`None`, all the items are transformed at once.
+
+        Returns:
+            The outcome of each item, in the same order.
+        """
+        results, _ = await _run_concurrently(
+            self.transform_async, data, concurrency, "raise"
+        )
+        return results
+
+    async def _safe_transform_batch(
+        self, data: list[_In], concurrency: Optional[int]
+    ) -> list[_Out]:
+        transform_exception = None
+
+        transformed: list[_Out] = []
+        try:
+            chain = _interceptor._async_chain
+            if chain is None:
+                transformed = await self.transform_batch_async(data, concurrency)
+            else:
+                transformed = await chain(
+                    self,
+                    lambda batch: self.transform_batch_async(batch, concurrency),
+                    data,
+                )
+        except Exception as exception:
+            transform_exception = catch_transformer_exception(exception, self)
+
+        if transform_exception is not None:
+            raise transform_exception.internal_exception
+
+        return transformed
+
+    async def map_batch(
+        self, inputs: Iterable[_In], concurrency: Optional[int] = 1
+    ) -> list[_Out]:
+        """
+        Execute the transformer over many inputs. Instead of calling the transformer
+        for each input, the whole batch goes through each node of the flow before going
+        to the next one. The async nodes transform up to :code:`concurrency` items at
+        the same time.
+
+        Example:
+            Typical usage example::
+
+                users = await fetch_users.map_batch(user_ids, concurrency=10)
+
+        Args:
+            inputs: the inputs of the transformer.
+            concurrency: maximum number of items transformed at the same time by each
+                async node. If it is :code:`None`, all the items are transformed at
+                once.
+
+        Returns:
+            The outcome of each input, in the same order.
+        """
+        _check_concurrency(concurrency, "raise")
+        return await _execute_async_flow_batch(self._flow, list(inputs), concurrency)
+
+    async def run(
+        self,
+        data: _In,
+        *,
+        incremental_dir: Optional[str] = None,
+        volatile: Collection[BaseTransformer] = (),
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: int = 1,
+        resume: bool = False,
+        serializer: _Serializer = pickle,
+    ) -> _Out:
+        """
+        Execute the transformer with some execution options.
+
+        Args:
+            data: the input of the transformer.
+            incremental_dir: if given, each top-level node of the flow records the
+                fingerprints of its input and output, and its output, in this
+                directory. In the next runs, the nodes whose input is unchanged are
+                skipped and their recorded output is reused, like :code:`make` does.
+                A node is also executed again when its code or configuration changes,
+                like the arguments of a partial transformer or the attributes of a
+                class-based one. The nodes whose configuration can't be fingerprinted
+                are always executed.
+                The outputs must be serializable.
+            volatile: nodes that must be executed even when their input is unchanged,
+                because they depend on something else, like a database or the clock.
+            checkpoint_dir: if given, the output of the top-level nodes of the flow is
+                saved in this directory, and removed when the run succeeds.
+            checkpoint_every: save the output of one in every this many top-level
+                nodes. The default saves it after each node.
+            resume: if a previous run with the same input and flow failed, restart it
+                from its last checkpoint, skipping the nodes before it.
+            serializer: object with the :code:`dumps` and :code:`loads` functions used
+                to save the outputs, like :code:`pickle` (the default).
+
+        Returns:
+            The outcome of the transformer.
+        """
+        _check_run_options(incremental_dir, checkpoint_dir)
+        execute: Callable[[Any], Awaitable[Any]] = self._run
+        if incremental_dir is not None:
+            store = _RunStore(incremental_dir, serializer)
+            execute = partial(
+                _run_async_flow, self._flow, store=store, volatile=volatile
+            )
+        elif checkpoint_dir is not None:
+            store = _RunStore(checkpoint_dir, serializer)
+            run = _CheckpointRun(self._flow, store, checkpoint_every)
+            execute = partial(
+                _run_async_flow_with_checkpoints, self._flow, run=run, resume=resume
+            )
+
+        chain = _interceptor._async_pipeline_chain
+        if chain is None:
+            return await execute(data)
+        return await chain(self, execute, data)
+
     def copy(
         self,
         transform: Optional[Callable[[Self, _In], _Out]] = None,
@@ -104,6 +337,41 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
     ) -> Self:
         return self._copy(transform, regenerate_instance_id, "transform_async", force)
 
+    def compile(self, lazy: bool = False, production: Optional[bool] = None) -> Self:
+        """
+        Prebuild the execution plan of the transformer, so the calls skip the per-node
+        dispatch of the flow execution. Consecutive sync transformers of the flow are
+        collapsed into a single step of the plan.
+
+        The plan is a snapshot of the current flow. Transformers composed with this one
+        afterward are not compiled, and changes to the flow after the compilation are
+        not reflected in the plan.
+
+        Args:
+            lazy: if :code:`True`, the plan is only built on the first call of the
+                transformer, instead of right away.
+            production: if the plan is built in production mode, which skips the
+                nodes that are only useful during development. By default, it follows
+                the global mode, set by :code:`gloe.production`.
+
+        Returns:
+            The transformer itself, now executed through its compiled plan.
+        """
+        self._production = production
+        if lazy:
+            self._compile_on_call = True
+        else:
+            self._plan = _compile_async_flow(self._flow, production)
+        return self
+
+    def _run(self, data: Any) -> Awaitable[Any]:
+        plan = self._plan
+        if plan is None:
+            if not self._compile_on_call:
+                return _execute_async_flow(self._flow, data)
+            plan = self._plan = _compile_async_flow(self._flow, self._production)
+        return plan(data)
+
     @overload
     async def __call__(self: "AsyncTransformer[None, _Out]") -> _Out:
         return await _execute_async_flow(self._flow, None)
@@ -113,7 +381,10 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
         return await _execute_async_flow(self._flow, data)
 
     async def __call__(self, data=None):
-        return await _execute_async_flow(self._flow, data)
+        chain = _interceptor._async_pipeline_chain
+        if chain is None:
+            return await self._run(data)
+        return await chain(self, self._run, data)
 
     @overload
     def __rshift__(
@@ -204,7 +475,10 @@ class MultiArgsAsyncTransformer(
     async def __call__(  # type: ignore[override]
         self: "MultiArgsAsyncTransformer[Unpack[Args], _Out]", *data: Unpack[Args]
     ) -> _Out:
-        return await _execute_async_flow(self._flow, data)
+        chain = _interceptor._async_pipeline_chain
+        if chain is None:
+            return await self._run(data)
+        return await chain(self, self._run, data)
 
     @overload
     def __rshift__(
@@ -1,14 +1,17 @@
 import copy
+import linecache
+import threading
+import traceback
 import types
 import uuid
 import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import cache
 from inspect import Signature
 
 
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Generic,
@@ -18,7 +21,7 @@ from typing import (
     get_origin,
     Type,
     Optional,
-    cast,
+    overload,
 )
 
 from typing_extensions import Self, TypeAlias, deprecated
@@ -27,6 +30,9 @@ from gloe._gloe_graph import GloeGraph
 from gloe._plotting_utils import PlottingSettings, NodeType, dot_props
 from gloe._typing_utils import _format_return_annotation
 
+if TYPE_CHECKING:
+    from gloe.profiling import Profiler
+
 __all__ = ["BaseTransformer", "TransformerException", "PreviousTransformer"]
 
 _NextOut = TypeVar("_NextOut")
@@ -53,8 +59,85 @@ PreviousTransformer: TypeAlias = Union[
 
 TransformerChildren: TypeAlias = list["BaseTransformer"]
 
+_Child = TypeVar("_Child", bound="BaseTransformer")
+
+
+class _ChildTransformer(Generic[_Child]):
+    """
+    Attribute of the transformers that wrap other ones, returning one of their
+    children.
+
+    The children are copied with the transformer, receiving new instance ids, so each
+    copy must run its own children instead of the transformers given to its
+    constructor. Otherwise, the nodes shown in the graphs and identified by the
+    interceptors wouldn't be the executed ones.
+
+    Args:
+        index: position of the child in the children of the transformer.
+    """
+
+    def __init__(self, index: int = 0):
+        self.index = index
+
+    @overload
+    def __get__(self, instance: None, owner: Any) -> Self: ...
+
+    @overload
+    def __get__(self, instance: "BaseTransformer", owner: Any) -> _Child: ...
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+        return instance._children[self.index]
+
+
+# names of the frames where the code of a transformer can be running
+_TRANSFORMER_FRAMES = {
+    "transform",
+    "transform_async",
+    "transform_batch",
+    "transform_batch_async",
+    "intercept",
+    "intercept_async",
+}
+
+
+def _locate_transformer(
+    raiser_transformer: "BaseTransformer", tb: Optional[types.TracebackType]
+) -> Optional[str]:
+    transformer_name = raiser_transformer.__class__.__name__
+
+    # TODO: Make this filter condition stronger
+    location = None
+    for frame, lineno in traceback.walk_tb(tb):
+        name = frame.f_code.co_name
+        if name == transformer_name or name in _TRANSFORMER_FRAMES:
+            location = (frame.f_code.co_filename, lineno)
+
+    if location is None:
+        return None
+
+    filename, lineno = location
+    line = linecache.getline(filename, lineno).strip()
+    return (
+        f"\n  "
+        f'File "{filename}", line {lineno},'
+        f' in transformer "{transformer_name}"\n  '
+        f"  >> {line}"
+    )
+
 
 class TransformerException(Exception):
+    """
+    Cause of the exceptions raised inside transformers, which records the transformer
+    that raised them.
+
+    When no message is given, the message points to the line of the transformer that
+    raised the exception. It is only computed when it is first accessed, by the
+    :code:`message` property or by converting the exception to a string, because the
+    exceptions handled by the callers are usually never printed.
+    """
+
     def __init__(
         self,
         internal_exception: Union["TransformerException", Exception],
@@ -65,12 +148,29 @@ class TransformerException(Exception):
         self.raiser_transformer = raiser_transformer
         self._traceback = internal_exception.__traceback__
         internal_exception.__cause__ = self
+        self._message = message
+        self._located = message is not None
         super().__init__(message)
 
     @property
     def internal_exception(self):
         return self._internal_exception.with_traceback(self._traceback)
 
+    @property
+    def message(self) -> Optional[str]:
+        """Location of the transformer that raised the exception."""
+        if not self._located:
+            self._message = _locate_transformer(
+                self.raiser_transformer, self._traceback
+            )
+            self._located = True
+            self.args = (self._message,)
+        return self._message
+
+    def __str__(self) -> str:
+        _ = self.message
+        return super().__str__()
+
 
 @dataclass
 class GloeNode:
@@ -94,8 +194,56 @@ _Out = TypeVar("_Out", covariant=True)
 
 Flow = list["BaseTransformer"]
 
+# guards the deferred copies, so concurrent first accesses materialize the same copy.
+# Materializing a node can access the deferred attributes of other ones, so the lock
+# is reentrant
+_materialization_lock = threading.RLock()
+
+
+@dataclass(frozen=True)
+class _PendingCopy:
+    """
+    Copy of the flow and the children of a transformer, deferred until they are used.
+
+    The flows and the children lists are never changed in place, so the ones of the
+    original transformer can be kept until then.
+    """
+
+    flow: Flow
+    children: TransformerChildren
+    old_instance_id: uuid.UUID
+    regenerate_instance_id: bool
+    deep: bool
+
+    def copy_flow(self, copied: "BaseTransformer") -> Flow:
+        return [
+            (
+                copied
+                if node.instance_id == self.old_instance_id
+                else (
+                    node.copy(regenerate_instance_id=self.regenerate_instance_id)
+                    if self.deep
+                    else node
+                )
+            )
+            for node in self.flow
+        ]
+
+    def copy_children(self) -> TransformerChildren:
+        return [
+            child.copy(regenerate_instance_id=self.regenerate_instance_id)
+            for child in self.children
+        ]
+
 
 class BaseTransformer(Generic[_In, _Out], ABC):
+    _pending_copy: _PendingCopy
+    # the node this one validates, when it was created by an ensurer
+    _unensured: "BaseTransformer"
+    # if the node returns its input unchanged, so it can be removed from production
+    # plans
+    _passthrough: bool = False
+
     def __init__(self):
         self._children: TransformerChildren = []
         self.id = uuid.uuid4()
@@ -108,6 +256,11 @@ class BaseTransformer(Generic[_In, _Out], ABC):
             node_type=NodeType.Transformer,
         )
         self._flow: Flow = [self]
+        self._plan: Optional[Callable[[Any], Any]] = None
+        self._compile_on_call = False
+        self._production: Optional[bool] = None
+        self._graphs: dict[str, GloeGraph] = {}
+        self._signatures: dict[tuple, Signature] = {}
 
     @property
     def label(self) -> str:
@@ -152,41 +305,69 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         transform_method: str = "transform",
         force: bool = False,
     ) -> Self:
+        flow = self._flow
+        pending = _PendingCopy(
+            flow=flow,
+            children=self._children,
+            old_instance_id=self.instance_id,
+            regenerate_instance_id=regenerate_instance_id,
+            deep=not self._already_copied or force,
+        )
+
         copied: Self = copy.copy(self)
         copied._already_copied = True
+        copied._plan = None
+        copied._graphs = {}
 
         if transform is not None:
             setattr(copied, transform_method, types.MethodType(transform, copied))
+            copied._signatures = {}
 
-        old_instance_id = self.instance_id
         if regenerate_instance_id:
             copied.instance_id = uuid.uuid4()
 
-        if self._already_copied and not force:
-            copied._flow = [
-                (
-                    cast(BaseTransformer, copied)
-                    if child.instance_id == old_instance_id
-                    else child
-                )
-                for child in self._flow
-            ]
-        else:
-            copied._children = [
-                child.copy(regenerate_instance_id=regenerate_instance_id)
-                for child in self.children
-            ]
-
-            copied._flow = [
-                (
-                    cast(BaseTransformer, copied)
-                    if child.instance_id == old_instance_id
-                    else child.copy(regenerate_instance_id=regenerate_instance_id)
-                )
-                for child in self._flow
-            ]
+        # the flow and the children are only copied when they are first accessed, so
+        # reusing a large transformer in many compositions is cheap
+        del copied._flow
+        if pending.deep:
+            del copied._children
+        copied._pending_copy = pending
         return copied
 
+    if not TYPE_CHECKING:
+        # hidden from the type checkers, which would otherwise accept any attribute
+
+        def __getattr__(self, name: str) -> Any:
+            # only called when the attribute is missing from the instance
+            return self._deferred_attribute(name)
+
+    def _deferred_attribute(self, name: str) -> Any:
+        if name in ("_flow", "_children"):
+            with _materialization_lock:
+                # another thread may have materialized it while this one waited
+                if name in self.__dict__:
+                    return self.__dict__[name]
+                return self._materialize(name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _materialize(self, name: str) -> Any:
+        pending = self.__dict__.get("_pending_copy")
+        if pending is not None:
+            if name == "_flow":
+                value = pending.copy_flow(self)
+            else:
+                value = pending.copy_children()
+            setattr(self, name, value)
+
+            if "_flow" in self.__dict__ and "_children" in self.__dict__:
+                del self._pending_copy
+            return value
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
     def copy(
         self: Self,
         transform: Optional[Callable[[Self, _In], _Out]] = None,
@@ -195,11 +376,52 @@ class BaseTransformer(Generic[_In, _Out], ABC):
     ) -> Self:
         return self._copy(transform, regenerate_instance_id, "transform", force)
 
+    def __copy__(self) -> Self:
+        # shallow copies must not go through the pickling protocol, which is customized
+        # by some transformers
+        cls = self.__class__
+        copied = cls.__new__(cls)
+        copied.__dict__.update(self.__dict__)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # like the shallow copies, so the transformers pickled by reference are copied
+        cls = self.__class__
+        copied = cls.__new__(cls)
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            copied.__dict__[name] = copy.deepcopy(value, memo)
+        return copied
+
+    def __getstate__(self) -> dict[str, Any]:
+        if "_pending_copy" in self.__dict__:
+            _ = self._flow, self._children
+        state = self.__dict__.copy()
+        # the signatures specialized during the composition are closures, and they
+        # are not required to execute the transformer
+        state.pop("signature", None)
+        state["_plan"] = None
+        state["_graphs"] = {}
+        state["_signatures"] = {}
+        return state
+
     @abstractmethod
     def signature(self) -> Signature:
         """Transformer function-like signature"""
 
     def _signature(self, klass: Type, transform_method: str = "transform") -> Signature:
+        # the signature only depends on the class, the transform method and the
+        # specialization of the generic class, so it is computed once by instance and
+        # shared with its copies
+        key = (klass, transform_method, self.__dict__.get("__orig_class__"))
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._signatures[key] = self._resolve_signature(
+                klass, transform_method
+            )
+        return signature
+
+    def _resolve_signature(self, klass: Type, transform_method: str) -> Signature:
         orig_bases = getattr(self, "__orig_bases__", [])
         transformer_args = [
             get_args(base) for base in orig_bases if get_origin(base) == klass
@@ -343,8 +565,15 @@ class BaseTransformer(Generic[_In, _Out], ABC):
                 prev_node = GloeNode.from_transformer(node)
         return prev_node
 
-    @cache
     def graph(self, name: str = "") -> GloeGraph:
+        # the graphs are cached by each instance, and not by a global cache, which
+        # would keep the transformers alive and share the graphs between their copies
+        graph = self._graphs.get(name)
+        if graph is None:
+            graph = self._graphs[name] = self._build_graph(name)
+        return graph
+
+    def _build_graph(self, name: str) -> GloeGraph:
         net = GloeGraph(name=name)
         net.attrs["splines"] = "ortho"
         net.add_node(f"{name}begin", _label="begin", **dot_props(NodeType.Begin))
@@ -373,15 +602,48 @@ class BaseTransformer(Generic[_In, _Out], ABC):
 
         self.graph().to_agraph(with_edge_labels).write(path)
 
-    def to_dot(self, path: str, with_edge_labels: bool = True):
-        """Export Transformer object in dot format"""
+    def _plotted_graph(self, stats: Optional["Profiler"]) -> GloeGraph:
+        if stats is None:
+            return self.graph()
+        return stats._overlay(self.graph(), self)
 
-        self.graph().to_agraph(with_edge_labels).write(path)
+    def to_dot(
+        self,
+        path: str,
+        with_edge_labels: bool = True,
+        stats: Optional["Profiler"] = None,
+    ):
+        """
+        Export Transformer object in dot format
+
+        Args:
+            path: the path of the dot file.
+            with_edge_labels: if the edges are labeled with the types of the data.
+            stats: a profiler that measured executions of this transformer. If given,
+                the nodes are colored by their share of the total time and labeled with
+                their measurements, and the edges are labeled with their throughput.
+        """
 
-    def to_image(self, path: str, with_edge_labels: bool = True):
-        """Export Transformer object in a custom image format"""
+        self._plotted_graph(stats).to_agraph(with_edge_labels).write(path)
+
+    def to_image(
+        self,
+        path: str,
+        with_edge_labels: bool = True,
+        stats: Optional["Profiler"] = None,
+    ):
+        """
+        Export Transformer object in a custom image format
+
+        Args:
+            path: the path of the image, whose extension defines its format.
+            with_edge_labels: if the edges are labeled with the types of the data.
+            stats: a profiler that measured executions of this transformer. If given,
+                the nodes are colored by their share of the total time and labeled with
+                their measurements, and the edges are labeled with their throughput.
+        """
 
-        self.graph().to_agraph(with_edge_labels).draw(path, prog="dot")
+        self._plotted_graph(stats).to_agraph(with_edge_labels).draw(path, prog="dot")
 
     def __len__(self):
         return 1
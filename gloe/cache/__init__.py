@@ -0,0 +1,15 @@
+from gloe.cache._cached import (
+    AsyncCachedTransformer,
+    CachedTransformer,
+    cached,
+    disk_cached,
+)
+from gloe.cache._store import CacheInfo
+
+__all__ = [
+    "cached",
+    "disk_cached",
+    "CachedTransformer",
+    "AsyncCachedTransformer",
+    "CacheInfo",
+]
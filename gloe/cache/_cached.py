@@ -0,0 +1,377 @@
+import asyncio
+from inspect import Signature
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    Protocol,
+    TypeVar,
+    overload,
+)
+
+from gloe._fingerprint import _transformer_fingerprint
+from gloe.cache._disk_store import _DiskStore
+from gloe.cache._store import CacheInfo, _MISSING, _CacheStore, _MemoryStore
+from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import (
+    BaseTransformer,
+    TransformerChildren,
+    _ChildTransformer,
+)
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.transformers import Transformer
+
+__all__ = ["CachedTransformer", "AsyncCachedTransformer", "cached", "disk_cached"]
+
+_I = TypeVar("_I")
+_O = TypeVar("_O")
+
+
+class _CacheMixin(Generic[_I]):
+    _children: TransformerChildren
+    key: Optional[Callable[[_I], Hashable]]
+    _store: _CacheStore
+
+    def _init_cache(
+        self,
+        transformer: BaseTransformer,
+        maxsize: Optional[int],
+        ttl: Optional[float],
+        key: Optional[Callable[[_I], Hashable]],
+        store: Optional[_CacheStore],
+    ):
+        self._children = [transformer]
+        self.key = key
+        self._store = store if store is not None else _MemoryStore(maxsize, ttl)
+
+    def signature(self) -> Signature:
+        return self._children[0].signature()
+
+    def _cache_key(self, data: _I) -> Hashable:
+        if self.key is None:
+            return self._store.normalize_key(data)
+        return self._store.normalize_key(self.key(data))
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns:
+            The number of hits and misses, the maximum size and the current size of the
+            cache.
+        """
+        return self._store.info()
+
+    def invalidate(self, data: Any = _MISSING):
+        """
+        Remove the cached outcome of the given input. If no input is given, the whole
+        cache is cleared.
+
+        Args:
+            data: the input whose outcome must be removed.
+        """
+        if data is _MISSING:
+            self._store.clear()
+        else:
+            self._store.delete(self._cache_key(data))
+
+
+class CachedTransformer(_CacheMixin[_I], Transformer[_I, _O]):
+    """
+    Transformer that memoizes the outcome of other transformer for each input. It is
+    created by the :code:`cached()` function.
+
+    The copies of a cached transformer, like the ones created during the composition,
+    share the same cache. By default, the outcomes are stored in memory, but other
+    store can be given, like the one created by :code:`disk_cached()`.
+    """
+
+    transformer: _ChildTransformer[Transformer[_I, _O]] = _ChildTransformer()
+
+    def __init__(
+        self,
+        transformer: Transformer[_I, _O],
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[_I], Hashable]] = None,
+        store: Optional[_CacheStore] = None,
+    ):
+        super().__init__()
+        self._init_cache(transformer, maxsize, ttl, key, store)
+        self._label = f"cached({transformer.label})"
+        self.plotting_settings.has_children = True
+
+    def transform(self, data: _I) -> _O:
+        cache_key = self._cache_key(data)
+        value = self._store.get(cache_key)
+        if value is _MISSING:
+            value = self.transformer(data)
+            self._store.set(cache_key, value)
+        return value
+
+
+class _Flight:
+    """A call shared by all the concurrent callers with the same key."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncCachedTransformer(_CacheMixin[_I], AsyncTransformer[_I, _O]):
+    """
+    Async transformer that memoizes the outcome of other async transformer for each
+    input. It is created by the :code:`cached()` function.
+
+    Besides the cache, the concurrent calls with the same key are deduplicated: the
+    first one starts the execution of the original transformer, and all of them await
+    this same execution. If a caller is cancelled, the execution goes on for the other
+    ones, and it is only cancelled when all its callers are cancelled.
+    """
+
+    transformer: _ChildTransformer[AsyncTransformer[_I, _O]] = _ChildTransformer()
+
+    def __init__(
+        self,
+        transformer: AsyncTransformer[_I, _O],
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[_I], Hashable]] = None,
+        store: Optional[_CacheStore] = None,
+    ):
+        super().__init__()
+        self._init_cache(transformer, maxsize, ttl, key, store)
+        self._in_flight: dict[Hashable, _Flight] = {}
+        self._label = f"cached({transformer.label})"
+        self.plotting_settings.has_children = True
+
+    async def _load(self, cache_key: Hashable, data: _I) -> _O:
+        value = await self.transformer(data)
+        self._store.set(cache_key, value)
+        return value
+
+    def _start_flight(self, cache_key: Hashable, data: _I) -> _Flight:
+        flight = _Flight(asyncio.ensure_future(self._load(cache_key, data)))
+
+        def land(_):
+            if self._in_flight.get(cache_key) is flight:
+                del self._in_flight[cache_key]
+
+        flight.task.add_done_callback(land)
+        self._in_flight[cache_key] = flight
+        return flight
+
+    async def transform_async(self, data: _I) -> _O:
+        cache_key = self._cache_key(data)
+        value = self._store.get(cache_key)
+        if value is not _MISSING:
+            return value
+
+        flight = self._in_flight.get(cache_key)
+        if flight is None:
+            flight = self._start_flight(cache_key, data)
+
+        flight.waiters += 1
+        try:
+            # the shield keeps the shared execution running when this caller is
+            # cancelled
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                if self._in_flight.get(cache_key) is flight:
+                    del self._in_flight[cache_key]
+                flight.task.cancel()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_in_flight"] = {}
+        return state
+
+
+class _CacheDecorator(Protocol):
+    @overload
+    def __call__(self, transformer: Transformer[_I, _O]) -> CachedTransformer[_I, _O]:
+        pass
+
+    @overload
+    def __call__(
+        self, transformer: AsyncTransformer[_I, _O]
+    ) -> AsyncCachedTransformer[_I, _O]:
+        pass
+
+
+@overload
+def cached(
+    transformer: Transformer[_I, _O],
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[[_I], Hashable]] = None,
+) -> CachedTransformer[_I, _O]:
+    pass
+
+
+@overload
+def cached(
+    transformer: AsyncTransformer[_I, _O],
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[[_I], Hashable]] = None,
+) -> AsyncCachedTransformer[_I, _O]:
+    pass
+
+
+@overload
+def cached(
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[[Any], Hashable]] = None,
+) -> "_CacheDecorator":
+    pass
+
+
+def cached(transformer=None, *, maxsize=128, ttl=None, key=None):
+    """
+    Memoize the outcome of a transformer for each input. The cached transformer can be
+    composed like any other transformer, and it is plotted as a cluster with the
+    original transformer.
+
+    Async transformers are also supported. In this case, the concurrent calls with the
+    same input share a single execution of the original transformer.
+
+    Example:
+        It can be used as a function or as a decorator::
+
+            @cached(maxsize=1000, ttl=60)
+            @transformer
+            def get_country(country_code: str) -> Country:
+                ...
+
+            enrich = parse_order >> (forward(), get_country_code >> get_country)
+
+            get_country.cache_info()  # CacheInfo(hits=..., misses=..., ...)
+            get_country.invalidate("BR")
+
+    Args:
+        transformer: the transformer to be cached. If it is omitted, a decorator is
+            returned.
+        maxsize: maximum number of outcomes in the cache. When it is full, the least
+            recently used outcome is dropped. If it is :code:`None`, the cache is
+            unbounded.
+        ttl: number of seconds an outcome stays in the cache. If it is :code:`None`,
+            the outcomes never expire.
+        key: function that computes the cache key of each input. By default, the input
+            itself is the key, so it must be hashable.
+
+    Returns:
+        The cached transformer.
+    """
+    if transformer is None:
+        return lambda _transformer: cached(
+            _transformer, maxsize=maxsize, ttl=ttl, key=key
+        )
+
+    if isinstance(transformer, Transformer):
+        return CachedTransformer(transformer, maxsize=maxsize, ttl=ttl, key=key)
+    if isinstance(transformer, AsyncTransformer):
+        return AsyncCachedTransformer(transformer, maxsize=maxsize, ttl=ttl, key=key)
+    raise UnsupportedTransformerArgException(transformer)
+
+
+@overload
+def disk_cached(
+    transformer: Transformer[_I, _O],
+    path: str,
+    *,
+    version: str = "",
+    name: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[[_I], Any]] = None,
+) -> CachedTransformer[_I, _O]:
+    pass
+
+
+@overload
+def disk_cached(
+    transformer: AsyncTransformer[_I, _O],
+    path: str,
+    *,
+    version: str = "",
+    name: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[[_I], Any]] = None,
+) -> AsyncCachedTransformer[_I, _O]:
+    pass
+
+
+def disk_cached(
+    transformer,
+    path,
+    *,
+    version="",
+    name=None,
+    max_bytes=None,
+    ttl=None,
+    key=None,
+):
+    """
+    Memoize the outcome of a transformer for each input in a SQLite database, so the
+    outcomes survive process restarts. The inputs are identified by a stable hash, so
+    they don't need to be hashable, and the outcomes must be picklable.
+
+    Example:
+        Caching the inference of a model between the daily executions of a job::
+
+            classify = disk_cached(
+                classify_document, "cache/gloe.db", version="model-v3"
+            )
+
+            classify.cache_info().hit_ratio
+
+    Args:
+        transformer: the transformer to be cached.
+        path: path of the database file. It is created if it doesn't exist, and can be
+            shared by many cached transformers.
+        version: version of the transformer. When the logic of the transformer changes,
+            changing its version makes the outcomes stored for the previous versions
+            unreachable.
+        name: name that identifies the transformer in the database. Defaults to its
+            label followed by a hash of its configuration: the modules and qualified
+            names of the functions and classes of its nodes, the arguments of the
+            partial transformers and the attributes of the class-based ones. So,
+            transformers with the same label, like :code:`a >> b` and :code:`c >> b`,
+            or :code:`Multiply(3)` and :code:`Multiply(4)`, don't share outcomes. It is
+            required when some of these values can't be pickled.
+        max_bytes: maximum total size of the stored outcomes in the database file.
+            When it is exceeded, the least recently used outcomes are dropped. If it is
+            :code:`None`, the database grows without limit.
+        ttl: number of seconds an outcome stays in the cache. If it is :code:`None`,
+            the outcomes never expire.
+        key: function that computes the cache key of each input. By default, the input
+            itself is the key.
+
+    Returns:
+        The cached transformer.
+    """
+    if name is None:
+        fingerprint = _transformer_fingerprint(transformer)
+        if fingerprint is None:
+            raise ValueError(
+                f"The configuration of the transformer {transformer.label} can not be "
+                "fingerprinted, so a name must be given to identify it in the database"
+            )
+        name = f"{transformer.label}:{fingerprint}"
+    namespace = f"{name}:{version}"
+    store = _DiskStore(path, namespace, max_bytes=max_bytes, ttl=ttl)
+    if isinstance(transformer, Transformer):
+        return CachedTransformer(transformer, key=key, store=store)
+    if isinstance(transformer, AsyncTransformer):
+        return AsyncCachedTransformer(transformer, key=key, store=store)
+    raise UnsupportedTransformerArgException(transformer)
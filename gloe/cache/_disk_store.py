@@ -0,0 +1,173 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+from gloe._fingerprint import _fingerprint
+from gloe.cache._store import CacheInfo, _MISSING
+
+__all__ = ["_DiskStore"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gloe_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS gloe_cache_accessed_at ON gloe_cache (accessed_at);
+"""
+
+
+class _DiskStore:
+    """
+    Store backed by a SQLite database, so the outcomes survive process restarts. The
+    entries are keyed by a stable hash of the input and grouped in namespaces, so many
+    transformers, and many versions of them, can share the same database file.
+
+    When the total size of the stored values goes beyond :code:`max_bytes`, the least
+    recently used entries of the database are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("The max_bytes must be greater than zero")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The ttl must be greater than zero")
+
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory != "":
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def normalize_key(self, key: Any) -> Hashable:
+        return _fingerprint(key)
+
+    def get(self, key: Hashable) -> Any:
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value, expires_at FROM gloe_cache "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is not None and (row[1] is None or row[1] > now):
+                self.connection.execute(
+                    "UPDATE gloe_cache SET accessed_at = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+                self.hits += 1
+                return pickle.loads(row[0])
+
+            self.misses += 1
+            return _MISSING
+
+    def set(self, key: Hashable, value: Any):
+        payload = pickle.dumps(value)
+        now = time.time()
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = now + self.ttl
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO gloe_cache "
+                "(namespace, key, value, size, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, len(payload), now, expires_at),
+            )
+            if self.max_bytes is not None:
+                self._evict(self.max_bytes)
+
+    def _evict(self, max_bytes: int):
+        connection = self.connection
+        connection.execute(
+            "DELETE FROM gloe_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM gloe_cache"
+        ).fetchone()
+        if total <= max_bytes:
+            return
+
+        evicted = []
+        rows = connection.execute(
+            "SELECT namespace, key, size FROM gloe_cache ORDER BY accessed_at"
+        )
+        for namespace, key, size in rows:
+            if total <= max_bytes:
+                break
+            evicted.append((namespace, key))
+            total -= size
+
+        connection.executemany(
+            "DELETE FROM gloe_cache WHERE namespace = ? AND key = ?", evicted
+        )
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self.connection.execute(
+                "DELETE FROM gloe_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self):
+        with self._lock:
+            self.connection.execute(
+                "DELETE FROM gloe_cache WHERE namespace = ?", (self.namespace,)
+            )
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            (currsize,) = self.connection.execute(
+                "SELECT COUNT(*) FROM gloe_cache WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+            return CacheInfo(self.hits, self.misses, None, currsize)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
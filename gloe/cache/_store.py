@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Protocol
+
+__all__ = ["CacheInfo", "_MISSING", "_CacheStore", "_MemoryStore"]
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, like the ones of :code:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the lookups that were found in the cache."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class _CacheStore(Protocol):
+    def normalize_key(self, key: Any) -> Hashable: ...
+
+    def get(self, key: Hashable) -> Any: ...
+
+    def set(self, key: Hashable, value: Any): ...
+
+    def delete(self, key: Hashable): ...
+
+    def clear(self): ...
+
+    def info(self) -> CacheInfo: ...
+
+    def close(self): ...
+
+
+class _MemoryStore:
+    """
+    In-memory LRU store with optional expiration. It is thread-safe, so the cached
+    transformers can be executed in a pool of threads.
+    """
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float]):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("The maxsize must be greater than zero")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The ttl must be greater than zero")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def normalize_key(self, key: Any) -> Hashable:
+        return key
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return _MISSING
+
+    def set(self, key: Hashable, value: Any):
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def close(self):
+        pass
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the pickled copies, sent to worker processes for example, start empty
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,4 +1,15 @@
-__all__ = ["MapOver", "Map", "Filter", "MapOverAsync", "MapAsync", "FilterAsync"]
+__all__ = [
+    "MapOver",
+    "Map",
+    "Filter",
+    "MapOverAsync",
+    "MapAsync",
+    "FilterAsync",
+    "StreamMap",
+    "StreamFilter",
+    "AsyncStreamMap",
+    "AsyncStreamFilter",
+]
 
 from gloe.collection._mapover import MapOver
 from gloe.collection._map import Map
@@ -6,3 +17,7 @@ from gloe.collection._filter import Filter
 from gloe.collection._mapover_async import MapOverAsync
 from gloe.collection._map_async import MapAsync
 from gloe.collection._filter_async import FilterAsync
+from gloe.collection._stream_map import StreamMap
+from gloe.collection._stream_filter import StreamFilter
+from gloe.collection._async_stream_map import AsyncStreamMap
+from gloe.collection._async_stream_filter import AsyncStreamFilter
@@ -0,0 +1,79 @@
+from typing import AsyncIterable, AsyncIterator, Generic, Optional, TypeVar, Union
+
+from gloe import AsyncTransformer
+from gloe._plotting_utils import PlottingSettings, NodeType
+from gloe._streaming import _buffered
+from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
+
+_T = TypeVar("_T")
+
+
+class AsyncStreamFilter(
+    Generic[_T], AsyncTransformer[AsyncIterable[_T], AsyncIterator[_T]]
+):
+    """
+    Transformer used to filter the items of an async iterable. It returns an async
+    iterator that only checks each item when it is requested.
+
+    Example:
+        In this example, we consume the events of a queue and keep only the ones
+        related to payments.::
+
+            @transformer
+            def is_payment(event: Event) -> bool: ...
+
+            payment_events: AsyncTransformer[
+                AsyncIterable[Event], AsyncIterator[Event]
+            ] = AsyncStreamFilter(is_payment)
+    Args:
+        filter_transformer: sync or async transformer applied to each item of the input
+            async iterable to check if this item must be dropped or not.
+        buffer_size: if given, a background task checks up to :code:`buffer_size` items
+            ahead of the consumer. When the buffer is full, this stage stops pulling
+            items from the previous one until the consumer takes an item.
+    """
+
+    filter_transformer: _ChildTransformer[
+        Union[Transformer[_T, bool], AsyncTransformer[_T, bool]]
+    ] = _ChildTransformer()
+
+    def __init__(
+        self,
+        filter_transformer: Union[Transformer[_T, bool], AsyncTransformer[_T, bool]],
+        buffer_size: Optional[int] = None,
+    ):
+        super().__init__()
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("The buffer_size must be greater than zero")
+
+        self.buffer_size = buffer_size
+        self.plotting_settings.invisible = True
+        self._children = [filter_transformer]
+
+        self._plotting_settings: PlottingSettings = PlottingSettings(
+            has_children=True,
+            node_type=NodeType.Transformer,
+        )
+
+    async def _filter(self, data: AsyncIterable[_T]) -> AsyncIterator[_T]:
+        filter_transformer = self.filter_transformer
+        if isinstance(filter_transformer, AsyncTransformer):
+            async for item in data:
+                if await filter_transformer(item):
+                    yield item
+        else:
+            async for item in data:
+                if filter_transformer(item):
+                    yield item
+
+    async def transform_async(self, data: AsyncIterable[_T]) -> AsyncIterator[_T]:
+        """
+        Args:
+            data: incoming async iterable to be filtered. The items of this iterable
+                must be of type :code:`_T`.
+
+        Returns:
+            An async iterator with the items that passed the filter.
+        """
+        return _buffered(self._filter(data), self.buffer_size)
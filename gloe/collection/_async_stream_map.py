@@ -0,0 +1,79 @@
+from typing import AsyncIterable, AsyncIterator, Generic, Optional, TypeVar, Union
+
+from gloe import AsyncTransformer
+from gloe._streaming import _buffered
+from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
+
+_T = TypeVar("_T", contravariant=True)
+_U = TypeVar("_U", covariant=True)
+
+
+class AsyncStreamMap(
+    Generic[_T, _U], AsyncTransformer[AsyncIterable[_T], AsyncIterator[_U]]
+):
+    """
+    Transformer used to map the items of an async iterable, like a message consumer or
+    an async database cursor. It returns an async iterator that only maps each item when
+    it is requested, so unbounded streams can be processed with constant memory.
+
+    Example:
+        In this example, we consume the messages of a queue, parse them and save the
+        parsed events.::
+
+            @transformer
+            def parse_message(message: Message) -> Event: ...
+
+            @async_transformer
+            async def save_event(event: Event) -> Event: ...
+
+            ingest: AsyncTransformer[AsyncIterable[Message], AsyncIterator[Event]] = (
+                AsyncStreamMap(parse_message) >> AsyncStreamMap(save_event)
+            )
+
+            async for event in await ingest(consumer):
+                ...
+    Args:
+        mapping_transformer: sync or async transformer applied to each item of the
+            input async iterable to yield the mapped item of the output async iterator.
+        buffer_size: if given, a background task maps up to :code:`buffer_size` items
+            ahead of the consumer. When the buffer is full, this stage stops pulling
+            items from the previous one until the consumer takes an item.
+    """
+
+    mapping_transformer: _ChildTransformer[
+        Union[Transformer[_T, _U], AsyncTransformer[_T, _U]]
+    ] = _ChildTransformer()
+
+    def __init__(
+        self,
+        mapping_transformer: Union[Transformer[_T, _U], AsyncTransformer[_T, _U]],
+        buffer_size: Optional[int] = None,
+    ):
+        super().__init__()
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("The buffer_size must be greater than zero")
+
+        self.buffer_size = buffer_size
+        self.plotting_settings.has_children = True
+        self._children = [mapping_transformer]
+
+    async def _map(self, data: AsyncIterable[_T]) -> AsyncIterator[_U]:
+        mapping_transformer = self.mapping_transformer
+        if isinstance(mapping_transformer, AsyncTransformer):
+            async for item in data:
+                yield await mapping_transformer(item)
+        else:
+            async for item in data:
+                yield mapping_transformer(item)
+
+    async def transform_async(self, data: AsyncIterable[_T]) -> AsyncIterator[_U]:
+        """
+        Args:
+            data: incoming async iterable to be mapped. The items of this iterable must
+                be of type :code:`_T`.
+
+        Returns:
+            An async iterator with the mapped items, of type :code:`_U`.
+        """
+        return _buffered(self._map(data), self.buffer_size)
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from gloe.base_transformer import TransformerChildren
+from gloe.transformers import _is_batch_flow
+
+
+class _BatchMapping:
+    """
+    Mixin of the collections that map the items in batches when some node of the
+    mapping transformer supports it.
+    """
+
+    _children: TransformerChildren
+    _batch_flow: Optional[bool] = None
+
+    def _is_batch(self) -> bool:
+        # the nodes of the mapping transformer keep their classes, so the flow is
+        # only scanned once
+        if self._batch_flow is None:
+            self._batch_flow = _is_batch_flow(self._children[0]._flow)
+        return self._batch_flow
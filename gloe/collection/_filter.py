@@ -2,6 +2,7 @@ from typing import Generic, TypeVar, Iterable
 
 from gloe._plotting_utils import PlottingSettings, NodeType
 from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T")
 
@@ -25,9 +26,10 @@ class Filter(Generic[_T], Transformer[Iterable[_T], list[_T]]):
             check if this item must be dropped or not.
     """
 
+    filter_transformer: _ChildTransformer[Transformer[_T, bool]] = _ChildTransformer()
+
     def __init__(self, filter_transformer: Transformer[_T, bool]):
         super().__init__()
-        self.filter_transformer = filter_transformer
         self.plotting_settings.invisible = True
         self._children = [filter_transformer]
 
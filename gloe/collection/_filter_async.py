@@ -1,7 +1,10 @@
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, Optional
 
 from gloe import AsyncTransformer
+from gloe._concurrency import OnError, _check_concurrency, _run_concurrently
+from gloe.exceptions import CollectionItemsException
 from gloe._plotting_utils import PlottingSettings, NodeType
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T")
 
@@ -23,11 +26,29 @@ class FilterAsync(Generic[_T], AsyncTransformer[Iterable[_T], list[_T]]):
     Args:
         filter_transformer: async transformer applied to each item of the input iterable
         and check if this item must be dropped or not.
+        concurrency: maximum number of items transformed at the same time. The results
+            keep the order of the input items. If it is :code:`None`, all the items are
+            transformed at once. Defaults to one item at a time.
+        on_error: if :code:`"raise"`, the first error of an item is raised and the
+            pending items are cancelled. If :code:`"collect"`, all the items are
+            transformed and a :code:`CollectionItemsException` with the errors of the
+            failed items and the results of the other ones is raised at the end.
     """
 
-    def __init__(self, filter_transformer: AsyncTransformer[_T, bool]):
+    filter_transformer: _ChildTransformer[AsyncTransformer[_T, bool]] = (
+        _ChildTransformer()
+    )
+
+    def __init__(
+        self,
+        filter_transformer: AsyncTransformer[_T, bool],
+        concurrency: Optional[int] = 1,
+        on_error: OnError = "raise",
+    ):
         super().__init__()
-        self.filter_transformer = filter_transformer
+        _check_concurrency(concurrency, on_error)
+        self.concurrency = concurrency
+        self.on_error = on_error
         self.plotting_settings.invisible = True
         self._children = [filter_transformer]
 
@@ -45,9 +66,11 @@ class FilterAsync(Generic[_T], AsyncTransformer[Iterable[_T], list[_T]]):
         Returns:
             The filtered iterable.
         """
-        filtered_result = []
-        for item in data:
-            result = await self.filter_transformer(item)
-            if result:
-                filtered_result.append(item)
+        items = list(data)
+        checks, errors = await _run_concurrently(
+            self.filter_transformer, items, self.concurrency, self.on_error
+        )
+        filtered_result = [item for item, check in zip(items, checks) if check]
+        if len(errors) > 0:
+            raise CollectionItemsException(errors, filtered_result)
         return filtered_result
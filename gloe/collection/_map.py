@@ -1,12 +1,16 @@
-from typing import Generic, TypeVar, Iterable
+from itertools import islice
+from typing import Generic, TypeVar, Iterable, Optional
 
+from gloe._executors import ExecutorArg, _FlowExecutor
 from gloe.transformers import Transformer
+from gloe.collection._batch_mapping import _BatchMapping
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T", contravariant=True)
 _U = TypeVar("_U", covariant=True)
 
 
-class Map(Generic[_T, _U], Transformer[Iterable[_T], list[_U]]):
+class Map(_BatchMapping, Generic[_T, _U], Transformer[Iterable[_T], list[_U]]):
     """
     Transformer used to map values in an iterable using other transformers instead of
     functions.
@@ -25,13 +29,44 @@ class Map(Generic[_T, _U], Transformer[Iterable[_T], list[_U]]):
     Args:
         mapping_transformer: transformer applied to each item of the
             input iterable the yield the mapped item of the output iterable.
+        executor: if given, the items are mapped in a pool of :code:`"threads"` or
+            :code:`"processes"`, or in the given :code:`concurrent.futures.Executor`.
+            The pool is created on the first execution and reused by the next ones.
+            When using processes, the mapping transformer must be picklable, which is
+            the case for those created with decorators at the top level of a module.
+        max_workers: maximum number of workers of the pool created when the
+            :code:`executor` is given by its name.
+        chunksize: number of items sent to each task of the executor. Bigger chunks
+            reduce the communication overhead with the worker processes.
+        batch_size: maximum number of items transformed at once by the transformers
+            that support batches, like the ones created with
+            :code:`@transformer(batch=True)`. If it is :code:`None`, all the items are
+            transformed at once. When using an executor, each chunk is a batch.
     """
 
-    def __init__(self, mapping_transformer: Transformer[_T, _U]):
+    mapping_transformer: _ChildTransformer[Transformer[_T, _U]] = _ChildTransformer()
+
+    def __init__(
+        self,
+        mapping_transformer: Transformer[_T, _U],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+        batch_size: Optional[int] = None,
+    ):
         super().__init__()
-        self.mapping_transformer = mapping_transformer
+        if chunksize < 1:
+            raise ValueError("The chunksize must be greater than zero")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("The batch_size must be greater than zero")
+
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
+        self.chunksize = chunksize
+        self.batch_size = batch_size
+        self._executor: Optional[_FlowExecutor] = None
+        if executor is not None:
+            self._executor = _FlowExecutor(executor, max_workers=max_workers)
 
     def transform(self, data: Iterable[_T]) -> list[_U]:
         """
@@ -42,7 +77,42 @@ class Map(Generic[_T, _U], Transformer[Iterable[_T], list[_U]]):
         Returns:
             The mapped iterable. The items of this new iterable are of type :code:`_U`.
         """
+        if self._executor is not None:
+            return self._transform_in_executor(self._executor, data)
+
+        if self._is_batch():
+            return self._transform_in_batches(data)
+
         mapping_result = []
         for item in data:
             mapping_result.append(self.mapping_transformer(item))
         return mapping_result
+
+    def _transform_in_batches(self, data: Iterable[_T]) -> list[_U]:
+        if self.batch_size is None:
+            return self.mapping_transformer.map_batch(data)
+
+        items = iter(data)
+        mapping_result: list[_U] = []
+        batch = list(islice(items, self.batch_size))
+        while len(batch) > 0:
+            mapping_result.extend(self.mapping_transformer.map_batch(batch))
+            batch = list(islice(items, self.batch_size))
+        return mapping_result
+
+    def _transform_in_executor(
+        self, executor: _FlowExecutor, data: Iterable[_T]
+    ) -> list[_U]:
+        flow = self.mapping_transformer._flow
+        batch = self._is_batch()
+        items = iter(data)
+        futures = []
+        chunk = list(islice(items, self.chunksize))
+        while len(chunk) > 0:
+            futures.append(executor.submit_flow_chunk(flow, chunk, batch))
+            chunk = list(islice(items, self.chunksize))
+
+        mapping_result = []
+        for future in futures:
+            mapping_result.extend(future.result())
+        return mapping_result
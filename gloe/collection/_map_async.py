@@ -1,12 +1,24 @@
-from typing import Generic, TypeVar, Iterable
+from itertools import islice
+from typing import Generic, TypeVar, Iterable, Optional
 
 from gloe import AsyncTransformer
+from gloe._concurrency import (
+    OnError,
+    _check_concurrency,
+    _run_concurrently,
+    _successful_results,
+)
+from gloe.exceptions import CollectionItemsException
+from gloe.collection._batch_mapping import _BatchMapping
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T", contravariant=True)
 _U = TypeVar("_U", covariant=True)
 
 
-class MapAsync(Generic[_T, _U], AsyncTransformer[Iterable[_T], list[_U]]):
+class MapAsync(
+    _BatchMapping, Generic[_T, _U], AsyncTransformer[Iterable[_T], list[_U]]
+):
     """
     Transformer used to map values in an iterable using other async transformers instead
     of functions.
@@ -25,11 +37,39 @@ class MapAsync(Generic[_T, _U], AsyncTransformer[Iterable[_T], list[_U]]):
     Args:
         mapping_transformer: async transformer applied to each item of the
             input iterable the yield the mapped item of the output iterable.
+        concurrency: maximum number of items transformed at the same time. The results
+            keep the order of the input items. If it is :code:`None`, all the items are
+            transformed at once. Defaults to one item at a time.
+        on_error: if :code:`"raise"`, the first error of an item is raised and the
+            pending items are cancelled. If :code:`"collect"`, all the items are
+            transformed and a :code:`CollectionItemsException` with the errors of the
+            failed items and the results of the other ones is raised at the end.
+        batch_size: maximum number of items transformed at once by the transformers
+            that support batches, like the ones created with
+            :code:`@async_transformer(batch=True)`. If it is :code:`None`, all the items
+            are transformed at once. The batches are only used when :code:`on_error`
+            is :code:`"raise"`, since the errors of a batch can not be attributed to
+            its items.
     """
 
-    def __init__(self, mapping_transformer: AsyncTransformer[_T, _U]):
+    mapping_transformer: _ChildTransformer[AsyncTransformer[_T, _U]] = (
+        _ChildTransformer()
+    )
+
+    def __init__(
+        self,
+        mapping_transformer: AsyncTransformer[_T, _U],
+        concurrency: Optional[int] = 1,
+        on_error: OnError = "raise",
+        batch_size: Optional[int] = None,
+    ):
         super().__init__()
-        self.mapping_transformer = mapping_transformer
+        _check_concurrency(concurrency, on_error)
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("The batch_size must be greater than zero")
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.on_error = on_error
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
@@ -42,7 +82,28 @@ class MapAsync(Generic[_T, _U], AsyncTransformer[Iterable[_T], list[_U]]):
         Returns:
             The mapped iterable. The items of this new iterable are of type :code:`_U`.
         """
-        mapping_result = []
-        for item in data:
-            mapping_result.append(await self.mapping_transformer(item))
+        if self.on_error == "raise" and self._is_batch():
+            return await self._transform_in_batches(data)
+
+        mapping_result, errors = await _run_concurrently(
+            self.mapping_transformer, list(data), self.concurrency, self.on_error
+        )
+        if len(errors) > 0:
+            raise CollectionItemsException(
+                errors, _successful_results(mapping_result, errors)
+            )
+        return mapping_result
+
+    async def _transform_in_batches(self, data: Iterable[_T]) -> list[_U]:
+        if self.batch_size is None:
+            return await self.mapping_transformer.map_batch(data, self.concurrency)
+
+        items = iter(data)
+        mapping_result: list[_U] = []
+        batch = list(islice(items, self.batch_size))
+        while len(batch) > 0:
+            mapping_result.extend(
+                await self.mapping_transformer.map_batch(batch, self.concurrency)
+            )
+            batch = list(islice(items, self.batch_size))
         return mapping_result
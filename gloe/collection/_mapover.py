@@ -1,7 +1,8 @@
-from typing import Generic, Iterable, TypeVar
+from typing import Any, Generic, Iterable, TypeVar
 
 
 from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T")
 _S = TypeVar("_S")
@@ -9,6 +10,10 @@ _U = TypeVar("_U")
 
 
 class MapOver(Generic[_T, _U], Transformer[_T, list[_U]]):
+    mapping_transformer: _ChildTransformer[Transformer[tuple[_T, Any], _U]] = (
+        _ChildTransformer()
+    )
+
     def __init__(
         self,
         iterable: Iterable[_S],
@@ -16,7 +21,6 @@ class MapOver(Generic[_T, _U], Transformer[_T, list[_U]]):
     ):
         super().__init__()
         self.iterable = iterable
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
@@ -1,6 +1,14 @@
-from typing import Generic, Iterable, TypeVar
+from typing import Any, Generic, Iterable, Optional, TypeVar
 
 from gloe import AsyncTransformer
+from gloe._concurrency import (
+    OnError,
+    _check_concurrency,
+    _run_concurrently,
+    _successful_results,
+)
+from gloe.exceptions import CollectionItemsException
+from gloe.base_transformer import _ChildTransformer
 
 _T = TypeVar("_T")
 _S = TypeVar("_S")
@@ -8,20 +16,34 @@ _U = TypeVar("_U")
 
 
 class MapOverAsync(Generic[_T, _U], AsyncTransformer[_T, list[_U]]):
+    mapping_transformer: _ChildTransformer[AsyncTransformer[tuple[_T, Any], _U]] = (
+        _ChildTransformer()
+    )
+
     def __init__(
         self,
         iterable: Iterable[_S],
         mapping_transformer: AsyncTransformer[tuple[_T, _S], _U],
+        concurrency: Optional[int] = 1,
+        on_error: OnError = "raise",
     ):
         super().__init__()
+        _check_concurrency(concurrency, on_error)
+        self.concurrency = concurrency
+        self.on_error = on_error
         self.iterable = iterable
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
     async def transform_async(self, data: _T) -> list[_U]:
-        lopping_result = []
-        for item in self.iterable:
-            result = await self.mapping_transformer((data, item))
-            lopping_result.append(result)
+        lopping_result, errors = await _run_concurrently(
+            self.mapping_transformer,
+            [(data, item) for item in self.iterable],
+            self.concurrency,
+            self.on_error,
+        )
+        if len(errors) > 0:
+            raise CollectionItemsException(
+                errors, _successful_results(lopping_result, errors)
+            )
         return lopping_result
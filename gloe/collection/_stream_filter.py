@@ -0,0 +1,54 @@
+from typing import Generic, TypeVar, Iterable, Iterator
+
+from gloe._plotting_utils import PlottingSettings, NodeType
+from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
+
+_T = TypeVar("_T")
+
+
+class StreamFilter(Generic[_T], Transformer[Iterable[_T], Iterator[_T]]):
+    """
+    Lazy version of :code:`Filter`. Instead of building a list, it returns an iterator
+    that only checks each item when it is requested.
+
+    Since the items are only checked when the returned iterator is consumed, the errors
+    raised by the filter transformer are also only raised at that moment.
+
+    Example:
+        In this example, we read the users from a huge file and keep only the
+        administrators, without loading all the users in memory.::
+
+            @transformer
+            def is_admin(user: User) -> bool: ...
+
+            read_admin_users: Transformer[Path, Iterator[User]] = (
+                read_users >> StreamFilter(is_admin)
+            )
+    Args:
+        filter_transformer: transformer applied to each item of the input iterable and
+            check if this item must be dropped or not.
+    """
+
+    filter_transformer: _ChildTransformer[Transformer[_T, bool]] = _ChildTransformer()
+
+    def __init__(self, filter_transformer: Transformer[_T, bool]):
+        super().__init__()
+        self.plotting_settings.invisible = True
+        self._children = [filter_transformer]
+
+        self._plotting_settings: PlottingSettings = PlottingSettings(
+            has_children=True,
+            node_type=NodeType.Transformer,
+        )
+
+    def transform(self, data: Iterable[_T]) -> Iterator[_T]:
+        """
+        Args:
+            data: incoming iterable to be filtered. The items of this iterable must be
+                of type :code:`_T`.
+
+        Returns:
+            An iterator with the items that passed the filter.
+        """
+        return filter(self.filter_transformer, data)
@@ -0,0 +1,50 @@
+from typing import Generic, TypeVar, Iterable, Iterator
+
+from gloe.transformers import Transformer
+from gloe.base_transformer import _ChildTransformer
+
+_T = TypeVar("_T", contravariant=True)
+_U = TypeVar("_U", covariant=True)
+
+
+class StreamMap(Generic[_T, _U], Transformer[Iterable[_T], Iterator[_U]]):
+    """
+    Lazy version of :code:`Map`. Instead of building a list, it returns an iterator
+    that only maps each item when it is requested. So, consecutive stream transformers
+    process one item at a time and never hold the whole collection in memory.
+
+    Since the items are only mapped when the returned iterator is consumed, the errors
+    raised by the mapping transformer are also only raised at that moment.
+
+    Example:
+        In this example, the rows of a huge file are parsed and validated one at a
+        time.::
+
+            @transformer
+            def parse_row(row: str) -> Record: ...
+
+            read_records: Transformer[Path, Iterator[Record]] = (
+                read_rows >> StreamMap(parse_row) >> StreamFilter(is_valid)
+            )
+    Args:
+        mapping_transformer: transformer applied to each item of the
+            input iterable the yield the mapped item of the output iterator.
+    """
+
+    mapping_transformer: _ChildTransformer[Transformer[_T, _U]] = _ChildTransformer()
+
+    def __init__(self, mapping_transformer: Transformer[_T, _U]):
+        super().__init__()
+        self.plotting_settings.has_children = True
+        self._children = [mapping_transformer]
+
+    def transform(self, data: Iterable[_T]) -> Iterator[_U]:
+        """
+        Args:
+            data: incoming iterable to be mapped. The items of this iterable must be of
+                type :code:`_T`.
+
+        Returns:
+            An iterator with the mapped items, of type :code:`_U`.
+        """
+        return map(self.mapping_transformer, data)
@@ -7,12 +7,21 @@ from typing_extensions import ParamSpec
 
 from gloe.exceptions import UnsupportedEnsurerArgException
 from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import BaseTransformer
 from gloe.transformers import Transformer
 
 _T = TypeVar("_T")
 _S = TypeVar("_S")
 _U = TypeVar("_U")
 _P1 = ParamSpec("_P1")
+_Node = TypeVar("_Node", bound=BaseTransformer)
+
+
+def _ensured_copy(node: _Node, transform: Callable) -> _Node:
+    ensured = node.copy(transform)
+    # the production plans can skip the validations by executing the original node
+    ensured._unensured = node
+    return ensured
 
 
 class TransformerEnsurer(Generic[_T, _S], ABC):
@@ -130,7 +139,7 @@ class _ensure_base:
                     ensurer.validate_output(data, output)
                 return output
 
-            return transformer.copy(transform)
+            return _ensured_copy(transformer, transform)
 
         if isinstance(first_node, Transformer) and (
             len(self.input_ensurers_instances) > 0
@@ -144,7 +153,10 @@ class _ensure_base:
                 self._input_data = data
                 return output
 
-            transformer._flow[0] = first_node.copy(transform)
+            transformer._flow = [
+                _ensured_copy(first_node, transform),
+                *transformer._flow[1:],
+            ]
 
         if (
             isinstance(last_node, Transformer)
@@ -157,7 +169,10 @@ class _ensure_base:
                     ensurer.validate_output(self._input_data, output)
                 return output
 
-            transformer._flow[-1] = last_node.copy(transform)
+            transformer._flow = [
+                *transformer._flow[:-1],
+                _ensured_copy(last_node, transform),
+            ]
 
         return transformer
 
@@ -178,7 +193,7 @@ class _ensure_base:
                     ensurer.validate_output(data, output)
                 return output
 
-            return transformer.copy(transform_async)
+            return _ensured_copy(transformer, transform_async)
 
         if (
             len(self.input_ensurers_instances) > 0
@@ -193,7 +208,10 @@ class _ensure_base:
                     self._input_data = data
                     return output
 
-                transformer._flow[0] = first_node.copy(transform_async)
+                transformer._flow = [
+                    _ensured_copy(first_node, transform_async),
+                    *transformer._flow[1:],
+                ]
             elif isinstance(first_node, Transformer):
 
                 def transform(_, data):
@@ -203,7 +221,10 @@ class _ensure_base:
                     self._input_data = data
                     return output
 
-                transformer._flow[0] = first_node.copy(transform)
+                transformer._flow = [
+                    _ensured_copy(first_node, transform),
+                    *transformer._flow[1:],
+                ]
 
         if len(self.output_ensurers_instances) > 0:
             if isinstance(last_node, AsyncTransformer):
@@ -214,7 +235,10 @@ class _ensure_base:
                         ensurer.validate_output(self._input_data, output)
                     return output
 
-                transformer._flow[-1] = last_node.copy(transform_async)
+                transformer._flow = [
+                    *transformer._flow[:-1],
+                    _ensured_copy(last_node, transform_async),
+                ]
 
             elif isinstance(last_node, Transformer):
 
@@ -224,7 +248,10 @@ class _ensure_base:
                         ensurer.validate_output(self._input_data, output)
                     return output
 
-                transformer._flow[-1] = last_node.copy(transform)
+                transformer._flow = [
+                    *transformer._flow[:-1],
+                    _ensured_copy(last_node, transform),
+                ]
 
         return transformer
 
@@ -16,3 +16,25 @@ class UnsupportedEnsurerArgException(Exception):
 class TransformerRequiresMultiArgs(Exception):
     def __init__(self):
         super().__init__("The transformer requires multiple arguments")
+
+
+class UnsupportedExecutorArgException(Exception):
+    def __init__(self, arg: Any):
+        super().__init__(f"Unsupported executor argument: {arg}")
+
+
+class CollectionItemsException(Exception):
+    """
+    Raised by the async collection transformers when they collect the errors of the
+    items instead of failing on the first one.
+
+    Attributes:
+        errors: the exception raised by each failed item, indexed by the position of
+            the item in the input iterable.
+        results: the result of the collection transformer ignoring the failed items.
+    """
+
+    def __init__(self, errors: dict[int, Exception], results: list[Any]):
+        self.errors = errors
+        self.results = results
+        super().__init__(f"{len(errors)} items of the collection failed")
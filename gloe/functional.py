@@ -1,11 +1,29 @@
+import importlib
 import inspect
+import pickle
+import uuid
 from inspect import Signature
 from types import FunctionType
-from typing import Callable, TypeVar, cast, Awaitable, overload
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Literal,
+    Sequence,
+    TypeVar,
+    cast,
+    Awaitable,
+    overload,
+    Optional,
+    get_args,
+)
 
 from typing_extensions import Concatenate, TypeVarTuple, Unpack, ParamSpec
 
+from gloe._streaming import _buffered
 from gloe.async_transformer import AsyncTransformer, MultiArgsAsyncTransformer
+from gloe.base_transformer import BaseTransformer
 from gloe.exceptions import TransformerRequiresMultiArgs
 from gloe.transformers import Transformer, MultiArgsTransformer
 
@@ -14,6 +32,7 @@ __all__ = [
     "partial_transformer",
     "async_transformer",
     "partial_async_transformer",
+    "stream_transformer",
 ]
 
 A = TypeVar("A")
@@ -23,6 +42,110 @@ P1 = ParamSpec("P1")
 P2 = ParamSpec("P2")
 
 
+def _lookup_reference(module_name: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _load_transformer(
+    module_name: str,
+    qualname: str,
+    instance_id: uuid.UUID,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict[str, Any]] = None,
+) -> BaseTransformer:
+    obj = _lookup_reference(module_name, qualname)
+    if args is not None:
+        partial_transformer = obj(*args, **(kwargs or {}))
+        partial_transformer.instance_id = instance_id
+        return partial_transformer
+
+    transformer = cast(BaseTransformer, obj)
+    if transformer.instance_id != instance_id:
+        transformer = transformer.copy()
+        transformer.instance_id = instance_id
+    return transformer
+
+
+def _reduce_by_reference(
+    transformer: BaseTransformer,
+    func: Callable,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict[str, Any]] = None,
+) -> tuple[Callable, tuple]:
+    """
+    Transformers created by decorators are defined inside closures, so they are pickled
+    as a reference to the decorated object in its module, plus the arguments of the
+    partial application, if any. The reference is checked when pickling, so a
+    transformer that is not bound to the name of its function can't be pickled.
+    """
+    module_name = func.__module__
+    qualname = func.__qualname__
+    if "<locals>" in qualname:
+        raise pickle.PicklingError(
+            f"The transformer {func.__name__} can not be pickled because it is not "
+            "defined at the top level of a module"
+        )
+
+    try:
+        referenced = _lookup_reference(module_name, qualname)
+    except (ImportError, AttributeError):
+        referenced = None
+
+    # the decorated function must be replaced by the transformer (or by the partial
+    # transformer factory) in its module, otherwise the reference can't be loaded
+    if args is None:
+        is_reference = type(referenced) is type(transformer)
+    else:
+        is_reference = callable(referenced) and referenced is not func
+    if not is_reference:
+        raise pickle.PicklingError(
+            f"The transformer {func.__name__} can not be pickled because it is not "
+            f"the object named {qualname} in the module {module_name}"
+        )
+
+    if args is None:
+        for method in ["transform", "transform_async"]:
+            if method in transformer.__dict__ and method not in referenced.__dict__:
+                raise pickle.PicklingError(
+                    f"The transformer {func.__name__} can not be pickled because its "
+                    f"{method} method was replaced (by an ensurer, for example)"
+                )
+
+    return _load_transformer, (
+        module_name,
+        qualname,
+        transformer.instance_id,
+        args,
+        kwargs,
+    )
+
+
+def _batch_item_signature(func_signature: Signature) -> Signature:
+    """
+    The signature of a batch transformer is the signature of a single item, so the
+    types are taken from the items of the sequences received and returned by the
+    decorated function.
+    """
+
+    def item_annotation(annotation: Any) -> Any:
+        args = get_args(annotation)
+        if len(args) == 1:
+            return args[0]
+        return annotation
+
+    parameters = [
+        parameter.replace(annotation=item_annotation(parameter.annotation))
+        for parameter in func_signature.parameters.values()
+    ]
+    return func_signature.replace(
+        parameters=parameters,
+        return_annotation=item_annotation(func_signature.return_annotation),
+    )
+
+
 def partial_transformer(
     func: Callable[Concatenate[A, P1], S],
 ) -> Callable[P1, Transformer[A, S]]:
@@ -76,6 +199,9 @@ def partial_transformer(
             def transform(self, data: A) -> S:
                 return func(data, *args, **kwargs)
 
+            def __reduce__(self):
+                return _reduce_by_reference(self, func, args, kwargs)
+
         lambda_transformer = LambdaTransformer()
         lambda_transformer.__class__.__name__ = func.__name__
         lambda_transformer._label = func.__name__
@@ -139,6 +265,9 @@ def partial_async_transformer(
             async def transform_async(self, data: A) -> S:
                 return await func(data, *args, **kwargs)
 
+            def __reduce__(self):
+                return _reduce_by_reference(self, func, args, kwargs)
+
         lambda_transformer = LambdaTransformer()
         lambda_transformer.__class__.__name__ = func.__name__
         lambda_transformer._label = func.__name__
@@ -170,7 +299,14 @@ def transformer(func: Callable[[A], S]) -> Transformer[A, S]:
     pass
 
 
-def transformer(func):
+@overload
+def transformer(
+    *, batch: Literal[True]
+) -> Callable[[Callable[[list[A]], Sequence[S]]], Transformer[A, S]]:
+    pass
+
+
+def transformer(func=None, *, batch=False):
     """
     Convert a callable to an instance of the Transformer class.
 
@@ -183,13 +319,30 @@ def transformer(func):
 
             subscribed_users = filter_subscribed_users(users_list)
 
+        With :code:`batch=True`, the callable receives a list of items and returns the
+        outcome of each one. The transformer still transforms a single item when it is
+        called, but :code:`Map` and :code:`map_batch()` call the function once for
+        many items::
+
+            @transformer(batch=True)
+            def score(rows: list[Features]) -> Sequence[float]:
+                return model.predict(np.array(rows))
+
+            scores = Map(score)(rows)
+
     Args:
         func: A callable with only positional arguments and returns a result. The
             callable should return an instance of the generic type :code:`S` specified.
+        batch: if :code:`True`, the callable transforms a batch of items at once.
     Returns:
         An instance of the Transformer class, encapsulating the transformation logic
         defined in the provided callable.
     """
+    if func is None:
+        return _batch_transformer if batch else transformer
+    if batch:
+        return _batch_transformer(func)
+
     func_signature = inspect.signature(func)
 
     if len(func_signature.parameters) > 1:
@@ -208,6 +361,9 @@ def transformer(func):
                     return func(*data)
                 raise NotImplementedError()  # pragma: no cover
 
+            def __reduce__(self):
+                return _reduce_by_reference(self, func)
+
         lambda_transformer1 = LambdaMultiArgsTransformer()
         lambda_transformer1.__class__.__name__ = func.__name__
         lambda_transformer1._label = func.__name__
@@ -225,12 +381,46 @@ def transformer(func):
                 return func()
             return func(data)
 
+        def __reduce__(self):
+            return _reduce_by_reference(self, func)
+
     lambda_transformer2 = LambdaTransformer()
     lambda_transformer2.__class__.__name__ = func.__name__
     lambda_transformer2._label = func.__name__
     return lambda_transformer2
 
 
+def _batch_transformer(
+    func: Callable[[list[A]], Sequence[S]],
+) -> Transformer[A, S]:
+    item_signature = _batch_item_signature(inspect.signature(func))
+
+    class LambdaBatchTransformer(Transformer):
+        __doc__ = func.__doc__
+        __annotations__ = cast(FunctionType, func).__annotations__
+
+        def signature(self) -> Signature:
+            return item_signature
+
+        def transform(self, data):
+            return func([data])[0]
+
+        def transform_batch(self, data):
+            # the ensurers replace the transform method, so the items must be
+            # transformed one by one to be validated
+            if "transform" in self.__dict__:
+                return super().transform_batch(data)
+            return list(func(data))
+
+        def __reduce__(self):
+            return _reduce_by_reference(self, func)
+
+    lambda_transformer = LambdaBatchTransformer()
+    lambda_transformer.__class__.__name__ = func.__name__
+    lambda_transformer._label = func.__name__
+    return lambda_transformer
+
+
 @overload
 def async_transformer(
     func: Callable[[A, B, Unpack[Rest]], Awaitable[S]],
@@ -248,7 +438,14 @@ def async_transformer(func: Callable[[A], Awaitable[S]]) -> AsyncTransformer[A,
     pass
 
 
-def async_transformer(func):
+@overload
+def async_transformer(
+    *, batch: Literal[True]
+) -> Callable[[Callable[[list[A]], Awaitable[Sequence[S]]]], AsyncTransformer[A, S]]:
+    pass
+
+
+def async_transformer(func=None, *, batch=False):
     """
     Convert a callable to an instance of the AsyncTransformer class.
 
@@ -264,12 +461,25 @@ def async_transformer(func):
 
             await get_user_by_role("admin")
 
+        With :code:`batch=True`, the callable receives a list of items and returns the
+        outcome of each one, like a bulk request::
+
+            @async_transformer(batch=True)
+            async def get_users(user_ids: list[int]) -> list[User]:
+                ...
+
     Args:
         func: A callable with only positional arguments and returns a coroutine.
+        batch: if :code:`True`, the callable transforms a batch of items at once.
     Returns:
         Returns an instance of the AsyncTransformer class, representing the built async
         transformer.
     """
+    if func is None:
+        return _batch_async_transformer if batch else async_transformer
+    if batch:
+        return _batch_async_transformer(func)
+
     func_signature = inspect.signature(func)
 
     if len(func_signature.parameters) > 1:
@@ -288,6 +498,9 @@ def async_transformer(func):
                     return await func(*data)
                 raise NotImplementedError()  # pragma: no cover
 
+            def __reduce__(self):
+                return _reduce_by_reference(self, func)
+
         lambda_transformer1 = LambdaMultiArgsTransformer()
         lambda_transformer1.__class__.__name__ = func.__name__
         lambda_transformer1._label = func.__name__
@@ -305,7 +518,119 @@ def async_transformer(func):
                 return await func()
             return await func(data)
 
+        def __reduce__(self):
+            return _reduce_by_reference(self, func)
+
     lambda_transformer = LambdaAsyncTransformer()
     lambda_transformer.__class__.__name__ = func.__name__
     lambda_transformer._label = func.__name__
     return lambda_transformer
+
+
+def _batch_async_transformer(
+    func: Callable[[list[A]], Awaitable[Sequence[S]]],
+) -> AsyncTransformer[A, S]:
+    item_signature = _batch_item_signature(inspect.signature(func))
+
+    class LambdaBatchAsyncTransformer(AsyncTransformer):
+        __doc__ = func.__doc__
+        __annotations__ = cast(FunctionType, func).__annotations__
+
+        def signature(self) -> Signature:
+            return item_signature
+
+        async def transform_async(self, data):
+            return (await func([data]))[0]
+
+        async def transform_batch_async(self, data, concurrency=1):
+            # the ensurers replace the transform_async method, so the items must be
+            # transformed one by one to be validated
+            if "transform_async" in self.__dict__:
+                return await super().transform_batch_async(data, concurrency)
+            return list(await func(data))
+
+        def __reduce__(self):
+            return _reduce_by_reference(self, func)
+
+    lambda_transformer = LambdaBatchAsyncTransformer()
+    lambda_transformer.__class__.__name__ = func.__name__
+    lambda_transformer._label = func.__name__
+    return lambda_transformer
+
+
+@overload
+def stream_transformer(
+    func: Callable[[AsyncIterable[A]], AsyncIterator[S]],
+) -> AsyncTransformer[AsyncIterable[A], AsyncIterator[S]]:
+    pass
+
+
+@overload
+def stream_transformer(*, buffer_size: Optional[int] = None) -> Callable[
+    [Callable[[AsyncIterable[A]], AsyncIterator[S]]],
+    AsyncTransformer[AsyncIterable[A], AsyncIterator[S]],
+]:
+    pass
+
+
+def stream_transformer(func=None, *, buffer_size=None):
+    """
+    Convert an async generator function, which receives an async iterable and yields
+    the transformed items, to an async transformer. The transformer returns the async
+    iterator without consuming it, so it can be composed with other stream
+    transformers, like :code:`AsyncStreamMap` and :code:`AsyncStreamFilter`, and each
+    stage pulls the items from the previous one.
+
+    Example:
+        Splitting a stream of messages into a stream of events::
+
+            @stream_transformer
+            async def to_events(
+                messages: AsyncIterable[Message],
+            ) -> AsyncIterator[Event]:
+                async for message in messages:
+                    for event in message.events:
+                        yield event
+
+            ingest = to_events >> AsyncStreamMap(save_event)
+
+            async for saved in await ingest(consumer):
+                ...
+
+    Args:
+        func: an async generator function with a single argument, the incoming async
+            iterable.
+        buffer_size: if given, a background task pulls up to :code:`buffer_size` items
+            from the generator ahead of the consumer. When the buffer is full, the
+            generator is paused until the consumer takes an item.
+    Returns:
+        Returns an instance of the AsyncTransformer class, representing the built stream
+        transformer.
+    """
+    if func is None:
+        return lambda _func: _build_stream_transformer(_func, buffer_size)
+    return _build_stream_transformer(func, buffer_size)
+
+
+def _build_stream_transformer(
+    func: Callable[[AsyncIterable[A]], AsyncIterator[S]], buffer_size: Optional[int]
+) -> AsyncTransformer[AsyncIterable[A], AsyncIterator[S]]:
+    func_signature = inspect.signature(func)
+
+    class LambdaStreamTransformer(AsyncTransformer):
+        __doc__ = func.__doc__
+        __annotations__ = cast(FunctionType, func).__annotations__
+
+        def signature(self) -> Signature:
+            return func_signature
+
+        async def transform_async(self, data):
+            return _buffered(func(data), buffer_size)
+
+        def __reduce__(self):
+            return _reduce_by_reference(self, func)
+
+    lambda_transformer = LambdaStreamTransformer()
+    lambda_transformer.__class__.__name__ = func.__name__
+    lambda_transformer._label = func.__name__
+    return lambda_transformer
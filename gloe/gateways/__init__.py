@@ -1,4 +1,5 @@
+from gloe._executors import set_default_executor, shutdown_executors
 from gloe.gateways._parallel import parallel
 from gloe.gateways._sequential import sequential
 
-__all__ = ["parallel", "sequential"]
+__all__ = ["parallel", "sequential", "set_default_executor", "shutdown_executors"]
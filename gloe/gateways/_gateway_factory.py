@@ -1,7 +1,8 @@
-from typing import overload, TypeVar, Callable, cast
+from typing import overload, TypeVar, Callable, Optional, cast
 
 from typing_extensions import Protocol, TypeAlias as Ta, Unpack
 
+from gloe._executors import ExecutorArg
 from gloe.async_transformer import AsyncTransformer
 from gloe.base_transformer import BaseTransformer
 from gloe.transformers import Transformer
@@ -281,5 +282,311 @@ class _GatewayFactory(Protocol):
         pass
 
 
+class _ParallelGatewayFactory(Protocol):
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T2[_I, O1, O2]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T2A1[_I, O1, O2]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T2A2[_I, O1, O2]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T3[_I, O1, O2, O3]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2, O3]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T3A1[_I, O1, O2, O3]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T3A2[_I, O1, O2, O3]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T3A3[_I, O1, O2, O3]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T4[_I, O1, O2, O3, O4]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2, O3, O4]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T4A1[_I, O1, O2, O3, O4]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T4A2[_I, O1, O2, O3, O4]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T4A3[_I, O1, O2, O3, O4]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T4A4[_I, O1, O2, O3, O4]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5A1[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5A2[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5A3[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5A4[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T5A5[_I, O1, O2, O3, O4, O5]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A1[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A2[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A3[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A4[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A5[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T6A6[_I, O1, O2, O3, O4, O5, O6]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> Transformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A1[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A2[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A3[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A4[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A5[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A6[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    @overload
+    def __call__(
+        self,
+        *args: Unpack[T7A7[_I, O1, O2, O3, O4, O5, O6, O7]],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
+        pass
+
+    def __call__(self, *args, executor=None, max_workers=None):  # pragma: no cover
+        pass
+
+
 def _gateway_factory(func: Callable) -> _GatewayFactory:
     return cast(_GatewayFactory, func)
+
+
+def _parallel_gateway_factory(func: Callable) -> _ParallelGatewayFactory:
+    return cast(_ParallelGatewayFactory, func)
@@ -1,12 +1,13 @@
 import asyncio
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from typing_extensions import TypeAlias
 
+from gloe._executors import ExecutorArg, _FlowExecutor, _get_default_executor
 from gloe.async_transformer import AsyncTransformer, _execute_async_flow
 from gloe.base_transformer import BaseTransformer
 from gloe.gateways._base_gateway import _base_gateway
-from gloe.gateways._gateway_factory import _gateway_factory
+from gloe.gateways._gateway_factory import _parallel_gateway_factory
 from gloe.transformers import Transformer, _execute_flow
 
 _In = TypeVar("_In")
@@ -18,7 +19,27 @@ ATrf: TypeAlias = AsyncTransformer
 
 
 class _Parallel(_base_gateway[_In], Transformer[_In, tuple[Any, ...]]):
+    def __init__(
+        self,
+        *transformers: BaseTransformer[_In, Any],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ):
+        super().__init__(*transformers)
+        self._executor: Optional[_FlowExecutor] = None
+        if executor is not None:
+            self._executor = _FlowExecutor(
+                executor, max_workers=max_workers or len(transformers)
+            )
+
     def transform(self, data: _In) -> tuple[Any, ...]:
+        if self._executor is not None:
+            futures = [
+                self._executor.submit_flow(transformer._flow, data)
+                for transformer in self._children
+            ]
+            return tuple(future.result() for future in futures)
+
         results = []
         for transformer in self._children:
             result = _execute_flow(transformer._flow, data)
@@ -27,7 +48,35 @@ class _Parallel(_base_gateway[_In], Transformer[_In, tuple[Any, ...]]):
 
 
 class _ParallelAsync(_base_gateway[_In], AsyncTransformer[_In, tuple[Any, ...]]):
+    def __init__(
+        self,
+        *transformers: BaseTransformer[_In, Any],
+        executor: Optional[ExecutorArg] = None,
+        max_workers: Optional[int] = None,
+    ):
+        super().__init__(*transformers)
+        self._executor: Optional[_FlowExecutor] = None
+        if executor is not None:
+            self._executor = _FlowExecutor(
+                executor, max_workers=max_workers or len(transformers)
+            )
+
     async def transform_async(self, data: _In) -> tuple[Any, ...]:
+        executor = self._executor or _get_default_executor()
+        if executor is not None:
+            return tuple(
+                await asyncio.gather(
+                    *[
+                        (
+                            _execute_async_flow(child._flow, data)
+                            if isinstance(child, AsyncTransformer)
+                            else executor.run_flow_async(child._flow, data)
+                        )
+                        for child in self._children
+                    ]
+                )
+            )
+
         results = [None] * len(self._children)
         indexed_children = list(enumerate(self._children))
 
@@ -56,15 +105,44 @@ class _ParallelAsync(_base_gateway[_In], AsyncTransformer[_In, tuple[Any, ...]])
         return tuple(results)
 
 
-@_gateway_factory
-def parallel(*transformers: BaseTransformer) -> Union[Transformer, AsyncTransformer]:
+@_parallel_gateway_factory
+def parallel(
+    *transformers: BaseTransformer,
+    executor: Optional[ExecutorArg] = None,
+    max_workers: Optional[int] = None,
+) -> Union[Transformer, AsyncTransformer]:
     """
-    Currently, the parallelism of transformers is supported only by executing async
-    transformers concurrently.
+    Execute the transformers concurrently. By default, only async transformers are
+    executed concurrently. The branches with sync transformers can also run
+    concurrently in a pool of threads or processes, by passing the :code:`executor`
+    argument. When some branch is async, the sync branches are then executed in the
+    pool together with the async ones, without blocking the event loop.
+
+    Example:
+        Fetching the posts and the friends of a user, each one in a thread::
+
+            get_posts_and_friends = get_user_by_id >> parallel(
+                fetch_user_posts,
+                fetch_user_friends,
+                executor="threads",
+            )
 
     Args:
         *transformers (Sequence[Transformer | AsyncTransformer]): the list of
             transformers what will receive the same input.
+        executor (Executor | Literal["threads", "processes"] | None): where the sync
+            branches are executed. If it is :code:`"threads"` or :code:`"processes"`,
+            a pool of threads or processes is created on the first execution and
+            reused by the next ones. An instance of :code:`concurrent.futures.Executor`
+            can also be given. The default value :code:`None` executes the sync
+            branches one after the other, or in the executor defined by
+            :code:`gloe.gateways.set_default_executor()` if some branch is async.
+            When using processes, the transformers of the branches must be
+            picklable, which is the case for those created with decorators at the
+            top level of a module.
+        max_workers (int | None): maximum number of workers of the pool created when
+            the :code:`executor` is given by its name. Defaults to the number of
+            branches.
 
     Returns:
         Union[Transformer, AsyncTransformer]: a transformer that will execute all the
@@ -74,5 +152,5 @@ def parallel(*transformers: BaseTransformer) -> Union[Transformer, AsyncTransfor
             is sync.
     """
     if any(isinstance(t, AsyncTransformer) for t in transformers):
-        return _ParallelAsync(*transformers)
-    return _Parallel(*transformers)
+        return _ParallelAsync(*transformers, executor=executor, max_workers=max_workers)
+    return _Parallel(*transformers, executor=executor, max_workers=max_workers)
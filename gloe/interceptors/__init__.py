@@ -0,0 +1,8 @@
+from gloe.interceptors._interceptor import (
+    Interceptor,
+    add_interceptor,
+    remove_interceptor,
+    intercepting,
+)
+
+__all__ = ["Interceptor", "add_interceptor", "remove_interceptor", "intercepting"]
@@ -0,0 +1,183 @@
+import threading
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from typing_extensions import Self
+
+from gloe.base_transformer import BaseTransformer
+
+__all__ = [
+    "Interceptor",
+    "add_interceptor",
+    "remove_interceptor",
+    "intercepting",
+]
+
+_Invoke = Callable[[BaseTransformer, Callable[[Any], Any], Any], Any]
+_AsyncInvoke = Callable[
+    [BaseTransformer, Callable[[Any], Awaitable[Any]], Any], Awaitable[Any]
+]
+
+
+class Interceptor:
+    """
+    Wraps the invocation of every node of the pipelines, like a middleware. It can be
+    used for metrics, logging, retries or caching.
+
+    The :code:`intercept` method wraps the sync nodes, and the :code:`intercept_async`
+    method wraps the async ones. The :code:`intercept_pipeline` and
+    :code:`intercept_pipeline_async` methods wrap the calls of whole pipelines, which
+    includes the pipelines nested in gateways and collections. By default, they just
+    call the next interceptor of the chain, or the node itself. Only the overridden
+    methods are added to the chain.
+
+    An interceptor is also a context manager, which adds it inside the :code:`with`
+    block.
+
+    Example:
+        Logging the input of each node::
+
+            class LogInputs(Interceptor):
+                def intercept(self, node, data, call_next):
+                    logger.info("%s received %r", node.label, data)
+                    return call_next(data)
+
+            add_interceptor(LogInputs())
+    """
+
+    def intercept(
+        self, node: BaseTransformer, data: Any, call_next: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Args:
+            node: the transformer being invoked.
+            data: the input of the node. When the node transforms a whole batch at
+                once, like in :code:`map_batch()`, it is the list of items.
+            call_next: function that invokes the rest of the chain with the given
+                input. It is not required to call it, so an interceptor can return
+                another result, short-circuiting the node.
+
+        Returns:
+            The output of the node.
+        """
+        return call_next(data)
+
+    async def intercept_async(
+        self,
+        node: BaseTransformer,
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """Async version of :code:`intercept`, used for the async nodes."""
+        return await call_next(data)
+
+    def intercept_pipeline(
+        self, pipeline: BaseTransformer, data: Any, call_next: Callable[[Any], Any]
+    ) -> Any:
+        """Same as :code:`intercept`, but wrapping a sync pipeline."""
+        return call_next(data)
+
+    async def intercept_pipeline_async(
+        self,
+        pipeline: BaseTransformer,
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """Same as :code:`intercept_async`, but wrapping an async pipeline."""
+        return await call_next(data)
+
+    def start(self):
+        """Add this interceptor to the chain, if it is not there yet."""
+        remove_interceptor(self)
+        add_interceptor(self)
+
+    def stop(self):
+        """Remove this interceptor from the chain."""
+        remove_interceptor(self)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ):
+        self.stop()
+
+
+_lock = threading.Lock()
+_interceptors: tuple[Interceptor, ...] = ()
+
+# the chains are rebuilt when the interceptors change, and the transformers only check
+# if they are set, so there is no overhead while no interceptor is added
+_chain: Optional[_Invoke] = None
+_async_chain: Optional[_AsyncInvoke] = None
+_pipeline_chain: Optional[_Invoke] = None
+_async_pipeline_chain: Optional[_AsyncInvoke] = None
+
+
+def _wrap(intercept: Callable[..., Any], next_invoke: _Invoke) -> _Invoke:
+    def invoke(node: BaseTransformer, transform: Callable[[Any], Any], data: Any):
+        return intercept(node, data, lambda value: next_invoke(node, transform, value))
+
+    return invoke
+
+
+def _call_node(node: BaseTransformer, transform: Callable[[Any], Any], data: Any):
+    return transform(data)
+
+
+def _build_chain(
+    interceptors: tuple[Interceptor, ...], method_name: str
+) -> Optional[_Invoke]:
+    chain: Optional[_Invoke] = None
+    default_method = getattr(Interceptor, method_name)
+    for interceptor in reversed(interceptors):
+        if getattr(type(interceptor), method_name) is not default_method:
+            chain = _wrap(getattr(interceptor, method_name), chain or _call_node)
+    return chain
+
+
+def _build_chains(interceptors: tuple[Interceptor, ...]):
+    global _chain, _async_chain, _pipeline_chain, _async_pipeline_chain
+
+    # the async chains return the awaitables of the async interceptors
+    _chain = _build_chain(interceptors, "intercept")
+    _async_chain = _build_chain(interceptors, "intercept_async")
+    _pipeline_chain = _build_chain(interceptors, "intercept_pipeline")
+    _async_pipeline_chain = _build_chain(interceptors, "intercept_pipeline_async")
+
+
+def add_interceptor(interceptor: Interceptor):
+    """
+    Add an interceptor to the invocation of all the nodes. The interceptors added first
+    are the outermost ones.
+    """
+    global _interceptors
+    with _lock:
+        _interceptors = (*_interceptors, interceptor)
+        _build_chains(_interceptors)
+
+
+def remove_interceptor(interceptor: Interceptor):
+    """Remove a previously added interceptor. Unknown interceptors are ignored."""
+    global _interceptors
+    with _lock:
+        _interceptors = tuple(item for item in _interceptors if item is not interceptor)
+        _build_chains(_interceptors)
+
+
+@contextmanager
+def intercepting(*interceptors: Interceptor) -> Iterator[None]:
+    """Add the given interceptors only inside a :code:`with` block."""
+    for interceptor in interceptors:
+        add_interceptor(interceptor)
+    try:
+        yield
+    finally:
+        for interceptor in interceptors:
+            remove_interceptor(interceptor)
@@ -0,0 +1,5 @@
+from gloe.profiling._footprint import Footprint, footprint
+from gloe.profiling._profiler import Profiler
+from gloe.profiling._stats import NodeStats
+
+__all__ = ["Profiler", "NodeStats", "footprint", "Footprint"]
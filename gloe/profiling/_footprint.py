@@ -0,0 +1,112 @@
+import sys
+import types
+from typing import Any, NamedTuple
+
+from gloe._gloe_graph import GloeGraph
+from gloe.base_transformer import BaseTransformer
+
+__all__ = ["Footprint", "footprint"]
+
+# objects shared by the whole program, which are not retained by a pipeline
+_SHARED_TYPES = (
+    types.ModuleType,
+    types.CodeType,
+    types.BuiltinFunctionType,
+    types.FrameType,
+)
+
+
+class Footprint(NamedTuple):
+    """Memory retained by a pipeline."""
+
+    nodes: int
+    """Number of distinct transformer instances, including the children."""
+    classes: int
+    """Number of classes created at runtime, like the ones of the compositions."""
+    graphs: int
+    """Number of graphs cached by the transformers."""
+    size: int
+    """Approximate size in bytes of all the retained objects."""
+
+
+def _is_static_class(cls: type) -> bool:
+    # a class that can be imported from its module is shared by the whole program
+    target: Any = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split("."):
+        target = getattr(target, name, None)
+    return target is cls
+
+
+def footprint(transformer: BaseTransformer) -> Footprint:
+    """
+    Measure the memory retained by a transformer: its nodes, their children, the
+    classes created for them at runtime and the cached graphs.
+
+    Objects shared by the whole program, like modules, code, and the classes that can
+    be imported, are not counted. The objects shared by many pipelines, like the
+    transformers used as building blocks, are counted by each one of them.
+
+    Example:
+        Tracking the size of a pipeline::
+
+            print(footprint(pipeline).size)
+
+    Args:
+        transformer: the transformer or pipeline to be measured.
+
+    Returns:
+        The number of nodes, runtime classes and cached graphs, and the total size.
+    """
+    seen: set[int] = set()
+    nodes = classes = graphs = size = 0
+    stack: list[Any] = [transformer]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, type):
+            if _is_static_class(obj):
+                continue
+            classes += 1
+            size += sys.getsizeof(obj)
+            stack.extend(vars(obj).values())
+            continue
+
+        size += sys.getsizeof(obj)
+        if isinstance(obj, BaseTransformer):
+            nodes += 1
+            graphs += len(obj.__dict__.get("_graphs", {}))
+            stack.append(type(obj))
+        elif isinstance(obj, GloeGraph):
+            # the graph nodes reference the transformers, which are already counted
+            for attrs in obj.nodes.values():
+                size += sys.getsizeof(attrs)
+            stack.extend([obj.attrs, obj.edges, obj.subgraphs])
+            continue
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, types.FunctionType):
+            # the code and the globals of the functions are shared
+            stack.extend(obj.__closure__ or ())
+            stack.append(obj.__defaults__)
+        elif isinstance(obj, types.MethodType):
+            stack.append(obj.__self__)
+        elif isinstance(obj, types.CellType):
+            try:
+                stack.append(obj.cell_contents)
+            except ValueError:
+                pass
+
+        if hasattr(obj, "__dict__") and not isinstance(obj, types.FunctionType):
+            stack.append(vars(obj))
+        for slot in getattr(type(obj), "__slots__", ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                stack.append(getattr(obj, slot))
+
+    return Footprint(nodes=nodes, classes=classes, graphs=graphs, size=size)
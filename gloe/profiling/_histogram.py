@@ -0,0 +1,75 @@
+from typing import Iterator
+
+__all__ = ["_Histogram"]
+
+
+class _Histogram:
+    """
+    Log-linear histogram of non-negative integers, like the HDR histograms.
+
+    Each power of two is split in :code:`2 ** precision` buckets of the same width, so
+    the relative error of the recorded values is bounded by :code:`2 ** -precision`
+    whatever their magnitude, and recording a value is a couple of integer operations.
+    Only the used buckets are stored.
+    """
+
+    __slots__ = ("precision", "_sub_buckets", "_counts", "count")
+
+    def __init__(self, precision: int = 5):
+        if precision < 1:
+            raise ValueError("The precision must be greater than zero")
+
+        self.precision = precision
+        self._sub_buckets = 1 << precision
+        self._counts: dict[int, int] = {}
+        self.count = 0
+
+    def _bucket(self, value: int) -> int:
+        if value < self._sub_buckets:
+            return value
+        shift = value.bit_length() - 1 - self.precision
+        return shift * self._sub_buckets + (value >> shift)
+
+    def _bucket_range(self, bucket: int) -> tuple[int, int]:
+        if bucket < 2 * self._sub_buckets:
+            return bucket, bucket
+        shift = bucket // self._sub_buckets - 1
+        mantissa = bucket - shift * self._sub_buckets
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int):
+        bucket = self._bucket(value)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Args:
+            percentile: a number between 0 and 100.
+
+        Returns:
+            The middle of the bucket holding the given percentile, or 0 if nothing was
+            recorded.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+        if self.count == 0:
+            return 0
+
+        rank = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for lowest, highest, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return (lowest + highest) // 2
+        return 0  # pragma: no cover
+
+    def buckets(self) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields:
+            The lowest and highest values of each used bucket, and its count, in
+            ascending order.
+        """
+        for bucket in sorted(self._counts):
+            lowest, highest = self._bucket_range(bucket)
+            yield lowest, highest, self._counts[bucket]
@@ -0,0 +1,81 @@
+from typing import Optional
+
+from gloe._gloe_graph import GloeGraph
+from gloe.profiling._stats import NodeStats
+
+__all__ = ["_overlay_stats"]
+
+_CLUSTER_PREFIX = "cluster_"
+
+
+def _stats_id(graph_node_id: str) -> str:
+    # the edges entering a subgraph point to its begin node, whose id is derived from
+    # the id of the transformer represented by the subgraph
+    if graph_node_id.startswith(_CLUSTER_PREFIX) and graph_node_id.endswith("begin"):
+        return graph_node_id.removeprefix(_CLUSTER_PREFIX).removesuffix("begin")
+    return graph_node_id
+
+
+def _heat_color(share: float) -> str:
+    # from white to red, in the "hue saturation value" format of graphviz
+    return f"0.000 {min(max(share, 0.0), 1.0):.3f} 1.000"
+
+
+def _stats_label(label: str, stats: NodeStats, share: float) -> str:
+    return (
+        f"{label}\n{stats.calls} calls | mean {stats.mean * 1e3:.3g} ms\n"
+        f"p99 {stats.percentile(99) * 1e3:.3g} ms | {share:.1%} of the time"
+    )
+
+
+def _overlay_stats(
+    graph: GloeGraph, stats: dict[str, NodeStats], total: float, elapsed: float
+) -> GloeGraph:
+    """
+    Copy of the graph with the measurements of the nodes: the nodes are colored by
+    their share of the total time, and the edges are labeled with the number of items
+    that went through them and the throughput.
+    """
+    overlaid = GloeGraph(name=graph.name)
+    overlaid.attrs = dict(graph.attrs)
+
+    cluster_stats: Optional[NodeStats] = None
+    if graph.name.startswith(_CLUSTER_PREFIX):
+        cluster_stats = stats.get(graph.name.removeprefix(_CLUSTER_PREFIX))
+    if cluster_stats is not None:
+        share = cluster_stats.total / total if total > 0 else 0.0
+        overlaid.attrs["label"] = _stats_label(
+            overlaid.attrs.get("label", ""), cluster_stats, share
+        )
+        overlaid.attrs["style"] = "filled"
+        overlaid.attrs["fillcolor"] = _heat_color(share)
+
+    for node_id, node_attrs in graph.nodes.items():
+        node_attrs = dict(node_attrs)
+        node_stats = stats.get(node_id)
+        if node_stats is not None:
+            share = node_stats.total / total if total > 0 else 0.0
+            node_attrs["label"] = _stats_label(
+                node_attrs.get("label", ""), node_stats, share
+            )
+            node_attrs["style"] = "filled"
+            node_attrs["fillcolor"] = _heat_color(share)
+        overlaid.nodes[node_id] = node_attrs
+
+    for (u, v), edge_attrs in graph.edges.items():
+        edge_attrs = dict(edge_attrs)
+        node_stats = stats.get(_stats_id(v))
+        if node_stats is not None:
+            flow_label = f"{node_stats.calls} items"
+            if elapsed > 0:
+                flow_label += f" | {node_stats.calls / elapsed:,.1f}/s"
+            edge_label = edge_attrs.get("label")
+            edge_attrs["label"] = (
+                flow_label if not edge_label else f"{edge_label}\n{flow_label}"
+            )
+        overlaid.edges[(u, v)] = edge_attrs
+
+    for subgraph in graph.subgraphs:
+        overlaid.add_subgraph(_overlay_stats(subgraph, stats, total, elapsed))
+
+    return overlaid
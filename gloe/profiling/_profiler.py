@@ -0,0 +1,153 @@
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from gloe._gloe_graph import GloeGraph
+from gloe.base_transformer import BaseTransformer
+from gloe.interceptors import Interceptor
+from gloe.profiling._overlay import _overlay_stats
+from gloe.profiling._stats import NodeStats
+
+__all__ = ["Profiler"]
+
+
+class Profiler(Interceptor):
+    """
+    Records the number of calls and the latency of every node executed while it is
+    enabled, including the children of gateways, collections and conditioners.
+
+    Each node is identified by its :code:`instance_id`, so the same transformer used
+    twice in a pipeline has separate measurements.
+
+    Example:
+        Finding the slowest nodes of a pipeline::
+
+            profiler = Profiler(sample_rate=0.01)
+            with profiler:
+                for record in records:
+                    pipeline(record)
+
+            print(profiler.report())
+
+    Args:
+        sample_rate: fraction of the calls of each node whose time is measured. All the
+            calls are counted, even if they are not sampled.
+        precision: number of bits of the latency histogram buckets. The percentiles
+            have a relative error of at most :code:`2 ** -precision`.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, precision: int = 5):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("The sample_rate must be greater than 0 and at most 1")
+
+        self.sample_rate = sample_rate
+        self.precision = precision
+        self._sample_every = round(1 / sample_rate)
+        self._stats: dict[uuid.UUID, NodeStats] = {}
+        self._lock = threading.Lock()
+        self._elapsed = 0.0
+        self._started_at: Optional[float] = None
+
+    def start(self):
+        super().start()
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+
+    def stop(self):
+        super().stop()
+        if self._started_at is not None:
+            self._elapsed += time.perf_counter() - self._started_at
+            self._started_at = None
+
+    @property
+    def elapsed(self) -> float:
+        """Time in seconds during which the profiler was enabled."""
+        if self._started_at is None:
+            return self._elapsed
+        return self._elapsed + time.perf_counter() - self._started_at
+
+    def reset(self):
+        """Discard all the measurements."""
+        with self._lock:
+            self._stats = {}
+            self._elapsed = 0.0
+            if self._started_at is not None:
+                self._started_at = time.perf_counter()
+
+    @property
+    def stats(self) -> list[NodeStats]:
+        """Measurements of the executed nodes, from the slowest to the fastest."""
+        return sorted(self._stats.values(), key=lambda stats: -stats.total)
+
+    def __getitem__(self, transformer: BaseTransformer) -> NodeStats:
+        return self._stats[transformer.instance_id]
+
+    def find(self, label: str) -> list[NodeStats]:
+        """Measurements of the nodes with the given label."""
+        return [stats for stats in self.stats if stats.label == label]
+
+    def report(self) -> str:
+        """Table with the measurements of the nodes, from the slowest to the fastest."""
+        lines = [
+            f"{'node':<30} {'calls':>10} {'total (s)':>12} {'mean (ms)':>10} "
+            f"{'p50 (ms)':>10} {'p99 (ms)':>10}"
+        ]
+        for stats in self.stats:
+            lines.append(
+                f"{stats.label[:30]:<30} {stats.calls:>10} {stats.total:>12.6f} "
+                f"{stats.mean * 1e3:>10.3f} {stats.percentile(50) * 1e3:>10.3f} "
+                f"{stats.percentile(99) * 1e3:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def _overlay(self, graph: GloeGraph, pipeline: BaseTransformer) -> GloeGraph:
+        stats = {str(instance_id): stats for instance_id, stats in self._stats.items()}
+        # the share of each node is relative to the time of the top-level nodes
+        top_level = [stats.get(node.node_id) for node in pipeline._flow]
+        total = sum(node_stats.total for node_stats in top_level if node_stats)
+        return _overlay_stats(graph, stats, total, self.elapsed)
+
+    def _begin(self, node: BaseTransformer) -> tuple[NodeStats, bool]:
+        with self._lock:
+            stats = self._stats.get(node.instance_id)
+            if stats is None:
+                stats = NodeStats(node.label, node.instance_id, self.precision)
+                self._stats[node.instance_id] = stats
+            sampled = stats.calls % self._sample_every == 0
+            stats.calls += 1
+        return stats, sampled
+
+    def _end(self, stats: NodeStats, start: int):
+        elapsed = time.perf_counter_ns() - start
+        with self._lock:
+            stats._record(elapsed)
+
+    def intercept(
+        self, node: BaseTransformer, data: Any, call_next: Callable[[Any], Any]
+    ) -> Any:
+        stats, sampled = self._begin(node)
+        if not sampled:
+            return call_next(data)
+
+        start = time.perf_counter_ns()
+        try:
+            return call_next(data)
+        finally:
+            self._end(stats, start)
+
+    async def intercept_async(
+        self,
+        node: BaseTransformer,
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        stats, sampled = self._begin(node)
+        if not sampled:
+            return await call_next(data)
+
+        start = time.perf_counter_ns()
+        try:
+            return await call_next(data)
+        finally:
+            self._end(stats, start)
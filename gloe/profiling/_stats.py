@@ -0,0 +1,50 @@
+import uuid
+
+from gloe.profiling._histogram import _Histogram
+
+__all__ = ["NodeStats"]
+
+
+class NodeStats:
+    """Measurements of a node of the flow. The times are in seconds."""
+
+    def __init__(self, label: str, instance_id: uuid.UUID, precision: int):
+        self.label = label
+        self.instance_id = instance_id
+        self.calls = 0
+        self.samples = 0
+        self.histogram = _Histogram(precision)
+        self._total_ns = 0
+
+    @property
+    def mean(self) -> float:
+        """Mean time of the sampled calls."""
+        if self.samples == 0:
+            return 0.0
+        return self._total_ns / self.samples / 1e9
+
+    @property
+    def total(self) -> float:
+        """Total time of the calls, estimated from the samples when sampling."""
+        return self.mean * self.calls
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Args:
+            percentile: a number between 0 and 100.
+
+        Returns:
+            The time below which the given percentile of the sampled calls finished.
+        """
+        return self.histogram.percentile(percentile) / 1e9
+
+    def _record(self, elapsed_ns: int):
+        self.samples += 1
+        self._total_ns += elapsed_ns
+        self.histogram.record(elapsed_ns)
+
+    def __repr__(self):
+        return (
+            f"NodeStats(label={self.label!r}, calls={self.calls}, "
+            f"mean={self.mean:.6f}, p99={self.percentile(99):.6f})"
+        )
@@ -0,0 +1,3 @@
+from gloe.tracing._tracer import Span, Tracer
+
+__all__ = ["Tracer", "Span"]
@@ -0,0 +1,234 @@
+import asyncio
+import itertools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+from gloe.base_transformer import BaseTransformer
+from gloe.interceptors import Interceptor
+
+__all__ = ["Tracer", "Span"]
+
+
+@dataclass
+class Span:
+    """
+    Execution of a pipeline or of one of its nodes. The timestamps are in nanoseconds,
+    from :code:`time.perf_counter_ns()`.
+    """
+
+    name: str
+    kind: Literal["pipeline", "node"]
+    span_id: int
+    parent_id: Optional[int]
+    instance_id: str
+    start: int
+    thread_id: int
+    task_id: Optional[int]
+    end: int = 0
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration of the span in seconds."""
+        return (self.end - self.start) / 1e9
+
+
+def _pipeline_name(pipeline: BaseTransformer) -> str:
+    flow = pipeline._flow
+    if len(flow) == 1:
+        return flow[0].label
+    if len(flow) == 2:
+        return f"{flow[0].label} >> {flow[1].label}"
+    return f"{flow[0].label} >> ... >> {flow[-1].label}"
+
+
+def _current_task_id() -> Optional[int]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return None if task is None else id(task)
+
+
+class Tracer(Interceptor):
+    """
+    Records a span for each pipeline call and for each of its nodes, including the
+    nested flows of gateways, collections and conditioners, while it is enabled.
+
+    The current span is stored in a context variable, so the spans created inside the
+    branches of an :code:`asyncio.gather` or inside the threads of an executor are
+    children of the span that started them.
+
+    Example:
+        Tracing an async pipeline and loading it in a trace viewer, like Perfetto or
+        :code:`chrome://tracing`::
+
+            with Tracer() as tracer:
+                await pipeline(data)
+
+            tracer.export("trace.json")
+    """
+
+    def __init__(self):
+        self._spans: list[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            f"gloe_span_{id(self)}", default=None
+        )
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans, in the order they started."""
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.start)
+
+    def clear(self):
+        """Discard all the finished spans."""
+        with self._lock:
+            self._spans = []
+
+    def _open(
+        self, target: BaseTransformer, kind: Literal["pipeline", "node"]
+    ) -> tuple[Span, Token]:
+        parent = self._current.get()
+        span = Span(
+            name=_pipeline_name(target) if kind == "pipeline" else target.label,
+            kind=kind,
+            span_id=next(self._ids),
+            parent_id=None if parent is None else parent.span_id,
+            instance_id=str(target.instance_id),
+            start=time.perf_counter_ns(),
+            thread_id=threading.get_ident(),
+            task_id=_current_task_id(),
+        )
+        return span, self._current.set(span)
+
+    def _close(self, span: Span, token: Token, error: Optional[BaseException]):
+        span.end = time.perf_counter_ns()
+        if error is not None:
+            span.error = repr(error)
+        self._current.reset(token)
+        with self._lock:
+            self._spans.append(span)
+
+    def _trace(
+        self,
+        target: BaseTransformer,
+        kind: Literal["pipeline", "node"],
+        data: Any,
+        call_next: Callable[[Any], Any],
+    ) -> Any:
+        span, token = self._open(target, kind)
+        error = None
+        try:
+            return call_next(data)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            self._close(span, token, error)
+
+    async def _trace_async(
+        self,
+        target: BaseTransformer,
+        kind: Literal["pipeline", "node"],
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        span, token = self._open(target, kind)
+        error = None
+        try:
+            return await call_next(data)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            self._close(span, token, error)
+
+    def intercept(
+        self, node: BaseTransformer, data: Any, call_next: Callable[[Any], Any]
+    ) -> Any:
+        return self._trace(node, "node", data, call_next)
+
+    async def intercept_async(
+        self,
+        node: BaseTransformer,
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        return await self._trace_async(node, "node", data, call_next)
+
+    def intercept_pipeline(
+        self, pipeline: BaseTransformer, data: Any, call_next: Callable[[Any], Any]
+    ) -> Any:
+        return self._trace(pipeline, "pipeline", data, call_next)
+
+    async def intercept_pipeline_async(
+        self,
+        pipeline: BaseTransformer,
+        data: Any,
+        call_next: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        return await self._trace_async(pipeline, "pipeline", data, call_next)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert the spans to the Chrome trace event format.
+
+        Each thread and each asyncio task is shown as a separate track, so the
+        concurrent branches of the async pipelines are displayed side by side.
+        """
+        spans = self.spans
+        origin = spans[0].start if spans else 0
+        pid = os.getpid()
+        tracks: dict[tuple[int, Optional[int]], int] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            lane = (span.thread_id, span.task_id)
+            tid = tracks.get(lane)
+            if tid is None:
+                tid = tracks[lane] = len(tracks) + 1
+                track_name = f"thread {span.thread_id}"
+                if span.task_id is not None:
+                    track_name = f"task {tid} ({track_name})"
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"name": track_name},
+                    }
+                )
+
+            args: dict[str, Any] = {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "instance_id": span.instance_id,
+            }
+            if span.error is not None:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.kind if span.error is None else f"{span.kind},error",
+                    "ph": "X",
+                    "ts": (span.start - origin) / 1e3,
+                    "dur": (span.end - span.start) / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str):
+        """Write the spans to a JSON file in the Chrome trace event format."""
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
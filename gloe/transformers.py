@@ -1,12 +1,40 @@
 from abc import ABC, abstractmethod
 from inspect import Signature
 
-from typing import TypeVar, overload, cast, Optional, Any
+import pickle
+from functools import partial
+from typing import (
+    TypeVar,
+    overload,
+    cast,
+    Callable,
+    Optional,
+    Any,
+    Iterable,
+    Collection,
+)
 
-from typing_extensions import TypeAlias, Unpack, TypeVarTuple, Generic, override
+from typing_extensions import (
+    TypeAlias,
+    Unpack,
+    TypeVarTuple,
+    Generic,
+    override,
+    Self,
+)
 
 from gloe.async_transformer import AsyncTransformer, MultiArgsAsyncTransformer
+from gloe._compiled_flow import _CompiledFlow
+from gloe._run import (
+    _CheckpointRun,
+    _IncrementalRun,
+    _RunStore,
+    _Serializer,
+    _check_run_options,
+)
+from gloe._production import _production_flow, _resolve_mode
 from gloe._transformer_utils import catch_transformer_exception
+from gloe.interceptors import _interceptor
 from gloe.base_transformer import BaseTransformer, Flow
 
 from gloe._generic_types import (
@@ -48,6 +76,71 @@ def _execute_flow(flow: Flow, arg: Any) -> Any:
     return result
 
 
+def _execute_flow_batch(flow: Flow, batch: list[Any]) -> list[Any]:
+    for op in flow:
+        if isinstance(op, Transformer):
+            batch = op._safe_transform_batch(batch)
+        else:
+            raise NotImplementedError()
+    return batch
+
+
+def _run_flow(
+    flow: Flow, data: Any, store: _RunStore, volatile: Collection[BaseTransformer]
+) -> Any:
+    run = _IncrementalRun(store, volatile)
+    run.start(data)
+    for index, op in enumerate(flow):
+        if not isinstance(op, Transformer):
+            raise NotImplementedError()
+        if run.try_skip(index, op):
+            continue
+        run.record(index, op, op._safe_transform(run.current_value()))
+    return run.current_value()
+
+
+def _run_flow_with_checkpoints(
+    flow: Flow, data: Any, run: _CheckpointRun, resume: bool
+) -> Any:
+    start, result = run.start(data, resume)
+    for index in range(start, len(flow)):
+        op = flow[index]
+        if not isinstance(op, Transformer):
+            raise NotImplementedError()
+        try:
+            result = op._safe_transform(result)
+        except Exception:
+            run.failed(index)
+            raise
+        run.completed(index, result)
+    run.finish()
+    return result
+
+
+def _is_batch_flow(flow: Flow) -> bool:
+    """Check if some node of the flow transforms whole batches at once."""
+    for op in flow:
+        if isinstance(op, Transformer):
+            if type(op).transform_batch is not Transformer.transform_batch:
+                return True
+        elif isinstance(op, AsyncTransformer):
+            if (
+                type(op).transform_batch_async
+                is not AsyncTransformer.transform_batch_async
+            ):
+                return True
+    return False
+
+
+def _compile_flow(flow: Flow, production: Optional[bool] = None) -> _CompiledFlow:
+    for op in flow:
+        if not isinstance(op, Transformer):
+            raise NotImplementedError()
+
+    flow = _production_flow(flow, _resolve_mode(production))
+    return _CompiledFlow(flow)
+
+
 class Transformer(BaseTransformer[_I, _O], ABC):
     """
     A Transformer is the generic block with the responsibility to take an input of type
@@ -96,7 +189,11 @@ class Transformer(BaseTransformer[_I, _O], ABC):
 
         transformed: Optional[_O] = None
         try:
-            transformed = self.transform(data)
+            chain = _interceptor._chain
+            if chain is None:
+                transformed = self.transform(data)
+            else:
+                transformed = chain(self, self.transform, data)
         except Exception as exception:
             transform_exception = catch_transformer_exception(exception, self)
 
@@ -108,6 +205,165 @@ class Transformer(BaseTransformer[_I, _O], ABC):
 
         raise NotImplementedError()  # pragma: no cover
 
+    def transform_batch(self, data: list[_I]) -> list[_O]:
+        """
+        Transform a batch of incoming data at once. It is used by :code:`map_batch()`.
+
+        By default, it calls the :code:`transform` method for each item. Transformers
+        that can process many items at once more efficiently, like vectorized
+        computations or bulk queries, can override it.
+
+        Args:
+            data: the items of the batch.
+
+        Returns:
+            The outcome of each item, in the same order.
+        """
+        transform = self.transform
+        return [transform(item) for item in data]
+
+    def _safe_transform_batch(self, data: list[_I]) -> list[_O]:
+        transform_exception = None
+
+        transformed: list[_O] = []
+        try:
+            chain = _interceptor._chain
+            if chain is None:
+                transformed = self.transform_batch(data)
+            else:
+                transformed = chain(self, self.transform_batch, data)
+        except Exception as exception:
+            transform_exception = catch_transformer_exception(exception, self)
+
+        if transform_exception is not None:
+            raise transform_exception.internal_exception
+
+        return transformed
+
+    def map_batch(self, inputs: Iterable[_I]) -> list[_O]:
+        """
+        Execute the transformer over many inputs. Instead of calling the transformer
+        for each input, the whole batch goes through each node of the flow before going
+        to the next one, so the per-call overhead is paid once per node and transformers
+        that override :code:`transform_batch()` receive the whole batch.
+
+        Example:
+            Typical usage example::
+
+                records = pipeline.map_batch(rows)
+
+        Args:
+            inputs: the inputs of the transformer.
+
+        Returns:
+            The outcome of each input, in the same order.
+        """
+        return _execute_flow_batch(self._flow, list(inputs))
+
+    def run(
+        self,
+        data: _I,
+        *,
+        incremental_dir: Optional[str] = None,
+        volatile: Collection[BaseTransformer] = (),
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: int = 1,
+        resume: bool = False,
+        serializer: _Serializer = pickle,
+    ) -> _O:
+        """
+        Execute the transformer with some execution options.
+
+        Example:
+            Rebuilding a report only from the stages whose inputs changed::
+
+                report = build_report.run(date, incremental_dir="runs/report")
+
+            Resuming a long pipeline from the last node executed before a failure::
+
+                model = train.run(dataset, checkpoint_dir="runs/train", resume=True)
+
+        Args:
+            data: the input of the transformer.
+            incremental_dir: if given, each top-level node of the flow records the
+                fingerprints of its input and output, and its output, in this
+                directory. In the next runs, the nodes whose input is unchanged are
+                skipped and their recorded output is reused, like :code:`make` does.
+                A node is also executed again when its code or configuration changes,
+                like the arguments of a partial transformer or the attributes of a
+                class-based one. The nodes whose configuration can't be fingerprinted
+                are always executed.
+                The outputs must be serializable.
+            volatile: nodes that must be executed even when their input is unchanged,
+                because they depend on something else, like a database or the clock.
+            checkpoint_dir: if given, the output of the top-level nodes of the flow is
+                saved in this directory, and removed when the run succeeds.
+            checkpoint_every: save the output of one in every this many top-level
+                nodes. The default saves it after each node.
+            resume: if a previous run with the same input and flow failed, restart it
+                from its last checkpoint, skipping the nodes before it.
+            serializer: object with the :code:`dumps` and :code:`loads` functions used
+                to save the outputs, like :code:`pickle` (the default).
+
+        Returns:
+            The outcome of the transformer.
+        """
+        _check_run_options(incremental_dir, checkpoint_dir)
+        execute: Callable[[Any], Any] = self._run
+        if incremental_dir is not None:
+            store = _RunStore(incremental_dir, serializer)
+            execute = partial(_run_flow, self._flow, store=store, volatile=volatile)
+        elif checkpoint_dir is not None:
+            store = _RunStore(checkpoint_dir, serializer)
+            run = _CheckpointRun(self._flow, store, checkpoint_every)
+            execute = partial(
+                _run_flow_with_checkpoints, self._flow, run=run, resume=resume
+            )
+
+        chain = _interceptor._pipeline_chain
+        if chain is None:
+            return execute(data)
+        return chain(self, execute, data)
+
+    def compile(self, lazy: bool = False, production: Optional[bool] = None) -> Self:
+        """
+        Prebuild the execution plan of the transformer, so the calls skip the per-node
+        dispatch of the flow execution.
+
+        The plan is a snapshot of the current flow. Transformers composed with this one
+        afterward are not compiled, and changes to the flow after the compilation are
+        not reflected in the plan.
+
+        Example:
+            Typical usage example::
+
+                pipeline = (parse >> enrich >> validate >> serialize).compile()
+
+        Args:
+            lazy: if :code:`True`, the plan is only built on the first call of the
+                transformer, instead of right away.
+            production: if the plan is built in production mode, which skips the
+                nodes that are only useful during development. By default, it follows
+                the global mode, set by :code:`gloe.production`.
+
+        Returns:
+            The transformer itself, now executed through its compiled plan.
+        """
+        self._production = production
+        if lazy:
+            self._compile_on_call = True
+        else:
+            self._plan = _compile_flow(self._flow, production)
+        return self
+
+    def _run(self, data: Any) -> Any:
+        plan = self._plan
+        if plan is None:
+            if not self._compile_on_call:
+                return _execute_flow(self._flow, data)
+            plan = self._plan = _compile_flow(self._flow, self._production)
+        return plan(data)
+
     @overload
     def __call__(self: "Transformer[None, _O]") -> _O:
         pass
@@ -117,7 +373,10 @@ class Transformer(BaseTransformer[_I, _O], ABC):
         pass
 
     def __call__(self, data=None):
-        return _execute_flow(self._flow, data)
+        chain = _interceptor._pipeline_chain
+        if chain is None:
+            return self._run(data)
+        return chain(self, self._run, data)
 
     @overload
     def __rshift__(self, next_node: "Transformer[_O, O1]") -> "Transformer[_I, O1]":
@@ -240,7 +499,10 @@ class MultiArgsTransformer(
     ) -> _O:
         if len(data) == 1 and type(data[0]) is tuple:  # type: ignore
             data = data[0]  # type: ignore
-        return _execute_flow(self._flow, data)
+        chain = _interceptor._pipeline_chain
+        if chain is None:
+            return self._run(data)
+        return chain(self, self._run, data)
 
     @overload  # type: ignore[override]
     @override
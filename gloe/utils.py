@@ -18,6 +18,8 @@ def forget(data: Any) -> None:
 
 
 class debug(Generic[_In], Transformer[_In, _In]):  # pragma: no cover
+    _passthrough = True
+
     def __init__(self):
         super().__init__()
         self.plotting_settings.invisible = True
@@ -45,6 +47,8 @@ class debug(Generic[_In], Transformer[_In, _In]):  # pragma: no cover
 
 
 class forward(Generic[_In], Transformer[_In, _In]):
+    _passthrough = True
+
     def __init__(self):
         super().__init__()
         self.plotting_settings.invisible = True
@@ -1,9 +1,10 @@
-from typing import TypeVar
+from typing import Sequence, TypeVar
 
 from typing_extensions import assert_type
 
 from gloe import (
     Transformer,
+    transformer,
     async_transformer,
     AsyncTransformer,
 )
@@ -111,3 +112,20 @@ class TestBasicTransformerTypes(MypyTestSuite):
         assert_type(async_pipeline3, AsyncTransformer[int, tuple[float, str]])
         assert_type(async_pipeline4, AsyncTransformer[int, tuple[str, float]])
         assert_type(async_pipeline5, AsyncTransformer[int, str])
+
+    def test_batch_transformer_typing(self):
+        """
+        Test the typing of a transformer created from a batch function
+        """
+
+        @transformer(batch=True)
+        def lengths(texts: list[str]) -> Sequence[int]:
+            return [len(text) for text in texts]
+
+        assert_type(lengths, Transformer[str, int])
+
+        @async_transformer(batch=True)
+        async def async_lengths(texts: list[str]) -> list[int]:
+            return [len(text) for text in texts]
+
+        assert_type(to_string >> async_lengths, AsyncTransformer[float, int])
@@ -0,0 +1,183 @@
+import os
+import unittest
+from typing import cast
+from unittest.mock import patch
+
+from gloe import TransformerException, ensure, production, is_production, transformer
+from gloe._compiled_flow import _AsyncCompiledFlow, _CompiledFlow
+from gloe._production import _env_flag, _mode_from_environment
+from gloe.utils import debug, forward
+from tests.lib.ensurers import is_odd
+from tests.lib.exceptions import NumberIsEven
+from tests.lib.transformers import (
+    async_natural_logarithm,
+    async_plus1,
+    minus1,
+    natural_logarithm,
+    plus1,
+    square,
+    square_root,
+    LnOfNegativeNumber,
+)
+
+
+class TestCompiledTransformer(unittest.TestCase):
+    def test_compiled_flow_result(self):
+        graph = square >> square_root >> plus1 >> minus1
+        compiled = (square >> square_root >> plus1 >> minus1).compile()
+
+        self.assertIsInstance(compiled._plan, _CompiledFlow)
+        self.assertEqual(graph(10), compiled(10))
+
+    def test_lazy_compilation(self):
+        graph = (square >> plus1).compile(lazy=True)
+        self.assertIsNone(graph._plan)
+
+        self.assertEqual(graph(3), 10)
+        self.assertIsInstance(graph._plan, _CompiledFlow)
+
+    def test_compiled_flow_error_handling(self):
+        graph = (minus1 >> natural_logarithm).compile()
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph(-1)
+
+        exception = context.exception
+        self.assertEqual(type(exception.__cause__), TransformerException)
+        exception_ctx = cast(TransformerException, exception.__cause__)
+        self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
+
+    def test_composition_of_compiled_transformer(self):
+        compiled = (square >> plus1).compile()
+        graph = compiled >> minus1
+
+        self.assertIsNone(graph._plan)
+        self.assertEqual(graph(3), 9)
+
+    def test_compiled_multiargs_transformer(self):
+        @transformer
+        def sum_args(arg1: float, arg2: float) -> float:
+            return arg1 + arg2
+
+        graph = (sum_args >> plus1).compile()
+        self.assertEqual(graph(1, 2), 4)
+        self.assertEqual(graph((1, 2)), 4)  # type: ignore
+
+
+class TestProductionMode(unittest.TestCase):
+    def test_passthrough_nodes_elided(self):
+        graph = plus1 >> forward[float]() >> debug[float]() >> square
+
+        compiled = graph.copy().compile(production=True)
+        plan = cast(_CompiledFlow, compiled._plan)
+        self.assertEqual(len(plan.nodes), 2)
+        self.assertEqual(compiled(2), 9)
+
+        compiled = graph.copy().compile(production=False)
+        plan = cast(_CompiledFlow, compiled._plan)
+        self.assertEqual(len(plan.nodes), 4)
+
+    def test_global_production_mode(self):
+        with production(enabled=False):
+            with production():
+                self.assertTrue(is_production())
+                compiled = (forward[float]() >> plus1).compile(lazy=True)
+                eager = (forward[float]() >> plus1).compile()
+            self.assertFalse(is_production())
+
+            self.assertEqual(len(cast(_CompiledFlow, eager._plan).nodes), 1)
+
+            # the lazy plans are built with the mode of their first call
+            self.assertEqual(compiled(1), 2)
+            self.assertEqual(len(cast(_CompiledFlow, compiled._plan).nodes), 2)
+
+    def test_skip_ensurers(self):
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        def ensured_pipeline():
+            return ensure(incoming=[is_odd])(int_identity >> int_identity)
+
+        with production():
+            compiled = ensured_pipeline().compile()
+        self.assertRaises(NumberIsEven, lambda: compiled(2))
+
+        with production(skip_ensurers=True):
+            compiled = ensured_pipeline().compile()
+        self.assertEqual(compiled(2), 2)
+
+        ensured_forward = ensure(incoming=[is_odd])(forward[int]())
+        compiled = (ensured_forward >> plus1).compile(production=True)
+        self.assertRaises(NumberIsEven, lambda: compiled(2))
+
+    def test_skip_ensurers_environment_variable(self):
+        def ensured_pipeline():
+            return ensure(incoming=[is_odd])(plus1 >> plus1)
+
+        with patch.dict(os.environ, {"GLOE_SKIP_ENSURERS": "1"}):
+            with patch("gloe._production._mode", _mode_from_environment()):
+                self.assertFalse(is_production())
+                compiled = ensured_pipeline().compile()
+            with production():
+                production_compiled = ensured_pipeline().compile()
+
+        self.assertEqual(compiled(2), 4)
+        self.assertEqual(production_compiled(2), 4)
+        self.assertRaises(NumberIsEven, lambda: ensured_pipeline().compile()(2))
+
+    def test_production_error_handling(self):
+        graph = (minus1 >> natural_logarithm).compile(production=True)
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph(-1)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
+
+    def test_environment_variables(self):
+        with patch.dict(os.environ, {"GLOE_PRODUCTION": "True"}):
+            self.assertTrue(_env_flag("GLOE_PRODUCTION"))
+        with patch.dict(os.environ, {"GLOE_PRODUCTION": "0"}):
+            self.assertFalse(_env_flag("GLOE_PRODUCTION"))
+
+
+class TestCompiledAsyncTransformer(unittest.IsolatedAsyncioTestCase):
+    async def test_sync_runs_are_collapsed(self):
+        graph = (plus1 >> square >> async_plus1 >> minus1 >> plus1).compile()
+
+        plan = cast(_AsyncCompiledFlow, graph._plan)
+        self.assertEqual(len(plan.steps), 3)
+        self.assertEqual(await graph(2), 10)
+
+    async def test_async_lazy_compilation(self):
+        graph = (async_plus1 >> square).compile(lazy=True)
+        self.assertIsNone(graph._plan)
+
+        self.assertEqual(await graph(2), 9)
+        self.assertIsInstance(graph._plan, _AsyncCompiledFlow)
+
+    async def test_compiled_async_flow_error_handling(self):
+        graph = (async_plus1 >> async_natural_logarithm).compile()
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            await graph(-2)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(async_natural_logarithm, exception_ctx.raiser_transformer)
+
+    async def test_compiled_sync_run_error_handling(self):
+        graph = (async_plus1 >> minus1 >> natural_logarithm).compile()
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            await graph(-2)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
+
+    async def test_async_production_plan(self):
+        graph = (async_plus1 >> forward[float]() >> square).compile(production=True)
+
+        plan = cast(_AsyncCompiledFlow, graph._plan)
+        self.assertEqual(len(plan.steps), 2)
+        self.assertEqual(await graph(2), 9)
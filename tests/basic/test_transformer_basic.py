@@ -1,6 +1,9 @@
 import asyncio
+import pickle
 import re
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 from gloe import (
@@ -191,6 +194,58 @@ class TestTransformerBasic(unittest.TestCase):
 
         self.assertEqual(len(graph2), 15)
 
+    def test_composition_reuses_classes(self):
+        graph1 = square >> square_root
+        graph2 = plus1 >> minus1 >> plus1
+        self.assertIs(type(graph1), type(graph2))
+
+        divergent1 = square >> (square_root, square)
+        divergent2 = plus1 >> (minus1, plus1, square)
+        self.assertIs(type(divergent1), type(divergent2))
+
+    def test_long_flow_built_once(self):
+        graph = plus1
+        for i in range(2000):
+            graph = graph >> plus1
+
+        self.assertEqual(len(graph), 2001)
+        self.assertEqual(len(graph._flow), 2001)
+        self.assertEqual(str(graph.signature()), "(num: float) -> float")
+        self.assertEqual(graph(0), 2001)
+
+        unpickled = pickle.loads(pickle.dumps(graph))
+        self.assertEqual(unpickled(0), 2001)
+
+    def test_concurrent_flow_copies(self):
+        sub_graph = plus1
+        for _ in range(200):
+            sub_graph = sub_graph >> plus1
+        copied = sub_graph.copy(regenerate_instance_id=True)
+        barrier = threading.Barrier(8, timeout=5)
+
+        def first_access(_):
+            barrier.wait()
+            return [node.instance_id for node in copied._flow]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            flows = list(executor.map(first_access, range(8)))
+
+        for flow in flows:
+            self.assertListEqual(flows[0], flow)
+
+    def test_reused_flow_copies(self):
+        sub_graph = plus1 >> minus1
+        sub_graph_ids = [node.instance_id for node in sub_graph._flow]
+
+        graph = sub_graph >> sub_graph >> sub_graph
+        graph_ids = {node.instance_id for node in graph._flow}
+
+        self.assertEqual(graph(0), 0)
+        self.assertEqual(len(graph_ids), 6)
+        self.assertListEqual(
+            sub_graph_ids, [node.instance_id for node in sub_graph._flow]
+        )
+
     def test_transformer_equality(self):
         graph = square >> square_root
         self.assertEqual(square, square)
@@ -220,6 +275,18 @@ class TestTransformerBasic(unittest.TestCase):
 
         self.assertEqual(str(signature), "(num: float) -> float")
 
+    def test_transformer_signature_cache(self):
+        class ToString(Transformer[int, str]):
+            def transform(self, data: int) -> str:
+                return str(data)
+
+        to_string = ToString()
+        signature = to_string.signature()
+
+        self.assertIs(to_string.signature(), signature)
+        self.assertIs(to_string.copy().signature(), signature)
+        self.assertEqual(str(signature), "(data: int) -> str")
+
     def test_transformer_error_forward(self):
         """
         Test if an error raised inside a transformer can be caught outside it
@@ -241,6 +308,21 @@ class TestTransformerBasic(unittest.TestCase):
             exception_ctx = cast(TransformerException, exception.__cause__)
             self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
 
+    def test_transformer_exception_message(self):
+        graph = minus1 >> natural_logarithm
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph(-1)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(exception_ctx.args, (None,))
+
+        message = str(exception_ctx)
+        self.assertIn('in transformer "natural_logarithm"', message)
+        self.assertIn("raise LnOfNegativeNumber", message)
+        self.assertEqual(exception_ctx.message, message)
+        self.assertEqual(exception_ctx.args, (message,))
+
     def test_transformers_on_a_running_event_loop(self):
         async def run_main():
             graph = square >> square_root
@@ -0,0 +1,189 @@
+import asyncio
+import unittest
+from typing import cast
+from unittest.mock import patch
+
+from gloe import (
+    AsyncTransformer,
+    Transformer,
+    TransformerException,
+    async_transformer,
+    ensure,
+    transformer,
+)
+from gloe.collection import Map, MapAsync
+from tests.lib.transformers import (
+    async_natural_logarithm,
+    async_plus1,
+    minus1,
+    natural_logarithm,
+    plus1,
+    square,
+    LnOfNegativeNumber,
+)
+
+
+class SumAll(Transformer[float, float]):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[float]] = []
+
+    def transform(self, data: float) -> float:
+        raise NotImplementedError()
+
+    def transform_batch(self, data: list[float]) -> list[float]:
+        self.batches.append(data)
+        total = sum(data)
+        return [total for _ in data]
+
+
+batch_sizes: list[int] = []
+
+
+@transformer(batch=True)
+def double_batch(nums: list[float]) -> list[float]:
+    batch_sizes.append(len(nums))
+    return [num * 2 for num in nums]
+
+
+@async_transformer(batch=True)
+async def async_double_batch(nums: list[float]) -> list[float]:
+    batch_sizes.append(len(nums))
+    return [num * 2 for num in nums]
+
+
+def is_positive(num: float):
+    if num <= 0:
+        raise ValueError()
+
+
+class TestTransformerBatch(unittest.TestCase):
+    def setUp(self):
+        batch_sizes.clear()
+
+    def test_batch_transformer(self):
+        self.assertEqual(6.0, double_batch(3.0))
+        self.assertEqual("(nums: float) -> float", str(double_batch.signature()))
+
+        graph = plus1 >> double_batch
+        self.assertListEqual([4.0, 6.0, 8.0], graph.map_batch([1.0, 2.0, 3.0]))
+        self.assertListEqual([1, 3], batch_sizes)
+
+    def test_map_with_batch_transformer(self):
+        graph = Map(plus1 >> double_batch)
+        self.assertListEqual([4.0, 6.0, 8.0], graph([1.0, 2.0, 3.0]))
+        self.assertListEqual([3], batch_sizes)
+
+        batch_sizes.clear()
+        graph = Map(double_batch, batch_size=2)
+        self.assertListEqual([2.0, 4.0, 6.0], graph([1.0, 2.0, 3.0]))
+        self.assertListEqual([2, 1], batch_sizes)
+
+    def test_map_scans_the_flow_once(self):
+        graph = Map(plus1 >> double_batch)
+
+        with patch(
+            "gloe.collection._batch_mapping._is_batch_flow", return_value=True
+        ) as is_batch_flow:
+            graph([1.0, 2.0])
+            graph([3.0])
+
+        is_batch_flow.assert_called_once()
+        self.assertListEqual([2, 1], batch_sizes)
+
+    def test_ensured_batch_transformer(self):
+        ensured = ensure(incoming=[is_positive])(double_batch)
+
+        self.assertListEqual([2.0, 4.0], Map(ensured)([1.0, 2.0]))
+        with self.assertRaises(ValueError):
+            Map(ensured)([1.0, -2.0])
+
+    def test_map_batch(self):
+        graph = square >> plus1 >> minus1
+        inputs = [1.0, 2.0, 3.0]
+
+        self.assertListEqual([graph(item) for item in inputs], graph.map_batch(inputs))
+        self.assertListEqual([], graph.map_batch([]))
+
+    def test_map_batch_is_stage_major(self):
+        calls = []
+
+        @transformer
+        def first(num: int) -> int:
+            calls.append(("first", num))
+            return num
+
+        @transformer
+        def second(num: int) -> int:
+            calls.append(("second", num))
+            return num
+
+        (first >> second).map_batch(iter([1, 2]))
+        self.assertListEqual(
+            [("first", 1), ("first", 2), ("second", 1), ("second", 2)], calls
+        )
+
+    def test_map_batch_with_batch_transformer(self):
+        sum_all = SumAll()
+        graph = plus1 >> sum_all >> minus1
+
+        self.assertListEqual([8.0, 8.0, 8.0], graph.map_batch([1.0, 2.0, 3.0]))
+        self.assertListEqual([[2.0, 3.0, 4.0]], sum_all.batches)
+
+    def test_map_batch_error_handling(self):
+        graph = minus1 >> natural_logarithm
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph.map_batch([3.0, -1.0])
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
+
+
+class TestAsyncTransformerBatch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        batch_sizes.clear()
+
+    async def test_async_batch_transformer(self):
+        self.assertEqual(6.0, await async_double_batch(3.0))
+
+        graph = MapAsync(async_plus1 >> async_double_batch, batch_size=2)
+        self.assertListEqual([4.0, 6.0, 8.0], await graph([1.0, 2.0, 3.0]))
+        self.assertListEqual([1, 2, 1], batch_sizes)
+
+    async def test_async_map_batch(self):
+        graph = square >> async_plus1 >> minus1 >> SumAll()
+
+        self.assertListEqual([14.0, 14.0, 14.0], await graph.map_batch([1.0, 2.0, 3.0]))
+
+    async def test_async_map_batch_concurrency(self):
+        running = 0
+        max_running = 0
+
+        class Delayed(AsyncTransformer[float, float]):
+            async def transform_async(self, data: float) -> float:
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return data
+
+        graph = plus1 >> Delayed()
+
+        result = await graph.map_batch(range(6), concurrency=2)
+        self.assertListEqual([1, 2, 3, 4, 5, 6], result)
+        self.assertEqual(2, max_running)
+
+    async def test_async_map_batch_error_handling(self):
+        graph = async_plus1 >> async_natural_logarithm
+
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            await graph.map_batch([1.0, -2.0], concurrency=None)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(async_natural_logarithm, exception_ctx.raiser_transformer)
+
+    async def test_async_map_batch_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            await async_plus1.map_batch([1.0], concurrency=0)
@@ -0,0 +1,320 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from decimal import Decimal
+
+from gloe import Transformer, async_transformer, partial_transformer, transformer
+
+executions: list[str] = []
+
+
+@transformer
+def load_rows(day: str) -> list[int]:
+    executions.append("load_rows")
+    return [1, 2, 3] if day == "monday" else [4, 5]
+
+
+@transformer
+def total(rows: list[int]) -> int:
+    executions.append("total")
+    return sum(rows)
+
+
+@transformer
+def render(value: int) -> str:
+    executions.append("render")
+    return f"total: {value}"
+
+
+@transformer
+def count_rows(rows: list[int]) -> int:
+    executions.append("count_rows")
+    return len(rows)
+
+
+@transformer
+def double(value: int) -> int:
+    executions.append("double")
+    return value * 2
+
+
+def _edited_total(rows: list[int]) -> int:
+    executions.append("total")
+    return sum(rows) + 1
+
+
+# the same function as total, after its body was edited
+_edited_total.__name__ = _edited_total.__qualname__ = "total"
+edited_total = transformer(_edited_total)
+
+
+class Multiply(Transformer[int, int]):
+    def __init__(self, factor: int):
+        super().__init__()
+        self.factor = factor
+
+    def transform(self, data: int) -> int:
+        executions.append("multiply")
+        return data * self.factor
+
+
+class Locked(Transformer[int, int]):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def transform(self, data: int) -> int:
+        executions.append("locked")
+        return data
+
+
+@partial_transformer
+def scale(value: int, factor: Decimal) -> float:
+    executions.append("scale")
+    return float(value * factor)
+
+
+@async_transformer
+async def async_total(rows: list[int]) -> int:
+    executions.append("async_total")
+    return sum(rows)
+
+
+class TestIncrementalRun(unittest.TestCase):
+    def setUp(self):
+        executions.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_run_without_options(self):
+        pipeline = load_rows >> total >> render
+        self.assertEqual("total: 6", pipeline.run("monday"))
+
+    def test_unchanged_stages_are_skipped(self):
+        pipeline = load_rows >> total >> render
+
+        self.assertEqual(
+            "total: 6", pipeline.run("monday", incremental_dir=self.directory)
+        )
+        self.assertListEqual(["load_rows", "total", "render"], executions)
+
+        executions.clear()
+        rebuilt = load_rows >> total >> render
+        self.assertEqual(
+            "total: 6", rebuilt.run("monday", incremental_dir=self.directory)
+        )
+        self.assertListEqual([], executions)
+
+        executions.clear()
+        self.assertEqual(
+            "total: 9", rebuilt.run("tuesday", incremental_dir=self.directory)
+        )
+        self.assertListEqual(["load_rows", "total", "render"], executions)
+
+    def test_volatile_stages(self):
+        pipeline = load_rows >> total >> render
+        pipeline.run("monday", incremental_dir=self.directory)
+
+        executions.clear()
+        result = pipeline.run(
+            "monday", incremental_dir=self.directory, volatile=[load_rows]
+        )
+
+        # the output of load_rows is the same, so the next stages are skipped
+        self.assertEqual("total: 6", result)
+        self.assertListEqual(["load_rows"], executions)
+
+    def test_changed_structure_is_recomputed(self):
+        (load_rows >> total >> render).run("monday", incremental_dir=self.directory)
+
+        executions.clear()
+        result = (load_rows >> count_rows >> render).run(
+            "monday", incremental_dir=self.directory
+        )
+        self.assertEqual("total: 3", result)
+        self.assertListEqual(["count_rows", "render"], executions)
+
+    def test_changed_code_is_recomputed(self):
+        (load_rows >> total >> render).run("monday", incremental_dir=self.directory)
+
+        executions.clear()
+        result = (load_rows >> edited_total >> render).run(
+            "monday", incremental_dir=self.directory
+        )
+        self.assertEqual("total: 7", result)
+        self.assertListEqual(["total", "render"], executions)
+
+    def test_changed_configuration_is_recomputed(self):
+        (double >> Multiply(3)).run(1, incremental_dir=self.directory)
+
+        executions.clear()
+        result = (double >> Multiply(4)).run(1, incremental_dir=self.directory)
+        self.assertEqual(8, result)
+        self.assertListEqual(["multiply"], executions)
+
+        (double >> scale(Decimal("1.5"))).run(1, incremental_dir=self.directory)
+
+        executions.clear()
+        scaled = (double >> scale(Decimal("2.5"))).run(
+            1, incremental_dir=self.directory
+        )
+        self.assertEqual(5.0, scaled)
+        self.assertListEqual(["scale"], executions)
+
+    def test_unfingerprintable_stages_are_volatile(self):
+        (double >> Locked()).run(1, incremental_dir=self.directory)
+
+        executions.clear()
+        self.assertEqual(2, (double >> Locked()).run(1, incremental_dir=self.directory))
+        self.assertListEqual(["locked"], executions)
+
+
+class TestAsyncIncrementalRun(unittest.IsolatedAsyncioTestCase):
+    async def test_async_incremental_run(self):
+        executions.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        pipeline = load_rows >> async_total >> render
+        self.assertEqual("total: 6", await pipeline.run("monday"))
+        self.assertEqual(
+            "total: 6", await pipeline.run("monday", incremental_dir=directory.name)
+        )
+
+        executions.clear()
+        self.assertEqual(
+            "total: 6", await pipeline.run("monday", incremental_dir=directory.name)
+        )
+        self.assertListEqual([], executions)
+
+
+class FailingOnce(Exception):
+    pass
+
+
+failures: list[str] = []
+
+
+@transformer
+def flaky_render(value: int) -> str:
+    executions.append("flaky_render")
+    if "flaky_render" not in failures:
+        failures.append("flaky_render")
+        raise FailingOnce()
+    return f"total: {value}"
+
+
+class JsonSerializer:
+    def __init__(self):
+        self.dumped = 0
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return json.dumps(obj).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class TestCheckpointRun(unittest.TestCase):
+    def setUp(self):
+        executions.clear()
+        failures.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_resume_from_last_checkpoint(self):
+        pipeline = load_rows >> total >> flaky_render
+
+        with self.assertRaises(FailingOnce):
+            pipeline.run("monday", checkpoint_dir=self.directory)
+        self.assertListEqual(["load_rows", "total", "flaky_render"], executions)
+
+        executions.clear()
+        result = pipeline.run("monday", checkpoint_dir=self.directory, resume=True)
+        self.assertEqual("total: 6", result)
+        self.assertListEqual(["flaky_render"], executions)
+
+        # the checkpoints are removed after a successful run
+        self.assertListEqual([], os.listdir(self.directory))
+
+    def test_resume_with_another_input(self):
+        pipeline = load_rows >> total >> flaky_render
+
+        with self.assertRaises(FailingOnce):
+            pipeline.run("monday", checkpoint_dir=self.directory)
+
+        executions.clear()
+        result = pipeline.run("tuesday", checkpoint_dir=self.directory, resume=True)
+        self.assertEqual("total: 9", result)
+        self.assertListEqual(["load_rows", "total", "flaky_render"], executions)
+
+    def test_without_resume(self):
+        pipeline = load_rows >> total >> flaky_render
+
+        with self.assertRaises(FailingOnce):
+            pipeline.run("monday", checkpoint_dir=self.directory)
+
+        executions.clear()
+        pipeline.run("monday", checkpoint_dir=self.directory)
+        self.assertListEqual(["load_rows", "total", "flaky_render"], executions)
+
+    def test_checkpoint_granularity(self):
+        pipeline = load_rows >> total >> double >> flaky_render
+
+        with self.assertRaises(FailingOnce):
+            pipeline.run("monday", checkpoint_dir=self.directory, checkpoint_every=2)
+
+        executions.clear()
+        result = pipeline.run(
+            "monday", checkpoint_dir=self.directory, checkpoint_every=2, resume=True
+        )
+        self.assertEqual("total: 12", result)
+        self.assertListEqual(["double", "flaky_render"], executions)
+
+    def test_custom_serializer(self):
+        serializer = JsonSerializer()
+        pipeline = load_rows >> total >> flaky_render
+
+        with self.assertRaises(FailingOnce):
+            pipeline.run("monday", checkpoint_dir=self.directory, serializer=serializer)
+        self.assertEqual(2, serializer.dumped)
+
+        result = pipeline.run(
+            "monday", checkpoint_dir=self.directory, serializer=serializer, resume=True
+        )
+        self.assertEqual("total: 6", result)
+
+    def test_invalid_options(self):
+        pipeline = load_rows >> total
+
+        with self.assertRaises(ValueError):
+            pipeline.run(
+                "monday", checkpoint_dir=self.directory, incremental_dir=self.directory
+            )
+
+        with self.assertRaises(ValueError):
+            pipeline.run("monday", checkpoint_dir=self.directory, checkpoint_every=0)
+
+
+class TestAsyncCheckpointRun(unittest.IsolatedAsyncioTestCase):
+    async def test_async_resume(self):
+        executions.clear()
+        failures.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        pipeline = load_rows >> async_total >> flaky_render
+        with self.assertRaises(FailingOnce):
+            await pipeline.run("monday", checkpoint_dir=directory.name)
+
+        executions.clear()
+        result = await pipeline.run(
+            "monday", checkpoint_dir=directory.name, resume=True
+        )
+        self.assertEqual("total: 6", result)
+        self.assertListEqual(["flaky_render"], executions)
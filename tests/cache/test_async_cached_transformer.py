@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from gloe import async_transformer
+from gloe.cache import AsyncCachedTransformer, CacheInfo, cached
+from gloe.functional import partial_async_transformer
+from gloe.gateways import parallel
+
+calls: list[str] = []
+
+
+@async_transformer
+async def fetch_country(code: str) -> str:
+    calls.append(code)
+    await asyncio.sleep(0.02)
+    return code.lower()
+
+
+@partial_async_transformer
+async def fetch_with_delay(code: str, delay: float) -> str:
+    calls.append(code)
+    await asyncio.sleep(delay)
+    return code.lower()
+
+
+class TestAsyncCachedTransformer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        calls.clear()
+
+    async def test_async_cached_transformer(self):
+        cached_fetch = cached(fetch_country, ttl=60)
+        self.assertIsInstance(cached_fetch, AsyncCachedTransformer)
+
+        self.assertEqual("br", await cached_fetch("BR"))
+        self.assertEqual("br", await cached_fetch("BR"))
+
+        self.assertListEqual(["BR"], calls)
+        self.assertEqual(CacheInfo(1, 1, 128, 1), cached_fetch.cache_info())
+
+    async def test_concurrent_calls_share_execution(self):
+        cached_fetch = cached(fetch_with_delay(0.02))
+
+        results = await asyncio.gather(
+            *[cached_fetch(code) for code in ["BR", "US", "BR", "BR"]]
+        )
+
+        self.assertListEqual(["br", "us", "br", "br"], results)
+        self.assertListEqual(["BR", "US"], calls)
+
+    async def test_cached_inside_parallel_gateway(self):
+        cached_fetch = cached(fetch_country)
+        graph = parallel(cached_fetch, cached_fetch)
+
+        self.assertEqual(("br", "br"), await graph("BR"))
+        self.assertListEqual(["BR"], calls)
+
+    async def test_leader_cancellation(self):
+        cached_fetch = cached(fetch_country)
+
+        leader = asyncio.ensure_future(cached_fetch("BR"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(cached_fetch("BR"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        self.assertEqual("br", await follower)
+        self.assertTrue(leader.cancelled())
+        self.assertListEqual(["BR"], calls)
+
+    async def test_all_callers_cancelled(self):
+        started = asyncio.Event()
+        finished = []
+
+        @async_transformer
+        async def slow_fetch(code: str) -> str:
+            started.set()
+            await asyncio.sleep(10)
+            finished.append(code)
+            return code
+
+        cached_fetch = cached(slow_fetch)
+        caller = asyncio.ensure_future(cached_fetch("BR"))
+        await started.wait()
+
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+
+        await asyncio.sleep(0)
+        self.assertEqual(0, len(cached_fetch._in_flight))
+        self.assertListEqual([], finished)
+
+    async def test_errors_are_not_cached(self):
+        attempts = []
+
+        @async_transformer
+        async def flaky_fetch(code: str) -> str:
+            attempts.append(code)
+            if len(attempts) == 1:
+                raise ConnectionError()
+            return code
+
+        cached_fetch = cached(flaky_fetch)
+        with self.assertRaises(ConnectionError):
+            await cached_fetch("BR")
+
+        self.assertEqual("BR", await cached_fetch("BR"))
+        self.assertEqual(2, len(attempts))
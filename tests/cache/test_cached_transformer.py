@@ -0,0 +1,89 @@
+import time
+import unittest
+
+from gloe import UnsupportedTransformerArgException, transformer
+from gloe.cache import CacheInfo, cached
+from tests.lib.transformers import minus1, plus1
+
+calls: list[str] = []
+
+
+@transformer
+def country_name(code: str) -> str:
+    calls.append(code)
+    return code.lower()
+
+
+class TestCachedTransformer(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_cached_transformer(self):
+        cached_name = cached(country_name)
+
+        self.assertEqual("br", cached_name("BR"))
+        self.assertEqual("br", cached_name("BR"))
+        self.assertEqual("us", cached_name("US"))
+
+        self.assertListEqual(["BR", "US"], calls)
+        self.assertEqual(CacheInfo(1, 2, 128, 2), cached_name.cache_info())
+
+    def test_cached_transformer_composition(self):
+        cached_plus1 = cached(plus1)
+        graph = minus1 >> cached_plus1 >> minus1
+
+        self.assertEqual(1.0, graph(2.0))
+        self.assertEqual(1.0, graph(2.0))
+        self.assertEqual(CacheInfo(1, 1, 128, 1), cached_plus1.cache_info())
+
+    def test_cached_transformer_lru_eviction(self):
+        cached_name = cached(maxsize=2)(country_name)
+
+        for code in ["BR", "US", "BR", "AR", "US"]:
+            cached_name(code)
+
+        # US was the least recently used when AR was added
+        self.assertListEqual(["BR", "US", "AR", "US"], calls)
+        self.assertEqual(2, cached_name.cache_info().currsize)
+
+    def test_cached_transformer_ttl(self):
+        cached_name = cached(country_name, ttl=0.05)
+
+        cached_name("BR")
+        cached_name("BR")
+        time.sleep(0.06)
+        cached_name("BR")
+
+        self.assertListEqual(["BR", "BR"], calls)
+
+    def test_cached_transformer_key_and_invalidate(self):
+        cached_name = cached(country_name, key=lambda code: code.upper())
+
+        cached_name("br")
+        cached_name("BR")
+        self.assertListEqual(["br"], calls)
+
+        cached_name.invalidate("Br")
+        cached_name("BR")
+        cached_name("US")
+        cached_name.invalidate()
+        cached_name("US")
+
+        self.assertListEqual(["br", "BR", "US", "US"], calls)
+
+    def test_cached_transformer_graph(self):
+        graph = minus1 >> cached(plus1)
+
+        subgraphs = graph.graph().subgraphs
+        self.assertEqual(1, len(subgraphs))
+        self.assertEqual("cached(plus1)", subgraphs[0].attrs["label"])
+
+    def test_cached_transformer_invalid_args(self):
+        with self.assertRaises(ValueError):
+            cached(plus1, maxsize=0)
+
+        with self.assertRaises(ValueError):
+            cached(plus1, ttl=0)
+
+        with self.assertRaises(UnsupportedTransformerArgException):
+            cached(len)  # type: ignore
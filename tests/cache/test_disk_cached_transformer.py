@@ -0,0 +1,162 @@
+import os
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+
+from gloe import Transformer, async_transformer, transformer
+from gloe._fingerprint import _fingerprint
+from gloe.cache import disk_cached
+
+calls: list[dict] = []
+
+
+@dataclass
+class Document:
+    title: str
+    tags: set[str]
+
+
+@transformer
+def count_words(document: dict) -> int:
+    calls.append(document)
+    return len(document["text"].split())
+
+
+@transformer
+def strip_text(document: dict) -> dict:
+    return {**document, "text": document["text"].strip()}
+
+
+@transformer
+def upper_text(document: dict) -> dict:
+    return {**document, "text": document["text"].upper()}
+
+
+@transformer
+def repeat_text(document: dict) -> dict:
+    return {**document, "text": f"{document['text']} {document['text']}"}
+
+
+class Multiply(Transformer[int, int]):
+    def __init__(self, factor: int):
+        super().__init__()
+        self.factor = factor
+
+    def transform(self, data: int) -> int:
+        calls.append({"factor": self.factor})
+        return data * self.factor
+
+
+@async_transformer
+async def async_count_words(document: dict) -> int:
+    calls.append(document)
+    return len(document["text"].split())
+
+
+class TestDiskCachedTransformer(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache", "gloe.db")
+
+    def _cached(self, **kwargs):
+        cached_count = disk_cached(count_words, self.path, **kwargs)
+        self.addCleanup(cached_count._store.close)
+        return cached_count
+
+    def test_disk_cached_transformer(self):
+        cached_count = self._cached()
+
+        self.assertEqual(2, cached_count({"text": "hello world", "lang": "en"}))
+        self.assertEqual(2, cached_count({"lang": "en", "text": "hello world"}))
+
+        self.assertEqual(1, len(calls))
+        info = cached_count.cache_info()
+        self.assertEqual((1, 1, None, 1), info)
+        self.assertEqual(0.5, info.hit_ratio)
+
+    def test_outcomes_survive_restarts(self):
+        self._cached()({"text": "hello world"})
+
+        restarted = self._cached()
+        self.assertEqual(2, restarted({"text": "hello world"}))
+        self.assertEqual(1, len(calls))
+
+        new_version = self._cached(version="v2")
+        self.assertEqual(2, new_version({"text": "hello world"}))
+        self.assertEqual(2, len(calls))
+
+    def test_transformers_with_the_same_label(self):
+        upper_count = disk_cached(strip_text >> upper_text >> count_words, self.path)
+        repeat_count = disk_cached(strip_text >> repeat_text >> count_words, self.path)
+        self.addCleanup(upper_count._store.close)
+        self.addCleanup(repeat_count._store.close)
+        self.assertEqual(upper_count.label, repeat_count.label)
+
+        self.assertEqual(2, upper_count({"text": "hello world"}))
+        self.assertEqual(4, repeat_count({"text": "hello world"}))
+        self.assertEqual(2, len(calls))
+
+    def test_parameterized_transformers(self):
+        triple = disk_cached(Multiply(3), self.path)
+        quadruple = disk_cached(Multiply(4), self.path)
+        self.addCleanup(triple._store.close)
+        self.addCleanup(quadruple._store.close)
+
+        self.assertEqual(15, triple(5))
+        self.assertEqual(20, quadruple(5))
+        self.assertEqual(2, len(calls))
+
+        unpicklable = Multiply(3)
+        unpicklable.lock = threading.Lock()  # type: ignore[attr-defined]
+        with self.assertRaises(ValueError):
+            disk_cached(unpicklable, self.path)
+
+    def test_size_based_eviction(self):
+        cached_count = self._cached(max_bytes=30)
+
+        for index in range(20):
+            cached_count({"text": "word " * index})
+
+        self.assertEqual(6, cached_count.cache_info().currsize)
+        calls.clear()
+        cached_count({"text": "word " * 19})
+        self.assertEqual(0, len(calls))
+
+    def test_invalidate(self):
+        cached_count = self._cached()
+        cached_count({"text": "a"})
+        cached_count({"text": "b"})
+
+        cached_count.invalidate({"text": "a"})
+        self.assertEqual(1, cached_count.cache_info().currsize)
+
+        cached_count.invalidate()
+        self.assertEqual(0, cached_count.cache_info().currsize)
+
+    def test_fingerprint_is_stable(self):
+        document = Document("report", {"b", "a", "c"})
+
+        self.assertEqual(
+            _fingerprint(document), _fingerprint(Document("report", {"c", "a", "b"}))
+        )
+        self.assertNotEqual(_fingerprint((1, "1")), _fingerprint((1, 1)))
+        self.assertNotEqual(_fingerprint([1, 2]), _fingerprint((1, 2)))
+
+
+class TestAsyncDiskCachedTransformer(unittest.IsolatedAsyncioTestCase):
+    async def test_async_disk_cached_transformer(self):
+        calls.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        cached_count = disk_cached(
+            async_count_words, os.path.join(directory.name, "gloe.db")
+        )
+        self.addCleanup(cached_count._store.close)
+
+        self.assertEqual(2, await cached_count({"text": "hello world"}))
+        self.assertEqual(2, await cached_count({"text": "hello world"}))
+        self.assertEqual(1, len(calls))
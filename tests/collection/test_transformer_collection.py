@@ -1,8 +1,9 @@
 import unittest
 
 from gloe.functional import transformer
-from gloe.collection import Map, MapOver, Filter
-from tests.lib.transformers import square, plus1, sum_tuple2
+from gloe.collection import Map, MapOver, Filter, StreamMap, StreamFilter
+from tests.lib.transformers import square, plus1, sum_tuple2, natural_logarithm
+from tests.lib.exceptions import LnOfNegativeNumber
 
 
 class TestTransformerCollection(unittest.TestCase):
@@ -33,6 +34,22 @@ class TestTransformerCollection(unittest.TestCase):
         self.assertListEqual(expected, result1)
         self.assertListEqual(expected, result2)
 
+    def test_transformer_map_with_executor(self):
+        seq = [10.0, 9.0, 3.0, 2.0, -1.0]
+        expected = [101.0, 82.0, 10.0, 5.0, 2.0]
+
+        for executor in ["threads", "processes"]:
+            mapping = Map(
+                square >> plus1, executor=executor, chunksize=2  # type: ignore
+            )
+            self.assertListEqual(expected, mapping(seq))
+            self.assertListEqual(expected[:1], mapping(seq[:1]))
+            self.assertListEqual([], mapping([]))
+
+    def test_transformer_map_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            Map(square, executor="threads", chunksize=0)
+
     def test_transformer_filter(self):
         """
         Test the filter transformer
@@ -79,3 +96,31 @@ class TestTransformerCollection(unittest.TestCase):
                 "User Alice has the role manager_role.",
             ],
         )
+
+    def test_transformer_stream_map_and_filter(self):
+        consumed = []
+
+        def read_numbers():
+            for num in [3, 4, 1, 5]:
+                consumed.append(num)
+                yield num
+
+        @transformer
+        def is_even(num: float) -> bool:
+            return num % 2 == 0
+
+        graph = StreamMap(plus1) >> StreamFilter(is_even) >> StreamMap(square)
+        result = graph(read_numbers())
+
+        self.assertListEqual([], consumed)
+        self.assertEqual(16, next(result))
+        self.assertListEqual([3], consumed)
+        self.assertListEqual([4, 36], list(result))
+        self.assertListEqual([3, 4, 1, 5], consumed)
+
+    def test_transformer_stream_map_errors_on_consumption(self):
+        result = StreamMap(natural_logarithm)([1.0, -1.0])
+
+        self.assertEqual(0.0, next(result))
+        with self.assertRaises(LnOfNegativeNumber):
+            next(result)
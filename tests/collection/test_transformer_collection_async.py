@@ -1,7 +1,9 @@
+import asyncio
 import unittest
 
 from gloe import async_transformer
 from gloe.collection import Map, FilterAsync, MapAsync, MapOverAsync
+from gloe.exceptions import CollectionItemsException
 from tests.lib.transformers import (
     square,
     plus1,
@@ -56,3 +58,61 @@ class TestTransformerCollectionAsync(unittest.IsolatedAsyncioTestCase):
         result = list(await mapping(-1.0))
 
         self.assertListEqual(result, data)
+
+    async def test_transformer_async_map_concurrency(self):
+        running = 0
+        max_running = 0
+
+        @async_transformer
+        async def delayed_double(num: int) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01 * (num % 3))
+            running -= 1
+            return num * 2
+
+        seq = list(range(10))
+        result = await MapAsync(delayed_double, concurrency=3)(seq)
+
+        self.assertListEqual([num * 2 for num in seq], result)
+        self.assertEqual(3, max_running)
+
+    async def test_transformer_async_filter_concurrency(self):
+        @async_transformer
+        async def is_even(num: int) -> bool:
+            await asyncio.sleep(0.01 * (num % 3))
+            return num % 2 == 0
+
+        result = await FilterAsync(is_even, concurrency=None)([10, 9, 3, 2, 1, 4])
+        self.assertListEqual([10, 2, 4], result)
+
+    async def test_transformer_async_map_over_concurrency(self):
+        data = [10.0, 9.0, 3.0, 2.0, -1.0]
+        mapping = MapOverAsync(data, async_sum_tuple2, concurrency=2)
+
+        self.assertListEqual([9.0, 8.0, 2.0, 1.0, -2.0], await mapping(-1.0))
+
+    async def test_transformer_async_map_errors(self):
+        @async_transformer
+        async def inverse(num: float) -> float:
+            await asyncio.sleep(0)
+            return 1 / num
+
+        with self.assertRaises(ZeroDivisionError):
+            await MapAsync(inverse, concurrency=2)([1.0, 0.0, 2.0])
+
+        collecting = MapAsync(inverse, concurrency=2, on_error="collect")
+        with self.assertRaises(CollectionItemsException) as context:
+            await collecting([1.0, 0.0, 2.0, 0.0])
+
+        self.assertListEqual([1, 3], sorted(context.exception.errors.keys()))
+        self.assertIsInstance(context.exception.errors[1], ZeroDivisionError)
+        self.assertListEqual([1.0, 0.5], context.exception.results)
+
+    def test_transformer_async_map_invalid_args(self):
+        with self.assertRaises(ValueError):
+            MapAsync(async_plus1, concurrency=0)
+
+        with self.assertRaises(ValueError):
+            FilterAsync(async_plus1, on_error="ignore")  # type: ignore
@@ -1,9 +1,9 @@
-from typing import TypeVar
+from typing import Iterator, TypeVar
 
 from typing_extensions import assert_type
 
 from gloe import Transformer
-from gloe.collection import Map, Filter
+from gloe.collection import Map, Filter, StreamMap, StreamFilter
 from gloe.utils import forward
 from tests.lib.transformers import format_currency, check_is_even
 from tests.type_utils.mypy_test_suite import MypyTestSuite
@@ -32,3 +32,16 @@ class TestTransformerCollectionTypes(MypyTestSuite):
         mapped_logarithm = forward[list[float]]() >> Filter(check_is_even)
 
         assert_type(mapped_logarithm, Transformer[list[float], list[float]])
+
+    def test_transformer_stream_map(self):
+        """
+        Test the transformer stream map collection operation
+        """
+
+        mapped_currency = (
+            forward[list[float]]()
+            >> StreamFilter(check_is_even)
+            >> StreamMap(format_currency(thousands_separator=","))
+        )
+
+        assert_type(mapped_currency, Transformer[list[float], Iterator[str]])
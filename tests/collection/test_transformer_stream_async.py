@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from typing import AsyncIterable, AsyncIterator
+
+from gloe import async_transformer, stream_transformer, transformer
+from gloe.collection import AsyncStreamFilter, AsyncStreamMap
+from tests.lib.exceptions import LnOfNegativeNumber
+from tests.lib.transformers import async_plus1, natural_logarithm, square
+
+
+@stream_transformer
+async def duplicate_items(items: AsyncIterable[float]) -> AsyncIterator[float]:
+    async for item in items:
+        yield item
+        yield item
+
+
+async def produce(items: list[float], produced: list[float]) -> AsyncIterator[float]:
+    for item in items:
+        produced.append(item)
+        yield item
+
+
+class TestTransformerStreamAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_async_stream_map_and_filter(self):
+        @async_transformer
+        async def is_even(num: float) -> bool:
+            await asyncio.sleep(0)
+            return num % 2 == 0
+
+        graph = (
+            duplicate_items
+            >> AsyncStreamMap(async_plus1)
+            >> AsyncStreamFilter(is_even)
+            >> AsyncStreamMap(square)
+        )
+
+        produced: list[float] = []
+        result = await graph(produce([1.0, 2.0, 3.0], produced))
+        self.assertListEqual([], produced)
+
+        self.assertListEqual([4.0, 4.0, 16.0, 16.0], [item async for item in result])
+        self.assertListEqual([1.0, 2.0, 3.0], produced)
+
+    async def test_async_stream_backpressure(self):
+        produced: list[float] = []
+        graph = AsyncStreamMap(async_plus1, buffer_size=2)
+        result = await graph(produce([float(i) for i in range(100)], produced))
+
+        self.assertEqual(1.0, await result.__anext__())
+        await asyncio.sleep(0.01)
+        # the consumed item, the buffered ones and the one waiting for a free slot
+        self.assertLessEqual(len(produced), 4)
+
+        self.assertEqual(99, len([item async for item in result]))
+
+    async def test_buffered_stream_transformer(self):
+        @stream_transformer(buffer_size=1)
+        async def cumulative_sum(items: AsyncIterable[float]) -> AsyncIterator[float]:
+            total = 0.0
+            async for item in items:
+                total += item
+                yield total
+
+        result = await cumulative_sum(produce([1.0, 2.0, 3.0], []))
+        self.assertListEqual([1.0, 3.0, 6.0], [item async for item in result])
+
+    async def test_async_stream_errors_on_consumption(self):
+        @transformer
+        def is_positive(num: float) -> bool:
+            return num > 0
+
+        graph = AsyncStreamMap(natural_logarithm, buffer_size=1) >> AsyncStreamFilter(
+            is_positive
+        )
+        result = await graph(produce([1.0, -1.0], []))
+
+        with self.assertRaises(LnOfNegativeNumber):
+            [item async for item in result]
+
+    def test_async_stream_invalid_buffer_size(self):
+        with self.assertRaises(ValueError):
+            AsyncStreamMap(async_plus1, buffer_size=0)
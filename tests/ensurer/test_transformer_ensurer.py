@@ -329,3 +329,28 @@ class TestTransformerEnsurer(unittest.TestCase):
         ensured_pipeline = not_equal_ensurer(int_identity >> int_identity) >> forward()
 
         self.assertRaises(NumbersEqual, lambda: ensured_pipeline(2))
+
+    def test_pipeline_ensurer_keeps_reused_copies(self):
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        pipeline = int_identity >> int_identity
+        reused = int_identity >> pipeline
+
+        ensured_pipeline = ensure(incoming=[is_odd])(pipeline)
+
+        self.assertRaises(NumberIsEven, lambda: ensured_pipeline(2))
+        self.assertEqual(2, reused(2))
+
+    def test_pipeline_ensurer_keeps_earlier_compositions(self):
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        pipeline = int_identity >> int_identity
+        extended = pipeline >> int_identity
+
+        ensure(incoming=[is_odd])(pipeline)
+
+        self.assertEqual(2, extended(2))
@@ -0,0 +1,127 @@
+import unittest
+from typing import cast
+
+from gloe import TransformerException, transformer
+from gloe.interceptors import (
+    Interceptor,
+    add_interceptor,
+    intercepting,
+    remove_interceptor,
+)
+from gloe.interceptors import _interceptor
+from tests.lib.transformers import async_plus1, minus1, plus1, square
+
+calls: list[str] = []
+
+
+class Record(Interceptor):
+    def __init__(self, name: str):
+        self.name = name
+
+    def intercept(self, node, data, call_next):
+        calls.append(f"{self.name}:{node.label}")
+        return call_next(data)
+
+
+class Negate(Interceptor):
+    """Short-circuits the square nodes"""
+
+    def intercept(self, node, data, call_next):
+        if node.label == "square":
+            return -data
+        return call_next(data)
+
+
+class Retry(Interceptor):
+    def intercept(self, node, data, call_next):
+        try:
+            return call_next(data)
+        except ConnectionError:
+            return call_next(data)
+
+
+class Forbid(Interceptor):
+    def intercept(self, node, data, call_next):
+        raise PermissionError(node.label)
+
+
+class AsyncDouble(Interceptor):
+    async def intercept_async(self, node, data, call_next):
+        calls.append(f"async:{node.label}")
+        return await call_next(data * 2)
+
+
+failures: list[float] = []
+
+
+@transformer
+def flaky(num: float) -> float:
+    if num not in failures:
+        failures.append(num)
+        raise ConnectionError()
+    return num
+
+
+class TestInterceptor(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+        failures.clear()
+
+    def test_no_interceptors(self):
+        self.assertIsNone(_interceptor._chain)
+        self.assertIsNone(_interceptor._async_chain)
+
+    def test_interceptors_order(self):
+        outer, inner = Record("outer"), Record("inner")
+        with intercepting(outer, inner):
+            self.assertEqual(4, (plus1 >> plus1)(2))
+
+        self.assertListEqual(
+            ["outer:plus1", "inner:plus1", "outer:plus1", "inner:plus1"], calls
+        )
+        self.assertIsNone(_interceptor._chain)
+
+    def test_short_circuit(self):
+        with intercepting(Negate()):
+            self.assertEqual(-4, (plus1 >> square)(3))
+            self.assertEqual(-4, (plus1 >> square).compile()(3))
+
+    def test_retry(self):
+        with intercepting(Retry()):
+            self.assertEqual(2, (plus1 >> flaky)(1))
+
+    def test_add_and_remove(self):
+        record = Record("record")
+        add_interceptor(record)
+        minus1(1)
+        remove_interceptor(record)
+        minus1(1)
+
+        self.assertListEqual(["record:minus1"], calls)
+
+    def test_error_raised_by_interceptor(self):
+        with intercepting(Forbid()):
+            with self.assertRaises(PermissionError) as context:
+                (plus1 >> square)(1)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        self.assertEqual(plus1, exception_ctx.raiser_transformer)
+
+    def test_sync_interceptor_is_not_added_to_async_chain(self):
+        with intercepting(Record("record")):
+            self.assertIsNotNone(_interceptor._chain)
+            self.assertIsNone(_interceptor._async_chain)
+
+
+class TestAsyncInterceptor(unittest.IsolatedAsyncioTestCase):
+    async def test_async_interceptor(self):
+        calls.clear()
+        graph = plus1 >> async_plus1 >> square
+
+        with intercepting(AsyncDouble(), Record("record")):
+            self.assertEqual(25, await graph(1))
+            self.assertEqual(25, await graph.compile()(1))
+
+        self.assertListEqual(
+            ["record:plus1", "async:async_plus1", "record:square"] * 2, calls
+        )
@@ -0,0 +1,47 @@
+import unittest
+
+from gloe.collection import Map
+from gloe.profiling import footprint
+from tests.lib.transformers import plus1, repeat_list, square
+
+
+class TestFootprint(unittest.TestCase):
+    def test_single_transformer(self):
+        result = footprint(plus1)
+
+        self.assertEqual(1, result.nodes)
+        self.assertEqual(1, result.classes)
+        self.assertEqual(0, result.graphs)
+        self.assertGreater(result.size, 0)
+
+    def test_pipeline_retains_its_nodes(self):
+        pipeline = plus1 >> square >> plus1
+        result = footprint(pipeline)
+
+        self.assertGreaterEqual(result.nodes, 3)
+        self.assertGreater(result.size, footprint(plus1).size)
+
+    def test_children_are_counted(self):
+        mapping = Map(plus1 >> square)
+        pipeline = repeat_list(3) >> mapping
+
+        self.assertGreater(footprint(pipeline).nodes, footprint(mapping).nodes)
+        self.assertGreaterEqual(footprint(mapping).nodes, 3)
+
+    def test_cached_graphs_are_counted(self):
+        pipeline = plus1 >> square
+        before = footprint(pipeline)
+
+        pipeline.graph()
+        after = footprint(pipeline)
+
+        self.assertEqual(before.graphs + 1, after.graphs)
+        self.assertGreater(after.size, before.size)
+
+    def test_graph_cache_is_not_shared_by_copies(self):
+        pipeline = plus1 >> square
+        graph = pipeline.graph()
+
+        self.assertIs(graph, pipeline.graph())
+        self.assertIsNot(graph, pipeline.copy(regenerate_instance_id=True).graph())
+        self.assertEqual(0, footprint(pipeline.copy()).graphs)
@@ -0,0 +1,244 @@
+import unittest
+from typing import cast
+
+from gloe import async_transformer, transformer
+from gloe.cache import CachedTransformer, cached
+from gloe.collection import Map, MapAsync
+from gloe.conditional import condition
+from gloe.profiling import Profiler
+from gloe.interceptors import _interceptor
+from gloe.profiling._histogram import _Histogram
+from tests.lib.transformers import (
+    async_plus1,
+    minus1,
+    plus1,
+    square,
+    sum_all,
+    sum_tuple2,
+)
+
+
+@transformer
+def listify(num: float) -> list[float]:
+    return [num, num + 1, num + 2]
+
+
+@condition
+def is_positive(num: float) -> bool:
+    return num > 0
+
+
+@transformer(batch=True)
+def double_batch(nums: list[float]) -> list[float]:
+    return [num * 2 for num in nums]
+
+
+@async_transformer(batch=True)
+async def async_double_batch(nums: list[float]) -> list[float]:
+    return [num * 2 for num in nums]
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_profiler(self):
+        profiler = Profiler()
+        (plus1 >> square)(1)
+
+        self.assertIsNone(_interceptor._chain)
+        self.assertListEqual([], profiler.stats)
+
+    def test_nodes_are_measured(self):
+        graph = plus1 >> (square, minus1) >> sum_tuple2
+
+        with Profiler() as profiler:
+            for i in range(10):
+                graph(i)
+
+        self.assertIsNone(_interceptor._chain)
+        for label in ["plus1", "square", "minus1", "sum_tuple2"]:
+            [stats] = profiler.find(label)
+            self.assertEqual(10, stats.calls)
+            self.assertEqual(10, stats.samples)
+            self.assertGreater(stats.mean, 0)
+            self.assertGreaterEqual(stats.percentile(99), stats.percentile(50))
+
+    def test_collection_and_conditioner_children(self):
+        graph = listify >> Map(plus1)
+        conditioned = is_positive.Then(square).Else(minus1)
+
+        with Profiler() as profiler:
+            graph(1)
+            conditioned(2)
+            conditioned(-2)
+
+        self.assertEqual(3, profiler.find("plus1")[0].calls)
+        self.assertEqual(1, profiler.find("square")[0].calls)
+        self.assertEqual(1, profiler.find("minus1")[0].calls)
+
+    def test_sampling(self):
+        with Profiler(sample_rate=0.25) as profiler:
+            for i in range(20):
+                plus1(i)
+
+        stats = profiler[plus1]
+        self.assertEqual(20, stats.calls)
+        self.assertEqual(5, stats.samples)
+        self.assertAlmostEqual(stats.mean * 20, stats.total)
+
+    def test_compiled_flow(self):
+        graph = (plus1 >> square).compile()
+
+        with Profiler() as profiler:
+            graph(1)
+
+        self.assertEqual(1, profiler.find("plus1")[0].calls)
+        self.assertEqual(1, profiler.find("square")[0].calls)
+
+    def test_failing_node_is_measured(self):
+        @transformer
+        def fail(num: float) -> float:
+            raise ValueError()
+
+        with Profiler() as profiler:
+            with self.assertRaises(ValueError):
+                (plus1 >> fail)(1)
+
+        self.assertEqual(1, profiler.find("fail")[0].samples)
+
+    def test_report_and_reset(self):
+        with Profiler() as profiler:
+            (plus1 >> square)(1)
+
+        report = profiler.report()
+        self.assertIn("plus1", report)
+        self.assertIn("square", report)
+
+        profiler.reset()
+        self.assertListEqual([], profiler.stats)
+
+    def test_invalid_sample_rate(self):
+        with self.assertRaises(ValueError):
+            Profiler(sample_rate=0)
+
+    def test_batches_are_measured(self):
+        pipeline = plus1 >> double_batch
+
+        with Profiler() as profiler:
+            self.assertListEqual([4, 6, 8], Map(pipeline)([1, 2, 3]))
+            self.assertListEqual([4, 6], pipeline.map_batch([1, 2]))
+
+        # each batch is a single call of the node
+        for label in ["plus1", "double_batch"]:
+            self.assertEqual(2, sum(stats.calls for stats in profiler.find(label)))
+
+
+class TestAsyncProfiler(unittest.IsolatedAsyncioTestCase):
+    async def test_async_nodes_are_measured(self):
+        graph = plus1 >> async_plus1 >> square
+
+        with Profiler() as profiler:
+            await graph(1)
+            await graph.compile()(1)
+
+        for label in ["plus1", "async_plus1", "square"]:
+            self.assertEqual(2, sum(stats.calls for stats in profiler.find(label)))
+
+    async def test_async_batches_are_measured(self):
+        pipeline = plus1 >> async_double_batch
+
+        with Profiler() as profiler:
+            self.assertListEqual([4, 6, 8], await MapAsync(pipeline)([1, 2, 3]))
+            self.assertListEqual([4, 6], await pipeline.map_batch([1, 2]))
+
+        for label in ["plus1", "async_double_batch"]:
+            self.assertEqual(2, sum(stats.calls for stats in profiler.find(label)))
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentiles_relative_error(self):
+        histogram = _Histogram(precision=5)
+        for value in range(1, 100001):
+            histogram.record(value)
+
+        for percentile in [1, 50, 90, 99]:
+            expected = percentile * 1000
+            self.assertAlmostEqual(
+                expected, histogram.percentile(percentile), delta=expected / 32
+            )
+        self.assertEqual(100000, histogram.count)
+
+    def test_buckets_are_contiguous(self):
+        histogram = _Histogram(precision=2)
+        for value in range(256):
+            histogram.record(value)
+
+        expected_lowest = 0
+        for lowest, highest, count in histogram.buckets():
+            self.assertEqual(expected_lowest, lowest)
+            self.assertEqual(highest - lowest + 1, count)
+            expected_lowest = highest + 1
+
+    def test_empty_histogram(self):
+        self.assertEqual(0, _Histogram().percentile(50))
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    def test_graph_overlay(self):
+        graph = (
+            listify >> Map(plus1) >> sum_all >> is_positive.Then(square).Else(minus1)
+        )
+
+        with Profiler() as profiler:
+            graph(1)
+            graph(2)
+
+        structure = graph.graph()
+        overlaid = graph._plotted_graph(profiler)
+        self.assertIsNot(structure, overlaid)
+        self.assertIs(structure, graph._plotted_graph(None))
+
+        listify_node = overlaid.nodes[graph._flow[0].node_id]
+        self.assertTrue(listify_node["label"].startswith("listify\n2 calls"))
+        self.assertEqual("filled", listify_node["style"])
+        self.assertNotIn("fillcolor", structure.nodes[graph._flow[0].node_id])
+
+        # only the "then" branch of the conditioner was executed
+        branch_labels = [
+            attrs["label"].split(" |")[0]
+            for (_, target), attrs in overlaid.edges.items()
+            if overlaid.nodes.get(target, {})
+            .get("label", "")
+            .startswith(("square", "minus1"))
+        ]
+        self.assertListEqual(["float\n2 items", "float"], branch_labels)
+
+        [cluster] = overlaid.subgraphs
+        self.assertTrue(cluster.attrs["label"].startswith("Map\n2 calls"))
+        mapped_node = cluster.nodes[graph._flow[1].children[0].node_id]
+        self.assertTrue(mapped_node["label"].startswith("plus1\n6 calls"))
+
+    def test_cached_child_overlay(self):
+        graph = plus1 >> cached(square)
+
+        with Profiler() as profiler:
+            graph(1)
+            graph(1)
+            graph(2)
+
+        cached_square = cast(CachedTransformer, graph._flow[1])
+        self.assertIs(cached_square.children[0], cached_square.transformer)
+
+        overlaid = graph._plotted_graph(profiler)
+        [cluster] = overlaid.subgraphs
+        self.assertTrue(cluster.attrs["label"].startswith("cached(square)\n3 calls"))
+        square_node = cluster.nodes[cached_square.children[0].node_id]
+        self.assertTrue(square_node["label"].startswith("square\n2 calls"))
+
+    def test_elapsed_time(self):
+        profiler = Profiler()
+        self.assertEqual(0, profiler.elapsed)
+
+        with profiler:
+            plus1(1)
+        elapsed = profiler.elapsed
+        self.assertGreater(elapsed, 0)
+        self.assertEqual(elapsed, profiler.elapsed)
@@ -1,7 +1,27 @@
+import asyncio
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import cast
+from unittest.mock import patch
 
-from gloe.gateways import sequential, parallel
-from tests.lib.transformers import plus1, minus1, async_plus1, sum_tuple2
+from gloe import async_transformer, transformer
+from gloe._executors import (
+    _SHIPPED_FLOWS_SIZE,
+    _FlowExecutor,
+    _load_shipped_flow,
+)
+from gloe.exceptions import UnsupportedExecutorArgException
+from gloe.experimental import bridge
+from gloe.gateways import (
+    parallel,
+    sequential,
+    set_default_executor,
+    shutdown_executors,
+)
+from gloe.gateways._parallel import _Parallel
+from tests.lib.transformers import plus1, minus1, async_plus1, sum_tuple2, times2
 
 
 class TestGateways(unittest.TestCase):
@@ -10,6 +30,86 @@ class TestGateways(unittest.TestCase):
 
         self.assertEqual((11.0, 9.0), graph(10.0))
 
+    def test_parallel_gateway_with_threads(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        @transformer
+        def wait_plus1(num: float) -> float:
+            barrier.wait()
+            return num + 1
+
+        @transformer
+        def wait_minus1(num: float) -> float:
+            barrier.wait()
+            return num - 1
+
+        graph = parallel(wait_plus1, wait_minus1, executor="threads")
+
+        self.assertEqual((11.0, 9.0), graph(10.0))
+        self.assertEqual((6.0, 4.0), graph(5.0))
+
+    def test_parallel_gateway_with_given_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            graph = parallel(plus1 >> times2, minus1, executor=executor) >> sum_tuple2
+
+            self.assertEqual(31.0, graph(10.0))
+
+    def test_parallel_gateway_threads_see_context(self):
+        num_bridge = bridge[float]("num")
+
+        graph = num_bridge.pick() >> parallel(
+            plus1 >> num_bridge.drop(), minus1, executor="threads"
+        )
+
+        self.assertEqual(((11.0, 10.0), 9.0), graph(10.0))
+
+    def test_parallel_gateway_with_processes(self):
+        graph = parallel(plus1 >> times2, minus1, executor="processes", max_workers=2)
+
+        self.assertEqual((22.0, 9.0), graph(10.0))
+        self.assertEqual((12.0, 4.0), graph(5.0))
+
+    def test_shutdown_executors(self):
+        graph = parallel(plus1, minus1, executor="threads")
+        given_executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(given_executor.shutdown)
+        given_graph = parallel(plus1, minus1, executor=given_executor)
+        graph(10.0)
+        given_graph(10.0)
+
+        flow_executor = cast(_FlowExecutor, cast(_Parallel, graph)._executor)
+        pool = flow_executor.executor
+        shutdown_executors()
+
+        self.assertIsNone(flow_executor._executor)
+        self.assertRaises(RuntimeError, lambda: pool.submit(print))
+        self.assertEqual((11.0, 9.0), given_graph(10.0))
+
+        # the pool is created again on the next execution
+        self.assertEqual((11.0, 9.0), graph(10.0))
+        self.assertIsNot(pool, flow_executor.executor)
+
+    def test_shipped_flows_are_bounded(self):
+        flow_executor = _FlowExecutor("processes")
+        flows = [(plus1 >> minus1)._flow for _ in range(_SHIPPED_FLOWS_SIZE + 1)]
+        shipped = [flow_executor._ship(flow) for flow in flows]
+
+        self.assertEqual(_SHIPPED_FLOWS_SIZE, len(flow_executor._shipped))
+        self.assertEqual(shipped[-1], flow_executor._ship(flows[-1]))
+        # the least recently used flow was dropped, so it is shipped again
+        self.assertNotEqual(shipped[0][0], flow_executor._ship(flows[0])[0])
+
+        shipped_flows: OrderedDict = OrderedDict()
+        with patch("gloe._executors._shipped_flows", shipped_flows):
+            for key, payload in shipped:
+                _load_shipped_flow(key, payload)
+            self.assertEqual(_SHIPPED_FLOWS_SIZE, len(shipped_flows))
+            self.assertNotIn(shipped[0][0], shipped_flows)
+
+    def test_parallel_gateway_unsupported_executor(self):
+        with self.assertRaises(UnsupportedExecutorArgException):
+            parallel(plus1, minus1, executor="fibers")  # type: ignore
+
     def test_sequential_gateway(self):
         graph = sequential(plus1, minus1)
 
@@ -27,3 +127,37 @@ class TestAsyncGateways(unittest.IsolatedAsyncioTestCase):
         graph = sequential(async_plus1, plus1) >> sum_tuple2
         result = await graph(10.0)
         self.assertEqual(22.0, result)
+
+    async def test_async_parallel_gateway_offloads_sync_branches(self):
+        released = threading.Event()
+
+        @transformer
+        def blocking_branch(num: float) -> float:
+            self.assertTrue(released.wait(timeout=5))
+            return num + 1
+
+        @async_transformer
+        async def releasing_branch(num: float) -> float:
+            await asyncio.sleep(0.01)
+            released.set()
+            return num - 1
+
+        graph = parallel(blocking_branch, releasing_branch, executor="threads")
+        self.assertEqual((11.0, 9.0), await graph(10.0))
+
+    async def test_async_parallel_gateway_default_executor(self):
+        loop_thread = threading.get_ident()
+
+        @transformer
+        def thread_ident(num: float) -> int:
+            return threading.get_ident()
+
+        graph = parallel(async_plus1, thread_ident)
+        self.assertEqual((11.0, loop_thread), await graph(10.0))
+
+        set_default_executor("threads")
+        self.addCleanup(set_default_executor, None)
+
+        result, ident = await graph(10.0)
+        self.assertEqual(11.0, result)
+        self.assertNotEqual(loop_thread, ident)
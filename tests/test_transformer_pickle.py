@@ -0,0 +1,95 @@
+import copy
+import pickle
+import unittest
+
+from gloe import partial_transformer, transformer
+from gloe.ensurer import ensure
+from tests.lib.transformers import (
+    async_plus1,
+    logarithm,
+    plus1,
+    repeat,
+    square,
+    sum_tuple2,
+)
+
+
+def plain_plus1(num: float) -> float:
+    return num + 1
+
+
+def plain_power(num: float, exponent: float) -> float:
+    return num**exponent
+
+
+rebound_plus1 = transformer(plain_plus1)
+rebound_power = partial_transformer(plain_power)
+
+
+class TestTransformerPickle(unittest.TestCase):
+    def test_pickle_decorated_transformer(self):
+        unpickled = pickle.loads(pickle.dumps(plus1))
+
+        self.assertIs(unpickled, plus1)
+        self.assertEqual(unpickled(1.0), 2.0)
+
+    def test_pickle_partial_transformer(self):
+        log2 = logarithm(base=2)
+        unpickled = pickle.loads(pickle.dumps(log2))
+
+        self.assertEqual(unpickled(8), 3.0)
+        self.assertEqual(unpickled.instance_id, log2.instance_id)
+
+        repeat_twice = pickle.loads(pickle.dumps(repeat(2, linebreak=False)))
+        self.assertEqual(repeat_twice("ab"), "abab")
+
+    def test_pickle_async_transformer(self):
+        unpickled = pickle.loads(pickle.dumps(async_plus1))
+
+        self.assertIs(unpickled, async_plus1)
+
+    def test_pickle_flow_keeps_instance_ids(self):
+        graph = square >> plus1 >> (plus1, square) >> sum_tuple2
+        unpickled_flow = pickle.loads(pickle.dumps(graph._flow[:2]))
+
+        self.assertListEqual(
+            [node.instance_id for node in graph._flow[:2]],
+            [node.instance_id for node in unpickled_flow],
+        )
+
+    def test_pickle_local_transformer(self):
+        @transformer
+        def local_plus1(num: float) -> float:
+            return num + 1
+
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(local_plus1)
+
+    def test_pickle_ensured_copy(self):
+        def is_positive(num: float):
+            assert num > 0
+
+        ensured = ensure(incoming=[is_positive])(plus1)
+
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(ensured)
+
+    def test_pickle_transformer_not_bound_to_its_name(self):
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(rebound_plus1)
+
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(rebound_power(2))
+
+    def test_deepcopy_is_not_pickled_by_reference(self):
+        @transformer
+        def local_plus1(num: float) -> float:
+            return num + 1
+
+        copied_local = copy.deepcopy(local_plus1)
+        self.assertIsNot(copied_local, local_plus1)
+        self.assertEqual(copied_local(1.0), 2.0)
+
+        copied = copy.deepcopy(plus1 >> square)
+        self.assertEqual(copied(1.0), 4.0)
+        self.assertIsNot(copy.deepcopy(plus1), plus1)
@@ -46,6 +46,19 @@ class TestTypeMatching(unittest.TestCase):
 
         self.assertDictEqual(_match_types(tuple[int, str], tuple[int]), {})
 
+    def test_cached_matches(self):
+        generic = Union[A, int]
+        matched_types = _match_types(generic, Union[str, int])
+        matched_types[B] = float
+
+        self.assertDictEqual(_match_types(generic, Union[str, int]), {A: str})
+        self.assertDictEqual(_match_types(Union[int, A], Union[int, float]), {A: float})
+
+        generic_list = list[A]
+        specified = _specify_types(generic_list, {A: str})
+        self.assertIs(_specify_types(generic_list, {A: str}), specified)
+        self.assertEqualTypes(_specify_types(generic_list, {A: int}), list[int])
+
     def test_format(self):
         _format = _format_return_annotation
         self.assertEqual(_format(float), "float")
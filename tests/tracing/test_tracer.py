@@ -0,0 +1,200 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from gloe import async_transformer, transformer
+from gloe.collection import Map
+from gloe.interceptors import _interceptor
+from gloe.tracing import Tracer
+from tests.lib.transformers import minus1, plus1, square, sum_tuple2
+
+
+@transformer
+def listify(num: float) -> list[float]:
+    return [num, num + 1]
+
+
+@transformer
+def add(num1: float, num2: float) -> float:
+    return num1 + num2
+
+
+@async_transformer
+async def async_add(num1: float, num2: float) -> float:
+    return num1 + num2
+
+
+@transformer
+def fail(num: float) -> float:
+    raise ValueError(num)
+
+
+@async_transformer
+async def slow_plus1(num: float) -> float:
+    await asyncio.sleep(0.05)
+    return num + 1
+
+
+@async_transformer
+async def slow_minus1(num: float) -> float:
+    await asyncio.sleep(0.05)
+    return num - 1
+
+
+class TestTracer(unittest.TestCase):
+    def test_spans_hierarchy(self):
+        graph = plus1 >> (square, minus1) >> sum_tuple2
+
+        with Tracer() as tracer:
+            self.assertEqual(5, graph(1))
+
+        self.assertIsNone(_interceptor._pipeline_chain)
+
+        spans = {span.name: span for span in tracer.spans}
+        root = spans["plus1 >> ... >> sum_tuple2"]
+        self.assertEqual("pipeline", root.kind)
+        self.assertIsNone(root.parent_id)
+
+        gateway = tracer.spans[2]
+        self.assertEqual(root.span_id, spans["plus1"].parent_id)
+        self.assertEqual(root.span_id, gateway.parent_id)
+        self.assertEqual(gateway.span_id, spans["square"].parent_id)
+        self.assertEqual(gateway.span_id, spans["minus1"].parent_id)
+        self.assertEqual(root.span_id, spans["sum_tuple2"].parent_id)
+        for span in tracer.spans:
+            self.assertGreaterEqual(span.end, span.start)
+            self.assertIsNone(span.error)
+
+    def test_nested_pipelines(self):
+        graph = listify >> Map(plus1 >> square)
+
+        with Tracer() as tracer:
+            graph(1)
+
+        nested = [span for span in tracer.spans if span.name == "plus1 >> square"]
+        self.assertEqual(2, len(nested))
+        map_span = next(span for span in tracer.spans if span.name == "Map")
+        for span in nested:
+            self.assertEqual(map_span.span_id, span.parent_id)
+
+    def test_multi_args_pipeline(self):
+        with Tracer() as tracer:
+            self.assertEqual(4, (add >> plus1)(1, 2))
+
+        spans = {span.name: span for span in tracer.spans}
+        root = spans["add >> plus1"]
+        self.assertEqual("pipeline", root.kind)
+        self.assertEqual(root.span_id, spans["add"].parent_id)
+        self.assertEqual(root.span_id, spans["plus1"].parent_id)
+
+    def test_run_options(self):
+        graph = plus1 >> square
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        with Tracer() as tracer:
+            graph.run(1)
+            graph.run(1, incremental_dir=os.path.join(directory.name, "incremental"))
+            graph.run(1, checkpoint_dir=os.path.join(directory.name, "checkpoints"))
+
+        roots = [span for span in tracer.spans if span.parent_id is None]
+        self.assertListEqual(["pipeline"] * 3, [root.kind for root in roots])
+        self.assertListEqual(["plus1 >> square"] * 3, [root.name for root in roots])
+        root_ids = {root.span_id for root in roots}
+        for span in tracer.spans:
+            if span.kind == "node":
+                self.assertIn(span.parent_id, root_ids)
+
+    def test_error_status(self):
+        with Tracer() as tracer:
+            with self.assertRaises(ValueError):
+                (plus1 >> fail)(1)
+
+        spans = {span.name: span for span in tracer.spans}
+        self.assertEqual("ValueError(2)", spans["fail"].error)
+        self.assertIsNotNone(spans["plus1 >> fail"].error)
+        self.assertIsNone(spans["plus1"].error)
+
+    def test_chrome_trace_export(self):
+        with Tracer() as tracer:
+            (plus1 >> square)(1)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "trace.json")
+        tracer.export(path)
+
+        with open(path) as file:
+            trace = json.load(file)
+
+        complete_events = [
+            event for event in trace["traceEvents"] if event["ph"] == "X"
+        ]
+        self.assertListEqual(
+            ["plus1 >> square", "plus1", "square"],
+            [event["name"] for event in complete_events],
+        )
+        self.assertEqual(0, complete_events[0]["ts"])
+
+        tracer.clear()
+        self.assertListEqual([], tracer.spans)
+
+
+class TestAsyncTracer(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_branches(self):
+        graph = plus1 >> (slow_plus1, slow_minus1)
+
+        with Tracer() as tracer:
+            self.assertEqual((3, 1), await graph(1))
+
+        spans = {span.name: span for span in tracer.spans}
+        gateway = tracer.spans[2]
+        branch1, branch2 = spans["slow_plus1"], spans["slow_minus1"]
+        self.assertEqual(gateway.span_id, branch1.parent_id)
+        self.assertEqual(gateway.span_id, branch2.parent_id)
+
+        # the branches run concurrently, in different tasks
+        self.assertNotEqual(branch1.task_id, branch2.task_id)
+        self.assertLess(branch1.start, branch2.end)
+        self.assertLess(branch2.start, branch1.end)
+
+        trace = tracer.to_chrome_trace()
+        tids = {
+            event["name"]: event["tid"]
+            for event in trace["traceEvents"]
+            if event["ph"] == "X"
+        }
+        self.assertNotEqual(tids["slow_plus1"], tids["slow_minus1"])
+
+    async def test_run_options(self):
+        graph = plus1 >> slow_plus1
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        with Tracer() as tracer:
+            await graph.run(1)
+            await graph.run(
+                1, incremental_dir=os.path.join(directory.name, "incremental")
+            )
+            await graph.run(
+                1, checkpoint_dir=os.path.join(directory.name, "checkpoints")
+            )
+
+        roots = [span for span in tracer.spans if span.parent_id is None]
+        self.assertListEqual(["pipeline"] * 3, [root.kind for root in roots])
+        root_ids = {root.span_id for root in roots}
+        for span in tracer.spans:
+            if span.kind == "node":
+                self.assertIn(span.parent_id, root_ids)
+
+    async def test_multi_args_pipeline(self):
+        with Tracer() as tracer:
+            self.assertEqual(4, await (async_add >> plus1)(1, 2))
+
+        spans = {span.name: span for span in tracer.spans}
+        root = spans["async_add >> plus1"]
+        self.assertEqual("pipeline", root.kind)
+        self.assertEqual(root.span_id, spans["async_add"].parent_id)
+        self.assertEqual(root.span_id, spans["plus1"].parent_id)